@@ -0,0 +1,78 @@
+"""
+    Summary:
+        Report the memory held by a loaded synthetic .dat model.
+
+        Reports the total memory held by the loaded DatCollection along with
+        the number of HeadDataItem's and data objects that it contains, so
+        that changes to the layout of those classes can be compared.
+
+        Usage:
+            python -m benchmarks.memorybenchmark [sections] [rows]
+
+    Author:
+        SHIP contributors
+
+    Created:
+        16 Oct 2026
+
+    Copyright:
+        SHIP contributors 2026
+
+    TODO:
+
+    Updates:
+
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import sys
+import gc
+import tracemalloc
+
+from ship.fmp.headdata import HeadDataItem
+from ship.utils.fileloaders.datloader import DatLoader
+from benchmarks import synthetic
+
+
+def countObjects(dat):
+    """Count the HeadDataItem's and data objects in the loaded model.
+
+    Return:
+        tuple - (number of HeadDataItem's, number of ADataRowObject's).
+    """
+    head_items = 0
+    data_objects = 0
+    for unit in dat.units:
+        for item in unit.head_data.values():
+            if isinstance(item, HeadDataItem):
+                head_items += 1
+        for collection in unit.row_data.values():
+            data_objects += len(collection._collection)
+    return head_items, data_objects
+
+
+def main(sections=2000, rows=60):
+    path = synthetic.writeDat(sections=sections, rows=rows)
+    try:
+        print('Synthetic model: %d sections x %d rows' % (sections, rows))
+        gc.collect()
+        tracemalloc.start()
+        taken, dat = synthetic.timed(DatLoader().loadFile, path, {})
+        gc.collect()
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        head_items, data_objects = countObjects(dat)
+        print('load:           {:>8.3f}s'.format(taken))
+        print('held:           {:>8.1f}MB'.format(held / (1024.0 * 1024.0)))
+        print('per unit:       {:>8.1f}KB'.format(held / 1024.0 / len(dat.units)))
+        print('HeadDataItems:  {:>8d}'.format(head_items))
+        print('data objects:   {:>8d}'.format(data_objects))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
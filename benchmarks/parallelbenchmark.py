@@ -0,0 +1,71 @@
+"""
+    Summary:
+        Compare loading and writing a large synthetic .dat file with
+        different numbers of worker processes.
+
+        Reports the time taken to load the model using the 'workers' option
+        of DatLoader, and to write it with DatCollection.write(workers=...),
+        for 1, 2, 4, ... up to the number of CPUs. The written files are
+        checked against the one written in a single process.
+
+        Usage:
+            python -m benchmarks.parallelbenchmark [sections] [rows]
+
+    Author:
+        SHIP contributors
+
+    Created:
+        16 Oct 2026
+
+    Copyright:
+        SHIP contributors 2026
+
+    TODO:
+
+    Updates:
+
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import sys
+import filecmp
+import tempfile
+import multiprocessing
+
+from ship.utils.fileloaders.datloader import DatLoader
+from benchmarks import synthetic
+
+
+def main(sections=2000, rows=60):
+    path = synthetic.writeDat(sections=sections, rows=rows)
+    folder = tempfile.mkdtemp()
+    try:
+        print('Synthetic model: %d sections x %d rows' % (sections, rows))
+        cpus = multiprocessing.cpu_count()
+        workers = 1
+        base = None
+        first = None
+        while workers <= cpus:
+            arg_dict = {'workers': workers} if workers > 1 else {}
+            taken, dat = synthetic.timed(DatLoader().loadFile, path, arg_dict)
+            out_path = os.path.join(folder, 'workers%d.dat' % workers)
+            written, _ = synthetic.timed(dat.write, out_path, workers=workers)
+            if base is None:
+                base = (taken, written)
+                first = out_path
+            print('workers: {:>3}  load: {:>8.3f}s  speedup: {:>5.2f}  '
+                  'write: {:>8.3f}s  speedup: {:>5.2f}  identical: {}'.format(
+                      workers, taken, base[0] / taken, written, base[1] / written,
+                      filecmp.cmp(first, out_path, shallow=False))
+            )
+            workers *= 2
+    finally:
+        os.remove(path)
+        for f in os.listdir(folder):
+            os.remove(os.path.join(folder, f))
+        os.rmdir(folder)
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,72 @@
+"""
+    Summary:
+        Compare the LIST and ARRAY data object storage when loading a large
+        synthetic .dat file.
+
+        Reports the time taken to load the model and the memory held by the
+        loaded DatCollection for each of the storage types.
+
+        Usage:
+            python -m benchmarks.storagebenchmark [sections] [rows]
+
+    Author:
+        SHIP contributors
+
+    Created:
+        16 Oct 2026
+
+    Copyright:
+        SHIP contributors 2026
+
+    TODO:
+
+    Updates:
+
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import sys
+import gc
+import tracemalloc
+
+from ship.datastructures import STORAGE_TYPES as st
+from ship.utils.fileloaders.datloader import DatLoader
+from benchmarks import synthetic
+
+
+def loadWithStorage(path, storage):
+    """Load the .dat at path using the given storage type.
+
+    Return:
+        tuple - (load time in seconds, bytes held by the loaded model).
+    """
+    gc.collect()
+    tracemalloc.start()
+    taken, dat = synthetic.timed(DatLoader().loadFile, path, {'storage': storage})
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del dat
+    return taken, held
+
+
+def main(sections=2000, rows=60):
+    path = synthetic.writeDat(sections=sections, rows=rows)
+    try:
+        print('Synthetic model: %d sections x %d rows' % (sections, rows))
+        results = {}
+        for name, storage in (('list', st.LIST), ('array', st.ARRAY)):
+            taken, held = loadWithStorage(path, storage)
+            results[name] = held
+            print('{:<6} load: {:>8.3f}s  held: {:>8.1f}MB'.format(
+                name, taken, held / (1024.0 * 1024.0))
+            )
+        print('array/list memory: {:.2f}'.format(results['array'] / float(results['list'])))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
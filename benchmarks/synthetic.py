@@ -0,0 +1,132 @@
+"""
+    Summary:
+        Helpers for creating synthetic FMP models for the benchmark scripts.
+
+        The models contain a single long reach of river sections along with
+        the header, initial conditions and GISINFO units, so they exercise the
+        same load and write paths as a real model.
+
+    Author:
+        SHIP contributors
+
+    Created:
+        16 Oct 2026
+
+    Copyright:
+        SHIP contributors 2026
+
+    TODO:
+
+    Updates:
+
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import time
+import tempfile
+
+
+def sectionName(i):
+    """The node label used for the i'th synthetic river section."""
+    return 'RIV_%06d' % i
+
+
+def riverLines(i, rows):
+    """Build the .dat file lines for a single synthetic river section.
+
+    Args:
+        i(int): the number of the section in the reach.
+        rows(int): the number of geometry rows to give the section.
+
+    Return:
+        list - of the lines for the section.
+    """
+    out = [
+        'RIVER synthetic section %d' % i,
+        'SECTION',
+        sectionName(i),
+        '{:>10}{:>20}{:>10}'.format('%0.3f' % 50.0, '%0.4f' % 0.0001, '%0.2f' % 1000.0),
+        '{:>10}'.format(rows),
+    ]
+    for r in range(rows):
+        bank = ''
+        if r == 0:
+            bank = 'LEFT'
+        elif r == rows - 1:
+            bank = 'RIGHT'
+        elif r == rows // 2:
+            bank = 'BED'
+        elev = 10.0 + abs(r - rows / 2.0) * 0.25
+        out.append(''.join([
+            '{:>10}'.format('%0.3f' % (r * 1.5)),
+            '{:>10}'.format('%0.3f' % elev),
+            '{:>10}'.format('%0.3f' % 0.035),
+            '{:<5}'.format('*' if r == 0 else ''),
+            '{:>5}'.format('%0.3f' % 1.0),
+            '{:<10}'.format(bank),
+            '{:>10}'.format('%0.2f' % (291000.0 + i + r * 0.5)),
+            '{:>10}'.format('%0.2f' % (86000.0 + i)),
+            '{:<10}'.format(''),
+        ]))
+    return out
+
+
+def datLines(sections=2000, rows=60):
+    """Build the lines of a synthetic .dat file.
+
+    Args:
+        sections=2000(int): the number of river sections to include.
+        rows=60(int): the number of geometry rows in each section.
+
+    Return:
+        list - of the lines in the file.
+    """
+    out = [
+        '',
+        '#REVISION#1',
+        '{:>10}     0.750     0.900     0.100     0.001        12'.format(sections),
+        '    10.000     0.010     0.010     0.700     0.100     0.700     0.000',
+        'RAD FILE',
+        '',
+        'END GENERAL',
+    ]
+    for i in range(sections):
+        out.extend(riverLines(i, rows))
+
+    out.append('INITIAL CONDITIONS')
+    out.append(' label   ?      flow     stage froude no  velocity     umode    ustate         z')
+    for i in range(sections):
+        out.append('{:<12}'.format(sectionName(i)) + ' y     1.000    10.000     0.000     0.000     0.000     0.000    10.000')
+
+    out.append('GISINFO')
+    for i in range(sections):
+        out.append('RIVER SECTION %s 0 0 0 0 0' % sectionName(i))
+    return out
+
+
+def writeDat(path=None, sections=2000, rows=60):
+    """Write a synthetic .dat file to disk.
+
+    Args:
+        path=None(str): the file path to write to. If None a new file will
+            be created in the system temp directory.
+        sections=2000(int): the number of river sections to include.
+        rows=60(int): the number of geometry rows in each section.
+
+    Return:
+        str - the path of the file that was written.
+    """
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix='.dat', prefix='ship_bench_')
+        os.close(fd)
+    with open(path, 'w') as f:
+        f.write('\n'.join(datLines(sections, rows)) + '\n')
+    return path
+
+
+def timed(func, *args, **kwargs):
+    """Call func and return a tuple of (seconds taken, func return value)."""
+    start = time.time()
+    result = func(*args, **kwargs)
+    return time.time() - start, result
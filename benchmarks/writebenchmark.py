@@ -0,0 +1,90 @@
+"""
+    Summary:
+        Compare the speed and memory use of writing a synthetic .dat model.
+
+        Writes the same loaded model with the old approach, of building the
+        full list of lines with getPrintableContents() and passing it to
+        filetools.writeFile(), and with the streaming DatCollection.write().
+        Reports the write throughput and the peak memory allocated by
+        Python while writing, and checks that the files are identical.
+
+        Usage:
+            python -m benchmarks.writebenchmark [sections] [rows]
+
+    Author:
+        SHIP contributors
+
+    Created:
+        16 Oct 2026
+
+    Copyright:
+        SHIP contributors 2026
+
+    TODO:
+
+    Updates:
+
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import sys
+import gc
+import filecmp
+import tempfile
+import tracemalloc
+
+from ship.utils import filetools as ft
+from ship.utils.fileloaders.datloader import DatLoader
+from benchmarks import synthetic
+
+
+def listWrite(dat, path):
+    """Write dat the way it was written before DatCollection.write() streamed."""
+    ft.writeFile(dat.getPrintableContents(), path)
+
+
+def streamWrite(dat, path):
+    dat.write(path, overwrite=True)
+
+
+def measure(func, dat, path):
+    """Run a write function and measure it.
+
+    Return:
+        tuple - (seconds taken, peak MB allocated while writing).
+    """
+    gc.collect()
+    tracemalloc.start()
+    taken, _ = synthetic.timed(func, dat, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return taken, peak / (1024.0 * 1024.0)
+
+
+def main(sections=2000, rows=60):
+    path = synthetic.writeDat(sections=sections, rows=rows)
+    folder = tempfile.mkdtemp()
+    try:
+        print('Synthetic model: %d sections x %d rows' % (sections, rows))
+        dat = DatLoader().loadFile(path, {})
+        outputs = []
+        for name, func in [('list', listWrite), ('stream', streamWrite)]:
+            out_path = os.path.join(folder, name + '.dat')
+            taken, peak = measure(func, dat, out_path)
+            size = os.path.getsize(out_path) / (1024.0 * 1024.0)
+            print('{:<8} write: {:>8.3f}s  {:>7.1f}MB/s  peak: {:>8.1f}MB'.format(
+                name, taken, size / taken, peak)
+            )
+            outputs.append(out_path)
+        print('identical: %s' % filecmp.cmp(outputs[0], outputs[1], shallow=False))
+    finally:
+        os.remove(path)
+        for f in os.listdir(folder):
+            os.remove(os.path.join(folder, f))
+        os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -163,6 +163,15 @@ def createModelExample():
     ]
     new_path3 = "C:/path/to/fmp/model3.dat"
     dat3 = DatCollection.initialisedDat(new_path3, units=units)
+    
+    '''
+    If you have a lot of units to add, e.g. from a GIS export, use addUnits
+    rather than calling addUnit for each one. It's much quicker. The ics can
+    be a single dict for all of the units or a list with one for each unit.
+    '''
+    more_units = [factory.createUnit('river', name='riv%d' % i) for i in range(6, 100)]
+    dat3.addUnits(more_units, index=dat3.index('htbdy', 'htbdy'),
+                  ics={rdt.FLOW: 3.0, rdt.STAGE: 5.0, rdt.ELEVATION: 4.5})
     dat3.write()
     
     
@@ -43,9 +43,11 @@ def crossSectionWidth():
     rivers = isis_model.unitsByCategory('river')
     for river in rivers:
         
-        # Get the width and deactivation values form the river section
-        xvals = river.row_data['main'].dataObjectAsList(rdt.CHAINAGE)
-        dvals = river.row_data['main'].dataObjectAsList(rdt.DEACTIVATION)
+        # Get the width and deactivation values form the river section.
+        # copy=False returns a read-only view of the values rather than
+        # copying them into a new list, which is quicker for big models
+        xvals = river.row_data['main'].dataObjectAsList(rdt.CHAINAGE, copy=False)
+        dvals = river.row_data['main'].dataObjectAsList(rdt.DEACTIVATION, copy=False)
         
         x_start = xvals[0]
         x_end = xvals[-1]
@@ -73,7 +75,7 @@ def crossSectionWidth():
     # Get the widths of the bridges too
     bridges = isis_model.unitsByCategory('bridge')
     for bridge in bridges:
-        xvals = bridge.row_data['main'].dataObjectAsList(rdt.CHAINAGE)
+        xvals = bridge.row_data['main'].dataObjectAsList(rdt.CHAINAGE, copy=False)
         
         full_width = math.fabs(xvals[-1] - xvals[0])
         
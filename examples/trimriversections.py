@@ -24,7 +24,7 @@ def trimRiverSections():
     for river in rivers:
         
         # Get the bankmarker locations as a list for this river section
-        bankmarkers = river.row_data['main'].dataObjectAsList(rdt.BANKMARKER)
+        bankmarkers = river.row_data['main'].dataObjectAsList(rdt.BANKMARKER, copy=False)
         
         # Get the DataObject for deactivation because we want to update it
         deactivation = river.row_data['main'].dataObject(rdt.DEACTIVATION)
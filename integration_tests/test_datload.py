@@ -2,9 +2,13 @@ from __future__ import unicode_literals
 
 import os
 import copy
+import shutil
+import tempfile
 
 from ship.utils.fileloaders import fileloader
+from ship.utils.fileloaders.datloader import DatLoader
 from ship.utils import filetools as ft
+from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 from integration_tests import utils
 
 
@@ -20,6 +24,13 @@ class DatLoadTests(object):
         self.test_unitCounts()
         self.test_icsSetup()
         self.test_datWrite()
+        self.test_datRoundTrip()
+        self.test_datStreaming(main_path)
+        self.test_datLazy(main_path)
+        self.test_datMapped(main_path)
+        self.test_datCache(main_path)
+        self.test_datRefresh(main_path)
+        self.test_datIncremental(main_path)
     
     def loadDatModel(self, path):
         print ('Loading FMP .dat model...')
@@ -99,6 +110,184 @@ class DatLoadTests(object):
         self.dat.write(outpath, overwrite=True)
         
         print ('Done')
-        
-        
-        
+
+    def test_datRoundTrip(self):
+        """Check that a written model is written out byte-identical when
+        it's loaded again.
+
+        Note:
+            Depends on test_datWrite() having written the model first.
+        """
+        print ('Test DatCollection write round trip...')
+        outdir = os.path.join(os.getcwd(), 'integration_tests', 'test_output',
+                              'asread', 'model1', 'fmp')
+        first_path = os.path.join(outdir, self.dat.path_holder.filenameAndExtension())
+        second_path = os.path.join(outdir, 'roundtrip_' + self.dat.path_holder.filenameAndExtension())
+
+        loader = fileloader.FileLoader()
+        reloaded = loader.loadFile(first_path)
+        reloaded.write(second_path, overwrite=True)
+
+        with open(first_path, 'rb') as f1:
+            with open(second_path, 'rb') as f2:
+                utils.softAssertion(f1.read(), f2.read())
+
+        print ('Done')
+
+    def test_datStreaming(self, path):
+        """Check that streaming the model gives the same units as loading it."""
+        print ('Test streaming DatCollection model...')
+        loaded = DatLoader().loadFile(path)
+        expected = loaded.getPrintableContents()
+
+        streamed = DatLoader().loadFile(path, {'stream': True})
+        utils.softAssertion(streamed.getPrintableContents(), expected)
+
+        units = list(DatLoader().iterUnits(path))
+        utils.softAssertion(len(units), len(loaded.units))
+        utils.softAssertion([u.unit_type for u in units], [u.unit_type for u in loaded.units])
+
+        print ('Done')
+
+    def test_datLazy(self, path):
+        """Check that lazy loaded units give the same rows once they're read."""
+        print ('Test lazy loading DatCollection model...')
+        expected = DatLoader().loadFile(path).getPrintableContents()
+
+        lazy = DatLoader().loadFile(path, {'lazy': True})
+        utils.softAssertion(len(lazy.getPrintableContents()), len(expected))
+
+        # Untouched units are written exactly as they are in the file
+        temp_dir = tempfile.mkdtemp()
+        try:
+            temp_path = os.path.join(temp_dir, 'lazy.dat')
+            lazy.write(temp_path)
+            with open(path, 'rb') as f1, open(temp_path, 'rb') as f2:
+                utils.softAssertion(f2.read(), f1.read().replace(b'\r\n', b'\n'))
+        finally:
+            shutil.rmtree(temp_dir)
+
+        for unit in lazy.units:
+            for rows in unit.row_data.values():
+                rows.toList()
+        utils.softAssertion(lazy.getPrintableContents(), expected)
+
+        parallel = DatLoader().loadFile(path, {'workers': 2})
+        utils.softAssertion(parallel.getPrintableContents(), expected)
+        utils.softAssertion(lazy.getPrintableContents(workers=2), expected)
+
+        print ('Done')
+
+    def test_datMapped(self, path):
+        """Check the memory mapped load and the unit index."""
+        print ('Test memory mapped DatCollection model...')
+        expected = DatLoader().loadFile(path, {'lazy': True})
+        mapped = DatLoader().loadFile(path, {'mmap': True})
+        utils.softAssertion(mapped.getPrintableContents(), expected.getPrintableContents())
+
+        index = DatLoader().indexFile(path)
+        utils.softAssertion(len(index), len(mapped.units))
+        for entry, unit in zip(index, mapped.units):
+            utils.softAssertion(entry.unit_type, unit.unit_type)
+            utils.softAssertion(mapped.unitAtOffset(entry.start), unit)
+            utils.softAssertion(mapped.unitAtOffset(entry.end - 1), unit)
+
+        river = mapped.unitsByType('river')[-1]
+        for i in (None, index):
+            unit = DatLoader().readUnit(path, river.name, 'river', index=i)
+            utils.softAssertion(unit.getData(), river.getData())
+
+        print ('Done')
+
+    def test_datCache(self, path):
+        """Check that a cached model is the same as the one that was loaded."""
+        print ('Test cached DatCollection model...')
+        cache_dir = tempfile.mkdtemp()
+        try:
+            loaded = DatLoader().loadFile(path, {'cache': cache_dir})
+            utils.softAssertion(len(os.listdir(cache_dir)), 1)
+            cached = DatLoader().loadFile(path, {'cache': cache_dir})
+            utils.softAssertion(cached is loaded, False)
+            utils.softAssertion(cached.getPrintableContents(), loaded.getPrintableContents())
+        finally:
+            shutil.rmtree(cache_dir)
+
+        print ('Done')
+
+    def test_datRefresh(self, path):
+        """Check that refresh() only reads the units that have changed."""
+        print ('Test refreshing DatCollection model...')
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # PathHolder lower cases the extension
+            temp_path = os.path.join(temp_dir, 'refresh.dat')
+            # Start from a file written by ship so only the edited unit changes
+            DatLoader().loadFile(path).write(temp_path)
+            dat = DatLoader().loadFile(temp_path, {'lazy': True})
+            before = list(dat.units)
+
+            changes = dat.refresh()
+            utils.softAssertion(changes, {'added': [], 'removed': []})
+            utils.softAssertion(all(a is b for a, b in zip(before, dat.units)), True)
+
+            # Change the elevation of the first geometry row of a river
+            river = dat.unitsByType('river')[1]
+            river.row_data['main'].updateRow({rdt.ELEVATION: 99.999}, 0)
+            dat.write(temp_path, overwrite=True)
+            river.row_data['main'].updateRow({rdt.ELEVATION: 11.111}, 0)
+
+            changes = dat.refresh()
+            utils.softAssertion(changes['removed'], [river])
+            utils.softAssertion(len(changes['added']), 1)
+            utils.softAssertion(changes['added'][0].name, river.name)
+            utils.softAssertion(changes['added'][0].row_data['main'].dataValue(rdt.ELEVATION, 0), 99.999)
+            kept = [u for u in dat.units if any(u is b for b in before)]
+            utils.softAssertion(len(kept), len(before) - 1)
+
+            loaded = DatLoader().loadFile(temp_path)
+            utils.softAssertion(dat.getPrintableContents(), loaded.getPrintableContents())
+        finally:
+            shutil.rmtree(temp_dir)
+
+        print ('Done')
+
+    def test_datIncremental(self, path):
+        """Check that incremental writes keep the text of unchanged units."""
+        print ('Test incremental DatCollection write...')
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with open(path, 'rb') as f:
+                original = f.read().replace(b'\r\n', b'\n')
+            temp_path = os.path.join(temp_dir, 'incremental.dat')
+
+            dat = DatLoader().loadFile(path, {'lazy': True})
+            utils.softAssertion([u for u in dat.units if u.has_changed], [])
+            dat.write(temp_path, incremental=True)
+            with open(temp_path, 'rb') as f:
+                utils.softAssertion(f.read(), original)
+
+            river = dat.unitsByType('river')[1]
+            river.row_data['main'].updateRow({rdt.ELEVATION: 99.999}, 0)
+            utils.softAssertion([u for u in dat.units if u.has_changed], [river])
+            dat.write(temp_path, overwrite=True, incremental=True)
+
+            start, end, digest = river._source
+            original = original.decode('utf-8').split('\n')
+            with open(temp_path, 'rb') as f:
+                written = f.read().decode('utf-8').split('\n')
+            river_lines = river.getData()
+            utils.softAssertion(written[:start], original[:start])
+            utils.softAssertion(written[start:start + len(river_lines)], river_lines)
+            utils.softAssertion(written[start + len(river_lines):], original[end:])
+
+            # Writing over the file it was loaded from
+            dat = DatLoader().loadFile(temp_path)
+            dat.unitsByType('river')[0].head_data['distance'].value = 12.5
+            expected = dat.getPrintableContents()
+            dat.write(temp_path, overwrite=True, incremental=True)
+            loaded = DatLoader().loadFile(temp_path)
+            utils.softAssertion(loaded.getPrintableContents(), expected)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        print ('Done')
@@ -2,3 +2,15 @@ from ship.utils import utilfunctions as uf
 
 """Enum for all row data keys used in Isis units"""
 DATA_TYPES = uf.enum('STRING', 'INT', 'FLOAT', 'CONSTANT', 'SYMBOL')
+
+"""Enum for the backing storage used by the ADataRowObject's.
+
+LIST stores values in a standard python list. ARRAY stores values in a
+compact typed array.array where the data object supports it (FloatData and
+IntData); all other data objects will use a list. CATEGORICAL stores small
+integer codes into a dictionary of values (see dataobject.CategoricalColumn).
+It's used by ConstantData and SymbolData, which share a dictionary between
+every data object of the same type, and StringData(categorical=True), which
+has one for each data object.
+"""
+STORAGE_TYPES = uf.enum('LIST', 'ARRAY', 'CATEGORICAL')
@@ -29,12 +29,373 @@
 from __future__ import unicode_literals
 
 
+import re
+import copy
 from abc import ABCMeta, abstractmethod
+from array import array
+try:
+    from collections.abc import Sequence, MutableSequence
+except ImportError:
+    from collections import Sequence, MutableSequence
+
+from ship.datastructures import STORAGE_TYPES as st
 
 import logging
 logger = logging.getLogger(__name__)
 """logging references with a __name__ set to this module."""
 
+_SIMPLE_FORMAT = re.compile(r'^\{:([<>^]?)(\d*)\}$')
+"""Matches format_str's that only set an alignment and width e.g. '{:>10}'."""
+
+
+default_storage = st.LIST
+"""The storage used by new data objects when none is given to the constructor.
+
+See Also:
+    setDefaultStorage()
+"""
+
+
+def setDefaultStorage(storage):
+    """Set the storage used by data objects created without a 'storage' kwarg.
+
+    This is mainly useful when loading a model, where the data objects are
+    created by the units and there is no way to pass the storage type to them.
+
+    Args:
+        storage(int): one of the datastructures.STORAGE_TYPES.
+
+    Raises:
+        ValueError: if storage is not a valid STORAGE_TYPES value.
+    """
+    global default_storage
+    if not storage in (st.LIST, st.ARRAY):
+        raise ValueError('storage %s is not a valid STORAGE_TYPES value' % storage)
+    default_storage = storage
+
+
+_shared_categories = {}
+"""Categories objects shared by CategoricalColumn's, see sharedCategories().
+
+Only used by data objects that can hold a fixed set of values, so they
+never grow past the number of legal values.
+"""
+
+_CODE_TYPES = ((str('B'), 0xFF), (str('H'), 0xFFFF), (str('L'), 0xFFFFFFFF))
+"""array.array typecodes used for category codes and the max code they hold."""
+_CODE_MAX = dict(_CODE_TYPES)
+
+
+def sharedCategories(key, legal_values=()):
+    """Get the Categories shared by every column with the same key.
+
+    The shared Categories are kept for the life of the process, so this
+    should only be used for columns that can only hold a fixed set of
+    values, like ConstantData.
+
+    Args:
+        key(tuple): identifies the type of column, e.g. the class name and
+            data_type of the data object.
+        legal_values=()(tuple): values to add to a new Categories first.
+
+    Returns:
+        Categories - the shared instance for key.
+    """
+    try:
+        return _shared_categories[key]
+    except KeyError:
+        categories = _shared_categories[key] = Categories(legal_values, shared=True)
+        return categories
+
+
+class Categories(object):
+    """Dictionary of the distinct values held by CategoricalColumn's.
+
+    Each distinct value is given an integer code the first time that it's
+    seen. The codes are never reused or removed, so they can be shared by any
+    number of columns.
+
+    Codes are looked up in a separate dict for each type of value so that
+    values that compare equal, like False, 0 and 0.0, are kept apart.
+
+    Attributes:
+        shared(bool): True if the Categories is used by all the columns of
+            one type (see sharedCategories()). Otherwise it belongs to a
+            single column and is copied with it.
+    """
+
+    __slots__ = ('values', 'codes', 'shared')
+
+    def __init__(self, legal_values=(), shared=False):
+        """Constructor.
+
+        Args:
+            legal_values=()(tuple): values to add straight away. These will
+                be given the codes 0 to len(legal_values) - 1.
+            shared=False(bool): see the shared attribute.
+        """
+        self.values = []
+        self.codes = {}
+        self.shared = shared
+        for v in legal_values:
+            self.code(v)
+
+    def __copy__(self):
+        new = Categories(shared=self.shared)
+        new.values = list(self.values)
+        new.codes = dict((k, dict(v)) for k, v in self.codes.items())
+        return new
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value):
+        """Get the code for value, adding it if it's not been seen before.
+
+        Raises:
+            TypeError: if value can't be hashed.
+        """
+        table = self.codes.setdefault(value.__class__, {})
+        try:
+            return table[value]
+        except KeyError:
+            code = table[value] = len(self.values)
+            self.values.append(value)
+            return code
+
+    def lookup(self, value):
+        """Get the code for value, or None if it's not been seen before."""
+        try:
+            return self.codes.get(value.__class__, {}).get(value, None)
+        except TypeError:
+            return None
+
+
+class CategoricalColumn(MutableSequence):
+    """List-like store of values held as codes into a shared Categories.
+
+    Used as the data_collection of data objects that only hold a few
+    distinct values, such as bank markers, so that each value only takes a
+    byte or two rather than a pointer. It behaves like a list of the values.
+
+    Codes are held in an array.array that is widened automatically if the
+    Categories grows too big for it.
+    """
+
+    __slots__ = ('categories', 'codes')
+
+    def __init__(self, categories, values=()):
+        """Constructor.
+
+        Args:
+            categories(Categories): the shared dictionary of values.
+            values=()(list): values to add to the column.
+        """
+        self.categories = categories
+        self.codes = array(_CODE_TYPES[0][0])
+        if values:
+            self.extend(values)
+
+    def _widen(self, code):
+        """Make sure the code array can hold code."""
+        if code > _CODE_MAX[self.codes.typecode]:
+            for typecode, max_code in _CODE_TYPES:
+                if code <= max_code:
+                    self.codes = array(typecode, self.codes)
+                    break
+
+    def _code(self, value):
+        """Get the code for value, widening the code array if needed."""
+        code = self.categories.code(value)
+        self._widen(code)
+        return code
+
+    def _codesFor(self, values):
+        """Get a list of the codes for values, widening the code array if needed.
+
+        Values in a column are nearly always the same type and already in the
+        Categories, so that case is done with map() rather than a loop.
+        """
+        if not values:
+            return []
+        categories = self.categories
+        codes = None
+        classes = set(map(type, values))
+        if len(classes) == 1:
+            table = categories.codes.get(classes.pop())
+            if table is not None:
+                codes = list(map(table.get, values))
+                if None in codes:
+                    codes = None
+        if codes is None:
+            codes = [categories.code(v) for v in values]
+        self._widen(max(codes))
+        return codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        values = self.categories.values
+        if isinstance(index, slice):
+            return list(map(values.__getitem__, self.codes[index]))
+        return values[self.codes[index]]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            codes = self._codesFor(list(value))
+            self.codes[index] = array(self.codes.typecode, codes)
+        else:
+            code = self._code(value)
+            self.codes[index] = code
+
+    def __delitem__(self, index):
+        del self.codes[index]
+
+    def __iter__(self):
+        return iter(map(self.categories.values.__getitem__, self.codes))
+
+    def __contains__(self, value):
+        code = self.categories.lookup(value)
+        return code is not None and code in self.codes
+
+    def __eq__(self, other):
+        if isinstance(other, CategoricalColumn) and other.categories is self.categories:
+            return self.codes == other.codes
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'CategoricalColumn(%r)' % self.tolist()
+
+    def __copy__(self):
+        categories = self.categories
+        if not categories.shared:
+            categories = copy.copy(categories)
+        new = CategoricalColumn(categories)
+        new.codes = array(self.codes.typecode, self.codes)
+        return new
+
+    def __deepcopy__(self, memo):
+        # Shared Categories never shrink, so only the codes need copying
+        return self.__copy__()
+
+    def insert(self, index, value):
+        code = self._code(value)
+        self.codes.insert(index, code)
+
+    def append(self, value):
+        code = self._code(value)
+        self.codes.append(code)
+
+    def extend(self, values):
+        codes = self._codesFor(list(values))
+        self.codes.extend(array(self.codes.typecode, codes))
+
+    def index(self, value, *args):
+        code = self.categories.lookup(value)
+        if code is None:
+            raise ValueError('%r is not in column' % (value,))
+        return self.codes.index(code, *args)
+
+    def count(self, value):
+        code = self.categories.lookup(value)
+        if code is None:
+            return 0
+        return self.codes.count(code)
+
+    def indicesOf(self, value):
+        """Get the indexes of all the entries equal to value.
+
+        Only the codes are compared, so this is much quicker than comparing
+        the values. Note that value must be the same type as the stored
+        values, i.e. 0 will not match False.
+
+        Returns:
+            list - of int indexes.
+        """
+        code = self.categories.lookup(value)
+        if code is None:
+            return []
+        return [i for i, c in enumerate(self.codes) if c == code]
+
+    def tolist(self):
+        """Get the values as a new list."""
+        return list(map(self.categories.values.__getitem__, self.codes))
+
+
+class ColumnView(Sequence):
+    """Read-only view of the values in an ADataRowObject.
+
+    Gives access to the values without copying them. The view is live, so
+    any changes made to the data object will show up in it. Slicing a view
+    returns a new list containing the values in the slice.
+
+    It doesn't hold on to the data object's data_collection directly
+    because it can be replaced (e.g. when array storage is converted to a
+    list), so it's always up to date.
+
+    Use list(view) if you need a copy that won't change.
+    """
+
+    __slots__ = ('_data_obj',)
+
+    def __init__(self, data_obj):
+        """Constructor.
+
+        Args:
+            data_obj(ADataRowObject): the data object to view.
+        """
+        self._data_obj = data_obj
+
+    @property
+    def data_type(self):
+        return self._data_obj.data_type
+
+    def __len__(self):
+        return len(self._data_obj.data_collection)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._data_obj.data_collection[index])
+        return self._data_obj.data_collection[index]
+
+    def __iter__(self):
+        return iter(self._data_obj.data_collection)
+
+    def __contains__(self, value):
+        return value in self._data_obj.data_collection
+
+    def index(self, value, *args):
+        return self._data_obj.data_collection.index(value, *args)
+
+    def count(self, value):
+        return self._data_obj.data_collection.count(value)
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnView):
+            other = other._data_obj.data_collection
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'ColumnView(%r)' % list(self._data_obj.data_collection)
+
 
 class ADataRowObject(object):
     """Abstract class for all data objects used in an AUnit class.
@@ -47,6 +408,19 @@ class ADataRowObject(object):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = (
+        'data_type', 'format_str', 'default', 'update_callback',
+        'column_callback', 'defer_update', 'has_changed', 'storage',
+        'data_collection', '_formatter', '_min', '_max', '_current',
+    )
+    """There can be a lot of these in a model so use slots, not a __dict__."""
+
+    typecode = None
+    """array.array typecode used when storage == ARRAY. None if unsupported."""
+
+    max_categories = None
+    """Max size of the Categories before CATEGORICAL storage is dropped."""
+
 
 #     def __init__(self, row_pos, datatype, format_str, default):
     def __init__(self, datatype, format_str, **kwargs):
@@ -69,19 +443,118 @@ class ADataRowObject(object):
                     that chainage is increasing.
                     When called it will provide the following arguments:
                     (self, value, index).
+                column_callback: a callback function that should be run once
+                    after a block of values has been added with
+                    extendValues(). If given it is used in place of calling
+                    update_callback for every value in the block.
+                    When called it will provide the following arguments:
+                    (self, start_index) where start_index is the index of
+                    the first value that was added.
+                    While defer_update is True neither of the callbacks is
+                    called. See RowDataCollection.deferValidation().
+                storage: one of the datastructures.STORAGE_TYPES. If ARRAY
+                    is given and the subclass has a typecode the values will
+                    be stored in a compact array.array. If CATEGORICAL is
+                    given and the subclass supports it the values will be
+                    stored in a CategoricalColumn. If not given the subclass
+                    default is used, which is usually the module
+                    default_storage.
         """
         self.data_type = datatype
         self.format_str = format_str
         self.default = kwargs.get('default', None)
         self.update_callback = kwargs.get('update_callback', None)
+        self.column_callback = kwargs.get('column_callback', None)
+        self.defer_update = False
         self.has_changed = False
+        self._formatter = None
 
-        self.data_collection = []
+        self.storage = kwargs.get('storage', None)
+        if self.storage is None:
+            self.storage = self._defaultStorage(**kwargs)
+        self.data_collection = None
+        if self.storage == st.ARRAY and self.typecode is not None:
+            try:
+                self.data_collection = array(self.typecode)
+            except ValueError:
+                # Typecode not supported by this version of Python
+                logger.warning('array typecode %s not supported, using list storage' % self.typecode)
+        elif self.storage == st.CATEGORICAL and self.categoriesKey() is not None:
+            self.data_collection = CategoricalColumn(self._newCategories())
+            self._checkCategories()
+        if self.data_collection is None:
+            self.storage = st.LIST
+            self.data_collection = []
 
         self._min = 0
         self._max = len(self.data_collection)
         self._current = 0
 
+    def _defaultStorage(self, **kwargs):
+        """Get the storage to use when none is given to the constructor.
+
+        Args:
+            **kwargs: the kwargs given to the constructor.
+
+        Returns:
+            int - one of the datastructures.STORAGE_TYPES.
+        """
+        return default_storage
+
+    def categoriesKey(self):
+        """Get the key used to share a Categories between data objects.
+
+        Data objects that return the same key will share the same Categories
+        when using CATEGORICAL storage. Subclasses that don't support
+        CATEGORICAL storage return None.
+
+        Returns:
+            tuple - the key, or None.
+        """
+        return None
+
+    def _newCategories(self):
+        """Get the Categories for a new CategoricalColumn.
+
+        By default this is the Categories shared by every data object with
+        the same categoriesKey().
+        """
+        return sharedCategories(self.categoriesKey())
+
+    def indicesOf(self, value):
+        """Get the indexes of all the values equal to value.
+
+        If the data_collection is a CategoricalColumn this only needs to
+        compare the codes.
+
+        Args:
+            value: the value to find.
+
+        Returns:
+            list - of int indexes.
+        """
+        if self.storage == st.CATEGORICAL:
+            return self.data_collection.indicesOf(value)
+        return [i for i, v in enumerate(self.data_collection) if v == value]
+
+    def __getstate__(self):
+        """Get the slot values when copying or pickling.
+
+        The cached formatter is dropped. It's a closure, so it can't be
+        pickled, and a copied one would still refer back to this object.
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state['_formatter'] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     def record_length(self):
         return len(self.data_collection)
@@ -151,24 +624,90 @@ class ADataRowObject(object):
         """
         try:
             out_value = self.data_collection[index]
+        except IndexError:
+            logger.error('DataObject addValue() index out of bounds')
+            raise
 
-            if self.default == '~' and out_value == '':
-                out_value = ''
+        return self.printFormatter()(out_value)
 
-            elif out_value == '':
-                out_value = self.format_str.format('')
-                return out_value
+    def printFormatter(self):
+        """Get a function for formatting a value for printing to file.
 
-            elif self.format_str == None:
-                return str(out_value)
+        The function takes a single value and returns the same string that
+        getPrintableValue() would for it. Everything that doesn't depend on
+        the value, like the decimal format string, is worked out once when the
+        function is built. It's cached and only rebuilt if any of the values
+        returned by formatSpec() change.
 
-            else:
-                out_value = self.formatPrintString(out_value)
-        except IndexError:
-            logger.error('DataObject addValue() index out of bounds')
-            raise
+        Returns:
+            function - taking a value and returning the formatted str.
+        """
+        spec = self.formatSpec()
+        if self._formatter is None or self._formatter[0] != spec:
+            self._formatter = (spec, self._buildFormatter())
+        return self._formatter[1]
+
+    def formatSpec(self):
+        """Get the attributes that affect how values are printed.
+
+        Subclasses with extra formatting attributes should extend this so
+        that printFormatter() knows when to rebuild its function.
+
+        Returns:
+            tuple - of the formatting attribute values.
+        """
+        return (self.format_str, self.default)
+
+    def _buildFormatter(self):
+        """Build the function returned by printFormatter().
+
+        This is the general version that follows the same steps as
+        getPrintableValue() used to. Subclasses override it with quicker
+        versions for their common cases.
+
+        Returns:
+            function - taking a value and returning the formatted str.
+        """
+        format_str = self.format_str
+        default_blank = self.default == '~'
+        formatPrintString = self.formatPrintString
+
+        def formatter(value):
+            if value == '':
+                if default_blank:
+                    return ''
+                return format_str.format('')
+            elif format_str == None:
+                return str(value)
+            return formatPrintString(value)
+
+        return formatter
+
+    def _buildCachedFormatter(self):
+        """Build a formatter that remembers the output for each value.
+
+        Useful for data objects that only hold a few different values, like
+        ConstantData and SymbolData. The values are cached by type as well
+        as value so that, for example, 1 and True are kept separate.
+
+        Returns:
+            function - taking a value and returning the formatted str.
+        """
+        formatter = ADataRowObject._buildFormatter(self)
+        cache = {}
+
+        def cachedFormatter(value):
+            key = (value.__class__, value)
+            try:
+                return cache[key]
+            except KeyError:
+                out = cache[key] = formatter(value)
+                return out
+            except TypeError:
+                # Unhashable value
+                return formatter(value)
 
-        return out_value
+        return cachedFormatter
 
     def addValue(self, value=None, index=None):
         """Adds a value to the data_collection.
@@ -185,20 +724,19 @@ class ADataRowObject(object):
         Raises:
             IndexError: If index does not exist.
         """
-        if value == None:
-            value = self.default
+        value = self._convertValue(value)
 
-        if self.update_callback is not None:
+        if self.update_callback is not None and not self.defer_update:
             self.update_callback(self, value, index)
 
         length = len(self.data_collection)
         if index == None or index == length:
-            self.data_collection.append(value)
+            self._store(self.data_collection.append, value)
         elif index > length:
             raise IndexError
         else:
             try:
-                self.data_collection.insert(index, value)
+                self._store(self.data_collection.insert, index, value)
             except IndexError:
                 logger.error('DataObject addValue() index out of bounds')
                 raise IndexError('DataObject addValue() index out of bounds')
@@ -207,6 +745,116 @@ class ADataRowObject(object):
 #         self.record_length += 1
         self._max = len(self.data_collection)
 
+    def extendValues(self, values):
+        """Append a sequence of values to the end of the data_collection.
+
+        This is much quicker than calling addValue() for each value. All of
+        the values are converted before any are added and, if there is a
+        column_callback, it is called once for the whole block rather than
+        calling update_callback for each value.
+
+        If any of the values are invalid none of them will be added.
+
+        Args:
+            values(list): the values to add. None values will be replaced
+                with the default.
+
+        Raises:
+            ValueError: If any of the values are not valid for this object.
+        """
+        values = self._convertValues(values)
+        start = len(self.data_collection)
+
+        if (self.update_callback is not None and self.column_callback is None
+                and not self.defer_update):
+            try:
+                for v in values:
+                    ADataRowObject.addValue(self, v)
+            except Exception:
+                del self.data_collection[start:]
+                self._max = len(self.data_collection)
+                raise
+            return
+
+        if self.storage == st.ARRAY:
+            try:
+                values = array(self.typecode, values)
+            except (TypeError, OverflowError):
+                self._toListStorage()
+        elif self.storage == st.CATEGORICAL:
+            try:
+                self.data_collection.extend(values)
+                values = None
+            except (TypeError, OverflowError):
+                self._toListStorage()
+        if values is not None:
+            self.data_collection.extend(values)
+        self._checkCategories()
+        self._max = len(self.data_collection)
+        self.has_changed = True
+
+        if self.column_callback is not None and not self.defer_update:
+            try:
+                self.column_callback(self, start)
+            except Exception:
+                del self.data_collection[start:]
+                self._max = len(self.data_collection)
+                raise
+
+    def _replaceValues(self, values, storage):
+        """Replace the data_collection with values that are already converted.
+
+        Used to put in values that have been read by a copy of this object,
+        e.g. in another process. The values are not converted or checked and
+        no callbacks are called.
+
+        Args:
+            values(list): the converted values, as a list or array.array.
+            storage(int): the STORAGE_TYPES that the values were held in.
+        """
+        self.storage = storage
+        if storage == st.CATEGORICAL:
+            self.data_collection = CategoricalColumn(self._newCategories(), values)
+        else:
+            self.data_collection = values
+        self._max = len(self.data_collection)
+        self.has_changed = True
+
+    def _convertValues(self, values):
+        """Convert a sequence of values with _convertValue().
+
+        Subclasses can override this with a quicker way of converting a whole
+        column at once.
+
+        Args:
+            values(list): the values to convert.
+
+        Returns:
+            list - the converted values.
+        """
+        convert = self._convertValue
+        return [convert(v) for v in values]
+
+    def _convertValue(self, value):
+        """Convert a value into the type stored by this object.
+
+        Called on every value before it's added to the collection. Subclasses
+        should override this to check and convert the value to the type they
+        hold and then call this method to apply the default.
+
+        Args:
+            value: the value to convert. If None the default will be used.
+
+        Returns:
+            The converted value.
+
+        Raises:
+            ValueError: if the value is not valid for this data object.
+        """
+        if value == None:
+            value = self.default
+        return value
+
     def setValue(self, value, index):
         """Changes the value at the given index
 
@@ -217,17 +865,17 @@ class ADataRowObject(object):
         Raises:
             IndexError: If index does not exist.
         """
-        if self.update_callback is not None:
+        if self.update_callback is not None and not self.defer_update:
             self.update_callback(self, value, index)
 
         length = len(self.data_collection)
         if index == None or index == length:
-            self.data_collection.append(value)
+            self._store(self.data_collection.append, value)
         elif index > length:
             raise IndexError
         else:
             try:
-                self.data_collection[index] = value
+                self._store(self.data_collection.__setitem__, index, value)
             except IndexError:
                 logger.error('DataObject setValue() index out of bounds')
                 raise IndexError('DataObject setValue() index out of bounds')
@@ -256,6 +904,45 @@ class ADataRowObject(object):
     def getDataCollection(self):
         return self.data_collection
 
+    def _store(self, func, *args):
+        """Call a data_collection method that stores a value.
+
+        If the data_collection is an array.array that can't hold the value
+        (e.g. None, or an int that is too large), or a CategoricalColumn that
+        can't hold it (e.g. it can't be hashed), it will be converted to a
+        list and the call will be made again.
+
+        Args:
+            func: the bound data_collection method to call (append, insert or
+                __setitem__).
+            *args: the arguments to pass to func.
+        """
+        try:
+            func(*args)
+        except (TypeError, OverflowError):
+            if self.storage == st.LIST:
+                raise
+            self._toListStorage()
+            getattr(self.data_collection, func.__name__)(*args)
+        self._checkCategories()
+
+    def _checkCategories(self):
+        """Convert to list storage if there are too many categories.
+
+        If max_categories is set and the Categories used by a
+        CategoricalColumn has grown bigger than it, the values aren't a good
+        fit for CATEGORICAL storage so a list is used instead.
+        """
+        if (self.max_categories is not None and self.storage == st.CATEGORICAL
+                and len(self.data_collection.categories) > self.max_categories):
+            self._toListStorage()
+
+    def _toListStorage(self):
+        """Convert the data_collection to list storage."""
+        logger.debug('DataObject %s converted to list storage' % self.data_type)
+        self.data_collection = self.data_collection.tolist()
+        self.storage = st.LIST
+
     def checkDefault(self, value):
         if self.default == '~' and value == self.default:
             return True
@@ -296,6 +983,10 @@ class IntData(ADataRowObject):
         ADataRowObject
     """
 
+    __slots__ = ()
+
+    typecode = str('q')
+
 #     def __init__(self, row_pos, datatype, format_str='{}', default=None):
     def __init__(self, datatype, format_str='{}', **kwargs):
         """Constructor.
@@ -315,11 +1006,11 @@ class IntData(ADataRowObject):
         """
         super(IntData, self).__init__(datatype, format_str, **kwargs)
 
-    def addValue(self, value=None, index=None):
-        """Adds a value to the collection.
+    def _convertValue(self, value):
+        """Convert a value before it is added to the collection.
 
         See Also:
-            ADataRowObject: addValue()
+            ADataRowObject: _convertValue()
         """
         if not value == None:
             try:
@@ -328,7 +1019,19 @@ class IntData(ADataRowObject):
                 logger.error('Attempted to add invalid value to IntDataObject')
                 raise ValueError('Attempted to add invalid value to IntDataObject')
 
-        ADataRowObject.addValue(self, value, index)
+        return ADataRowObject._convertValue(self, value)
+
+    def _convertValues(self, values):
+        """Convert a sequence of values in a single pass.
+
+        See Also:
+            ADataRowObject: _convertValues()
+        """
+        try:
+            return list(map(int, values))
+        except (TypeError, ValueError):
+            # Let the standard conversion deal with defaults and errors
+            return ADataRowObject._convertValues(self, values)
 
     def setValue(self, value, index):
         """Changes the value at the given index
@@ -364,12 +1067,35 @@ class IntData(ADataRowObject):
             value = self.format_str.format(value)
         return value
 
+    def _buildFormatter(self):
+        """Build the function returned by printFormatter().
+
+        See Also:
+            ADataRowObject: _buildFormatter()
+        """
+        formatter = ADataRowObject._buildFormatter(self)
+        if self.format_str is None:
+            return formatter
+        fmt = self.format_str.format
+        int_type = int
+
+        def intFormatter(value):
+            if value.__class__ is int_type:
+                return fmt('%0d' % value)
+            return formatter(value)
+
+        return intFormatter
+
 
 class FloatData(ADataRowObject):
     """Overrides the value return methods from ADataObject to return a
     float value instead of a string.
     """
 
+    __slots__ = ('no_of_dps', 'use_sn')
+
+    typecode = str('d')
+
 #     def __init__(self, row_pos, datatype, format_str='{}', default=None, no_of_dps=0):
     def __init__(self, datatype, format_str='{}', **kwargs):  # default=None, no_of_dps=0):
         """Constructor.
@@ -395,11 +1121,11 @@ class FloatData(ADataRowObject):
         self.use_sn = kwargs.get('use_sn', -1)
         super(FloatData, self).__init__(datatype, format_str, **kwargs)
 
-    def addValue(self, value=None, index=None):
-        """Adds a value to the collection.
+    def _convertValue(self, value):
+        """Convert a value before it is added to the collection.
 
         See Also:
-            ADataRowObject: addValue()
+            ADataRowObject: _convertValue()
         """
         if not value == None:
             try:
@@ -408,7 +1134,19 @@ class FloatData(ADataRowObject):
                 logger.error('Attempted to add invalid value to FloatDataObject')
                 raise ValueError('Attempted to add invalid value to FloatDataObject')
 
-        ADataRowObject.addValue(self, value, index)
+        return ADataRowObject._convertValue(self, value)
+
+    def _convertValues(self, values):
+        """Convert a sequence of values in a single pass.
+
+        See Also:
+            ADataRowObject: _convertValues()
+        """
+        try:
+            return list(map(float, values))
+        except (TypeError, ValueError):
+            # Let the standard conversion deal with defaults and errors
+            return ADataRowObject._convertValues(self, values)
 
     def setValue(self, value, index):
         """Changes the value at the given index
@@ -450,12 +1188,67 @@ class FloatData(ADataRowObject):
                 value = self.format_str.format(value)
         return value
 
+    def formatSpec(self):
+        """See Also: ADataRowObject: formatSpec()"""
+        return (self.format_str, self.default, self.no_of_dps, self.use_sn)
+
+    def _buildFormatter(self):
+        """Build the function returned by printFormatter().
+
+        Floats that don't need scientific notation are formatted with a
+        decimal format string that's only created once. If format_str is a
+        simple alignment and width, like '{:>10}', it's merged with the
+        decimal format so that each value only needs a single format call.
+
+        See Also:
+            ADataRowObject: _buildFormatter()
+        """
+        formatter = ADataRowObject._buildFormatter(self)
+        if self.format_str is None:
+            return formatter
+        decimal_format = '%0.' + str(self.no_of_dps) + 'f'
+        use_sn = self.use_sn
+        float_type = float
+
+        simple = _SIMPLE_FORMAT.match(self.format_str)
+        if simple:
+            # Strings default to left alignment, numbers to the right
+            align = simple.group(1) or '<'
+            fmt = ('{:' + align + simple.group(2) + '.' + str(self.no_of_dps) + 'f}').format
+        else:
+            format_str = self.format_str.format
+
+            def fmt(value):
+                return format_str(decimal_format % value)
+
+        if use_sn > -1:
+            def floatFormatter(value):
+                if value.__class__ is float_type and value < use_sn:
+                    return fmt(value)
+                return formatter(value)
+        else:
+            def floatFormatter(value):
+                if value.__class__ is float_type:
+                    return fmt(value)
+                return formatter(value)
+
+        return floatFormatter
+
 
 class StringData(ADataRowObject):
     """Overrides the value return methods from ADataObject to return a
     str value.
     """
 
+    __slots__ = ()
+
+    max_categories = 256
+    """Max number of distinct values to hold with CATEGORICAL storage.
+
+    Any string can be stored, so each column has its own Categories rather
+    than sharing one and this is the limit for the one column.
+    """
+
     def __init__(self, datatype, format_str='{}', **kwargs):
         """Constructor.
 
@@ -471,14 +1264,33 @@ class StringData(ADataRowObject):
                 default=None: The default value that the collection should use -
                     Can be None if defaults are not allowed or '~' if the default
                     should remove the formatting and apply an empty string.
+                categorical=False(bool): if True and no storage is given use
+                    CATEGORICAL storage. Only useful for columns with a
+                    small number of distinct values, like flags. If more
+                    than max_categories distinct values are seen it will
+                    revert to LIST storage.
         """
         super(StringData, self).__init__(datatype, format_str, **kwargs)
 
-    def addValue(self, value=None, index=None):
-        """Adds a value to the collection.
+    def _defaultStorage(self, **kwargs):
+        """See ADataRowObject._defaultStorage()."""
+        if kwargs.get('categorical', False):
+            return st.CATEGORICAL
+        return default_storage
+
+    def categoriesKey(self):
+        """See ADataRowObject.categoriesKey()."""
+        return ('StringData', self.data_type)
+
+    def _newCategories(self):
+        """See ADataRowObject._newCategories(). Not shared between columns."""
+        return Categories()
+
+    def _convertValue(self, value):
+        """Convert a value before it is added to the collection.
 
         See Also:
-            ADataRowObject: addValue()
+            ADataRowObject: _convertValue()
         """
         if not value == None:
             try:
@@ -490,8 +1302,19 @@ class StringData(ADataRowObject):
             # Strip any whitespace off
             value = value.strip()
 
-        # Call the superclass part of the method to add it.
-        ADataRowObject.addValue(self, value, index)
+        return ADataRowObject._convertValue(self, value)
+
+    def _convertValues(self, values):
+        """Convert a sequence of values in a single pass.
+
+        See Also:
+            ADataRowObject: _convertValues()
+        """
+        try:
+            return [v.strip() for v in values]
+        except AttributeError:
+            # Let the standard conversion deal with defaults and non strings
+            return ADataRowObject._convertValues(self, values)
 
     def setValue(self, value, index):
         """Changes the value at the given index
@@ -528,12 +1351,24 @@ class StringData(ADataRowObject):
             value = self.format_str.format(value)
         return value
 
+    def _buildFormatter(self):
+        """Build the function returned by printFormatter().
+
+        See Also:
+            ADataRowObject: _buildFormatter()
+        """
+        if self.format_str is None or self.default == '~':
+            return ADataRowObject._buildFormatter(self)
+        return self.format_str.format
+
 
 class ConstantData(ADataRowObject):
     """Overrides the value return methods from ADataObject to return a
     str value from a list of predefined constants.
     """
 
+    __slots__ = ('legal_values', '_legal_set')
+
     def __init__(self, datatype, legal_values, format_str='{}', **kwargs):
         """Constructor.
 
@@ -558,13 +1393,51 @@ class ConstantData(ADataRowObject):
         if not isinstance(legal_values, tuple):
             raise AttributeError('legal_values is not a tuple')
         self.legal_values = legal_values
+        try:
+            self._legal_set = frozenset(v for v in legal_values if v is not None)
+        except TypeError:
+            self._legal_set = None
         super(ConstantData, self).__init__(datatype, format_str, **kwargs)
 
-    def addValue(self, value=None, index=None):
-        """Adds a value to the collection.
+    def _defaultStorage(self, **kwargs):
+        """See ADataRowObject._defaultStorage()."""
+        return st.CATEGORICAL
+
+    def categoriesKey(self):
+        """See ADataRowObject.categoriesKey()."""
+        return ('ConstantData', self.data_type, self.legal_values)
+
+    def _newCategories(self):
+        """Seed the Categories with the legal_values so they get the first codes."""
+        return sharedCategories(self.categoriesKey(), self.legal_values)
+
+    def _isLegal(self, value):
+        """Check if value is in legal_values."""
+        try:
+            return value in self._legal_set
+        except TypeError:
+            return value in self.legal_values
+
+    def _convertValues(self, values):
+        """Convert a sequence of values before they're added to the collection.
+
+        If all of the values are legal they don't need converting.
 
         See Also:
-            ADataRowObject: addValue()
+            ADataRowObject: _convertValues()
+        """
+        try:
+            if self._legal_set.issuperset(values):
+                return list(values)
+        except (TypeError, AttributeError):
+            pass
+        return ADataRowObject._convertValues(self, values)
+
+    def _convertValue(self, value):
+        """Convert a value before it is added to the collection.
+
+        See Also:
+            ADataRowObject: _convertValue()
         """
         if value is None:
             if self.default is not None:
@@ -572,14 +1445,13 @@ class ConstantData(ADataRowObject):
             else:
                 raise ValueError('value cannot be None when no default is set.')
         elif value is not None:
-            if not value in self.legal_values:
+            if not self._isLegal(value):
                 if self.default is not None:
                     value = self.default
                 else:
                     raise ValueError('value %s is not included in %s' % (str(value), str(self.legal_values)))
 
-        # Call the superclass part of the method to add it.
-        ADataRowObject.addValue(self, value, index)
+        return ADataRowObject._convertValue(self, value)
 
     def setValue(self, value, index):
         """Changes the value at the given index
@@ -587,8 +1459,8 @@ class ConstantData(ADataRowObject):
         See Also:
             ADataRowObject: setValue()
         """
-        if not value in self.legal_values:
-            raise ValueError('value %S does is not included in %s' % (str(value), str(self.legal_values)))
+        if not self._isLegal(value):
+            raise ValueError('value %s does is not included in %s' % (str(value), str(self.legal_values)))
 
         # Call the superclass to set the value
         ADataRowObject.setValue(self, value, index)
@@ -614,12 +1486,25 @@ class ConstantData(ADataRowObject):
             value = self.format_str.format(value)
         return value
 
+    def _buildFormatter(self):
+        """Build the function returned by printFormatter().
+
+        See Also:
+            ADataRowObject: _buildCachedFormatter()
+        """
+        return self._buildCachedFormatter()
+
 
 class SymbolData(ADataRowObject):
     """Overrides the value return methods from ADataObject to return a
     float value instead of a string.
     """
 
+    __slots__ = ('symbol',)
+
+    bool_type = bool
+    """Used to test if a value is of type bool or not."""
+
     def __init__(self, datatype, symbol, format_str='{}', **kwargs):
         """Constructor.
 
@@ -644,14 +1529,38 @@ class SymbolData(ADataRowObject):
             AttributeError: if legal_values in not a valid tuple.
         """
         self.symbol = symbol
-        self.bool_type = bool  # Used to test if a value is of type bool or not
         super(SymbolData, self).__init__(datatype, format_str, **kwargs)
 
-    def addValue(self, value=None, index=None):
-        """Adds a value to the collection.
+    def _defaultStorage(self, **kwargs):
+        """See ADataRowObject._defaultStorage()."""
+        return st.CATEGORICAL
+
+    def categoriesKey(self):
+        """See ADataRowObject.categoriesKey()."""
+        return ('SymbolData', self.data_type, self.symbol)
+
+    def _convertValues(self, values):
+        """Convert a sequence of values before they're added to the collection.
+
+        Values read from a file are all either the symbol or blank, so they
+        can be converted without checking each one.
+
+        See Also:
+            ADataRowObject: _convertValues()
+        """
+        symbol = self.symbol
+        try:
+            if set(values) <= set((symbol, '')):
+                return [v == symbol for v in values]
+        except TypeError:
+            pass
+        return ADataRowObject._convertValues(self, values)
+
+    def _convertValue(self, value):
+        """Convert a value before it is added to the collection.
 
         See Also:
-            ADataRowObject: addValue()
+            ADataRowObject: _convertValue()
         """
         if not value == None:
             if value == self.symbol:
@@ -664,8 +1573,7 @@ class SymbolData(ADataRowObject):
                 logger.error('Attempted to add invalid value to SymbolDataObject')
                 raise ValueError('Attempted to add invalid value to SymbolDataObject')
 
-        # Call superclass to add the value
-        ADataRowObject.addValue(self, value, index)
+        return ADataRowObject._convertValue(self, value)
 
     def setValue(self, value, index):
         """Changes the value at the given index
@@ -708,3 +1616,15 @@ class SymbolData(ADataRowObject):
         else:
             value = self.format_str.format(value)
         return value
+
+    def formatSpec(self):
+        """See Also: ADataRowObject: formatSpec()"""
+        return (self.format_str, self.default, self.symbol)
+
+    def _buildFormatter(self):
+        """Build the function returned by printFormatter().
+
+        See Also:
+            ADataRowObject: _buildCachedFormatter()
+        """
+        return self._buildCachedFormatter()
@@ -23,10 +23,12 @@
 from __future__ import unicode_literals
 
 import copy
+from contextlib import contextmanager
 
 import logging
 logger = logging.getLogger(__name__)
 
+from ship.datastructures import STORAGE_TYPES as st
 from ship.datastructures.dataobject import *
 """logging references with a __name__ set to this module."""
 
@@ -56,15 +58,29 @@ class RowDataCollection(object):
           the same number of rows. For the time being there is a convenience
           method checkRowsInSync() that can be called to verify that all of the
           data objects in this collection have the same length.
+
+    Attributes:
+        debug_sync_check(bool): if True numberOfRows() will check that all of
+            the data objects are the same length every time it's called. This
+            is slow, but useful if you suspect that something is changing the
+            data objects without going through the collection. Default False.
     """
 
+    debug_sync_check = False
+
     def __init__(self, **kwargs):
         """Create a reference to the collection list."""
         self._collection = []
+        self._index = {}
+        """Lookup of data_type to position in self._collection."""
         self._min_collection = 0
         self._current_collection = 0
         self._updateCallback = kwargs.get('update_callback', None)
         self.has_dummy = False
+        self._journal = None
+        """Undo entries for the current transaction(), or None if not in one."""
+        self._changed = False
+        """True if data objects have been added or deleted. See has_changed."""
 
     @classmethod
     def bulkInitCollection(cls, dataobjects, **kwargs):
@@ -72,12 +88,33 @@ class RowDataCollection(object):
         for d in dataobjects:
             rc._collection.append(d)
             rc._max = len(rc._collection)
+        rc._rebuildIndex()
         return rc
 
     @property
     def row_count(self):
         return self.numberOfRows()
 
+    @property
+    def has_changed(self):
+        """True if any of the data objects have changed.
+
+        This includes adding or deleting data objects. Use setChangeStatus()
+        to reset it.
+        """
+        return self._changed or any(o.has_changed for o in self._collection)
+
+    def setChangeStatus(self, status):
+        """Set the change status of the collection and its data objects.
+
+        Args:
+            status(bool): if False has_changed will be False until the
+                collection is changed again.
+        """
+        self._changed = status
+        for o in self._collection:
+            o.setChangeStatus(status)
+
 
 #     def initCollection(self, dataobject):
     def addToCollection(self, dataobject, index=None):
@@ -101,13 +138,49 @@ class RowDataCollection(object):
             except IndexError:
                 raise('Index %s does not exist in collection' % index)
         self._max = len(self._collection)
+        self._changed = True
+        self._rebuildIndex()
 
     def indexOfDataObject(self, key):
         """Get the index of the DataObject with data_type equal to key.
+
+        Return:
+            int - the index of the DataObject or None if key is not in the
+                collection.
         """
-        for i, c in enumerate(self._collection):
-            if c.data_type == key:
+        try:
+            i = self._index[key]
+            if self._collection[i].data_type == key:
                 return i
+        except (KeyError, IndexError):
+            pass
+
+        # Either the key doesn't exist or the collection has been changed
+        # without going through the collection methods
+        self._rebuildIndex()
+        return self._index.get(key, None)
+
+    def _rebuildIndex(self):
+        """Rebuild the data_type lookup for the data objects in the collection.
+
+        If there is more than one object with the same data_type the first one
+        will be used, to match the order of the collection.
+        """
+        self._index = {}
+        for i, c in enumerate(self._collection):
+            if not c.data_type in self._index:
+                self._index[c.data_type] = i
+
+    def _dataObject(self, key):
+        """Get the data object with data_type equal to key.
+
+        Raises:
+            KeyError: if key is not in the collection.
+        """
+        i = self.indexOfDataObject(key)
+        if i is None:
+            raise KeyError('Key %s does not exist in collection' % (key))
+        return self._collection[i]
 
     def iterateRows(self, key=None):
         """Returns a generator for iterating through the rows in the collection.
@@ -126,9 +199,9 @@ class RowDataCollection(object):
             for i in range(0, self.row_count):
                 yield [o.getValue(i) for o in self._collection]
         else:
-            index = self.indexOfDataObject(key)
+            obj = self._dataObject(key)
             for i in range(0, self.row_count):
-                yield self._collection[index].getValue(i)
+                yield obj.getValue(i)
 
     def rowAsDict(self, index):
         """Get the data vals in a particular row by index.
@@ -179,48 +252,64 @@ class RowDataCollection(object):
             able to change it without affecting the main copy use
             getDataObjectCopy().
         """
-        for obj in self._collection:
-            if obj.data_type == name_key:
-                return obj
-        else:
+        try:
+            return self._dataObject(name_key)
+        except KeyError:
             raise KeyError('name_key %s was not found in collection' % (name_key))
 
-    def dataObjectAsList(self, key):
+    def dataObjectAsList(self, key, copy=True):
         """Returns a DataObject as a list.
 
         This will return the row_collection DataObject referenced by the key
         provided (as a ROW_DATA_TYPES) in list form.
 
-        If you intend to update the values you should use getRowDataObject
-        instead as the data provided will be mutable and therefore reflected in
-        the values held by the row_collection. If you just want a quick way to
-        loop through the values in one of the data objects  and only intend to
-        read the data then use this.
+        By default the values are copied into a new list, so changing the list
+        will not affect the values in the collection. If you only want to read
+        the values use copy=False to get a read-only ColumnView instead. This
+        doesn't copy anything, which is much quicker if you're reading a lot
+        of sections. If you intend to update the values you should use
+        dataObject() instead.
 
         Args:
             key(str): the key for the data object requested. It is best 
                 to use  the class constants (i.e. RiverUnit.CHAINAGE) for this.
+            copy=True(bool): if False a ColumnView will be returned instead
+                of a list.
 
         Returns:
             List containing the data in the DataObject that the key points
-                 to. Returns false if there is no row collection.
+                 to, or a ColumnView of it if copy == False.
 
         Raises:
             KeyError: If key does not exist.
         """
-        try:
-            data_col = self.dataObject(key)
-            if data_col == False:
-                raise KeyError('Key %s does not exist in collection' % (key))
-
-            vals = []
-            for i in data_col:
-                vals.append(i)
-            return vals
-        except KeyError:
-            raise
+        data_col = self.dataObject(key)
+        if not copy:
+            return ColumnView(data_col)
+        return list(data_col.data_collection)
+
+    def indicesWhere(self, key, value):
+        """Get the row indexes where the value in a DataObject equals value.
+
+        If the DataObject uses CATEGORICAL storage (e.g. ConstantData) only
+        the stored codes need to be compared, which is much quicker than
+        checking each value.
+
+        Args:
+            key(int): the ROW_DATA_TYPES key of the DataObject to search.
+            value: the value to find.
+
+        Returns:
+            list - of int row indexes. Empty if the value isn't found.
+
+        Raises:
+            KeyError: If key does not exist.
+        """
+        if self.has_dummy:
+            return []
+        return self.dataObject(key).indicesOf(value)
 
-    def toList(self):
+    def toList(self, copy=True):
         """Returns the row data a list.
 
         Collects the row data in each of the ADataObjects in this collection
@@ -235,22 +324,19 @@ class RowDataCollection(object):
                 [0.03, 0.03, 0.03]
             ]
 
+        Args:
+            copy=True(bool): if False the inner lists will be read-only
+                ColumnView's rather than copies. See dataObjectAsList().
+
         Returns:
             List - containing lists of the data in the DataObjects in this
                 collection.
-
-        Raises:
-            KeyError: If key does not exist.
         """
-        outlist = []
-        for c in self._collection:
-            innerlist = []
-            for i in c:
-                innerlist.append(i)
-            outlist.append(innerlist)
-        return outlist
+        if not copy:
+            return [ColumnView(c) for c in self._collection]
+        return [list(c.data_collection) for c in self._collection]
 
-    def toDict(self):
+    def toDict(self, copy=True):
         """Returns the row data object as a dict.
 
         Provides a dict where keys are the datunits.ROW_DATA_TYPES and the
@@ -261,15 +347,19 @@ class RowDataCollection(object):
         the values held by the collection. If you just want to read the data 
         then use this.
 
+        Args:
+            copy=True(bool): if False the values will be read-only
+                ColumnView's rather than copies. See dataObjectAsList().
+
         Returns:
             dict - containing lists of values by ROW_DATA_TYPE.
         """
         vals = {}
         for c in self._collection:
-            inner = []
-            for i in c:
-                inner.append(i)
-            vals[c.data_type] = inner
+            if copy:
+                vals[c.data_type] = list(c.data_collection)
+            else:
+                vals[c.data_type] = ColumnView(c)
         return vals
 
     def dataValue(self, key, index):
@@ -286,12 +376,11 @@ class RowDataCollection(object):
             KeyError - if key does not exist in collection.
             IndexError - if index does not exist in DataObject.
         """
-        for c in self._collection:
-            if c.data_type == key:
-                val = c.getValue(index)
-                return val
-        else:
+        try:
+            c = self._dataObject(key)
+        except KeyError:
             raise KeyError('DataObject %s does not exist in collection' % key)
+        return c.getValue(index)
 
     def _addValue(self, key, value=None):
         """Add a new value to the data object in the collection as referenced by
@@ -315,17 +404,10 @@ class RowDataCollection(object):
             sure that they are dealt with/passed on from here.
         """
         # Find the collection by the key and add the value to it.
-        for c in self._collection:
-            if c.data_type == key:
-                c.addValue(value)
-                break
-        else:
-            raise KeyError('Key %s does not exist in collection' % (key))
+        self._journalAdd(self._dataObject(key), value, None)
 
         # Do this after so it's not removed when something goes wrong
-        if self.has_dummy:
-            self.deleteRow(0)
-            self.has_dummy = False
+        self._clearDummy()
 
     def _setValue(self, key, value, index):
         """Set the value to the data object in the collection.
@@ -345,16 +427,7 @@ class RowDataCollection(object):
             ValueError: If the value is not appropriate for the data type
         """
         # Find the collection by the key and add the value to it.
-        for c in self._collection:
-            if c.data_type == key:
-
-                try:
-                    c.setValue(value, index)
-                    break
-                except ValueError:
-                    raise
-        else:
-            raise KeyError('Key %s does not exist in collection' % (key))
+        self._journalSet(self._dataObject(key), value, index)
 
     def getPrintableRow(self, index):
         """ Get the row data in printable form.
@@ -368,11 +441,247 @@ class RowDataCollection(object):
         Returns:
             string formatted for printing to .DAT file.
         """
-        out_str = ''
-        for i, obj in enumerate(self._collection):
-            out_str += obj.getPrintableValue(index)
+        return ''.join([obj.getPrintableValue(index) for obj in self._collection])
+
+    def renderRows(self, start=0, stop=None):
+        """Get a block of rows in printable form.
+
+        Returns the same strings as calling getPrintableRow() for each index
+        in range(start, stop), but is much quicker for a large number of
+        rows. Each data object's printFormatter() is used to format its
+        values in one pass and the columns are then joined into rows.
+
+        Args:
+            start=0(int): the index of the first row to return.
+            stop=None(int): the index after the last row to return. If None
+                numberOfRows() will be used.
+
+        Returns:
+            list - of str's formatted for printing to .DAT file.
+        """
+        if stop is None:
+            stop = self.numberOfRows()
+        if start >= stop:
+            return []
+
+        columns = [
+            list(map(obj.printFormatter(), obj.data_collection[start:stop]))
+            for obj in self._collection
+        ]
+        return [''.join(row) for row in zip(*columns)]
+
+    def iterRenderedRows(self, chunk_size=2000):
+        """Generator version of renderRows().
+
+        The rows are rendered chunk_size at a time so that only one chunk
+        of the formatted rows is held in memory at once.
+
+        Args:
+            chunk_size=2000(int): the number of rows to render at a time.
+
+        Yields:
+            str - each row formatted for printing to .DAT file.
+        """
+        row_count = self.numberOfRows()
+        for start in range(0, row_count, chunk_size):
+            for row in self.renderRows(start, min(start + chunk_size, row_count)):
+                yield row
+
+    def renderJob(self):
+        """Get a copy of the collection that can be rendered in another process.
+
+        The data objects are copied without their callbacks, so that the
+        unit they belong to isn't pickled with them. Their values are shared
+        with this collection rather than copied, so the job must only be
+        used for rendering.
+
+        Returns:
+            RowDataCollection - copy of this collection without callbacks.
+        """
+        job = copy.copy(self)
+        job._updateCallback = None
+        job._journal = None
+        job._collection = _withoutCallbacks(self._collection)
+        return job
+
+    @contextmanager
+    def transaction(self):
+        """Context manager for making a group of changes atomic.
+
+        While in a transaction every change made through the methods of this
+        collection (addRow(), updateRow(), deleteRow(), etc) is recorded in a
+        journal containing only the indexes that were touched and their old
+        values. If an exception is raised inside the with block the journal
+        is used to return the collection to the state it was in at the start
+        of the block and the exception is raised again.
+
+        Transactions can be nested. If an inner transaction fails only the
+        changes made inside it are undone.
+
+        When the outermost transaction finishes the data objects are checked
+        to make sure they are still in sync. If they aren't all of the changes
+        are undone and a RuntimeError is raised. This is what allows
+        numberOfRows() to just check the length of the first data object.
+
+        Example:
+            >>> with collection.transaction():
+            >>>     collection.updateRow({rdt.ELEVATION: 32.1}, 3)
+            >>>     collection.deleteRow(4)
+
+        Note:
+            Changes made directly to the data objects, rather than through
+            this collection, are not recorded.
+        """
+        outer = self._journal is None
+        if outer:
+            self._journal = []
+        savepoint = len(self._journal)
+        try:
+            yield self
+            if outer and not self.checkRowsInSync():
+                logger.error('Collection not in sync!')
+                raise RuntimeError('RowCollection objects are not in sync')
+        except BaseException:
+            self._rollback(savepoint)
+            raise
+        finally:
+            if outer:
+                self._journal = None
+
+    @contextmanager
+    def deferValidation(self):
+        """Context manager for checking values once at the end of an edit.
+
+        Data objects that have both an update_callback and a column_callback
+        (e.g. chainage, which must increase) normally check every value as
+        it's added or updated. Inside this context the update_callback's are
+        not called. When the block finishes the column_callback of each
+        data object that was changed is called once, starting from the first
+        index that was touched. This means a single pass over the column,
+        and any error can report all of the bad indexes at once.
+
+        The block is run inside a transaction(), so if any of the checks fail
+        all of the changes are undone before the error is raised.
+
+        Example:
+            >>> with collection.deferValidation():
+            >>>     for i, c in enumerate(new_chainages):
+            >>>         collection.updateRow({rdt.CHAINAGE: c}, i)
+
+        Note:
+            While validation is deferred the values can be temporarily out
+            of order, so don't rely on them until the block has finished.
+        """
+        deferred = [
+            o for o in self._collection
+            if o.update_callback is not None and o.column_callback is not None
+            and not o.defer_update
+        ]
+        with self.transaction():
+            savepoint = len(self._journal)
+            for o in deferred:
+                o.defer_update = True
+            try:
+                yield self
+            finally:
+                for o in deferred:
+                    o.defer_update = False
+
+            for o in deferred:
+                start = self._firstChangedIndex(o, savepoint)
+                if start is not None:
+                    o.column_callback(o, start)
+
+    def _firstChangedIndex(self, obj, savepoint):
+        """Get the lowest index of obj changed since savepoint in the journal.
+
+        Args:
+            obj(ADataRowObject): the data object to check.
+            savepoint(int): the position in the journal to start from.
+
+        Returns:
+            int - the lowest changed index, or None if obj wasn't changed.
+        """
+        first = None
+        for entry in self._journal[savepoint:]:
+            if entry[0] != 'dummy' and entry[1] is obj:
+                if first is None or entry[2] < first:
+                    first = entry[2]
+        return first
 
-        return out_str
+    def _rollback(self, savepoint):
+        """Undo the journal entries recorded after savepoint.
+
+        Entries are undone in reverse order directly on the data_collection's
+        so that no callbacks are run.
+
+        Args:
+            savepoint(int): the length of the journal to roll back to.
+        """
+        journal = self._journal
+        while len(journal) > savepoint:
+            entry = journal.pop()
+            action = entry[0]
+            if action == 'dummy':
+                self.has_dummy = entry[1]
+                continue
+
+            obj, index = entry[1], entry[2]
+            if action == 'insert':
+                del obj.data_collection[index]
+            elif action == 'extend':
+                del obj.data_collection[index:]
+            elif action == 'set':
+                obj.data_collection[index] = entry[3]
+            elif action == 'delete':
+                obj.data_collection.insert(index, entry[3])
+            obj._max = len(obj.data_collection)
+
+    def _journalAdd(self, obj, value, index):
+        """Add value to obj at index and record it in the journal."""
+        if index is None:
+            index = len(obj)
+        obj.addValue(value, index)
+        if self._journal is not None:
+            self._journal.append(('insert', obj, index))
+
+    def _journalSet(self, obj, value, index):
+        """Set value in obj at index and record it in the journal."""
+        if index == len(obj):
+            self._journalAdd(obj, value, index)
+            return
+        old = obj.data_collection[index]
+        obj.setValue(value, index)
+        if self._journal is not None:
+            self._journal.append(('set', obj, index, old))
+
+    def _journalDelete(self, obj, index):
+        """Delete the value in obj at index and record it in the journal."""
+        old = obj.data_collection[index]
+        obj.deleteValue(index)
+        if self._journal is not None:
+            self._journal.append(('delete', obj, index, old))
+
+    def _journalExtend(self, obj, values):
+        """Extend obj with values and record it in the journal."""
+        start = len(obj)
+        obj.extendValues(values)
+        if self._journal is not None:
+            self._journal.append(('extend', obj, start))
+
+    def _clearDummy(self, position=0):
+        """Delete the dummy row, if there is one, and reset the flag.
+
+        Args:
+            position=0(int): the index that the dummy row is currently at.
+        """
+        if not self.has_dummy:
+            return
+        for obj in self._collection:
+            self._journalDelete(obj, position)
+        if self._journal is not None:
+            self._journal.append(('dummy', True))
+        self.has_dummy = False
 
     def updateRow(self, row_vals, index, **kwargs):
         """Add a new row to the units data rows.
@@ -383,17 +692,15 @@ class RowDataCollection(object):
         rather than inserted.
 
         **kwargs:
-            'no_copy'(bool): if True the deepcopy of the object will not be
-                made. This is useful if you are loading a lot of data and don't
-                want the overhead of deepcopy - like loading a new model. 
-                Default is False.
+            'no_copy'(bool): deprecated and ignored. Changes are now undone
+                with the transaction() journal so no copy is ever made.
 
         Note: 
             If there is any problem while updating the values in the row all 
             datarow objects will be returned to the state they were in before 
             the operation. This ensures that they don't get out of sync if an 
-            error is found halfway through adding the different values. This is 
-            done by creating a deep copy of the object prior to updating.
+            error is found halfway through adding the different values. See
+            transaction() for details.
 
         Args:
             row_vals (dict): Contains the names of the data objects of
@@ -404,36 +711,17 @@ class RowDataCollection(object):
             KeyError: If any of the keys don't exist.
             IndexError: If the index doesn't exist.
         """
-        no_copy = kwargs.get('no_copy', False)
-
         if index > self.row_count:
             raise IndexError
 
-        dataobj_keys = self.collectionTypes()
         vkeys = row_vals.keys()
         for k in vkeys:
-            if not k in dataobj_keys:
+            if self.indexOfDataObject(k) is None:
                 raise KeyError('ROW_DATA_TYPE ' + str(k) + 'is not in collection')
 
-        temp_list = None
-        try:
-            # Need to make a deep copy of the data_object so we can reset them back
-            # to the same place if there's a problem. That way we don't get the lists
-            # in the different objects out of sync.
-            if not no_copy:
-                temp_list = self._deepCopyDataObjects(self._collection)
-
+        with self.transaction():
             for key, val in row_vals.items():
-                self._setValue(key, val, index)
-
-        except (IndexError, ValueError, Exception) as err:
-            self._resetDataObject(temp_list)
-            raise err
-        finally:
-            if temp_list is not None:
-                for o in temp_list:
-                    del o
-            del temp_list
+                self._journalSet(self._dataObject(key), val, index)
 
     def addRow(self, row_vals, index=None, **kwargs):
         """Add a new row to the units data rows.
@@ -447,14 +735,12 @@ class RowDataCollection(object):
             If there is any problem while adding the new row all datarow objects
             will be returned to the state they were in before the operation.
             This ensures that they don't get out of sync if an error is found
-            halfway through adding the different values. This is done by 
-            creating a deep copy of the object prior to updating.
+            halfway through adding the different values. See transaction() for
+            details.
 
         **kwargs:
-            'no_copy'(bool): if True the deepcopy of the object will not be
-                made. This is useful if you are loading a lot of data and don't
-                want the overhead of deepcopy - like loading a new model. 
-                Default is False.
+            'no_copy'(bool): deprecated and ignored. Changes are now undone
+                with the transaction() journal so no copy is ever made.
 
         Args:
             row_vals (dict): Contains the names of the data objects of
@@ -466,65 +752,124 @@ class RowDataCollection(object):
             KeyError: If any of the keys don't exist.
             IndexError: If the index doesn't exist.
         """
-        no_copy = kwargs.get('no_copy', False)
-
         if index is not None and index > self.row_count:
             raise IndexError
 
-        dataobj_keys = self.collectionTypes()
         vkeys = row_vals.keys()
         for k in vkeys:
-            if not k in dataobj_keys:
+            if self.indexOfDataObject(k) is None:
                 raise KeyError('ROW_DATA_TYPE ' + str(k) + 'is not in collection')
 
-        temp_list = None
-        try:
-            # Need to make a deep copy of the data_object so we can reset them back
-            # to the same place if there's a problem. That way we don't get the lists
-            # in the different objects out of sync.
-            if not no_copy:
-                temp_list = self._deepCopyDataObjects(self._collection)
-
+        with self.transaction():
             for obj in self._collection:
                 if not obj.data_type in vkeys:
                     if obj.default is not None:
-                        obj.addValue(obj.default, index)
+                        self._journalAdd(obj, obj.default, index)
                     else:
                         raise ValueError
                 else:
-                    obj.addValue(row_vals[obj.data_type], index)
+                    self._journalAdd(obj, row_vals[obj.data_type], index)
 
-            if not self.checkRowsInSync():
-                raise RuntimeError
+            # If the new row went in at the start the dummy row is after it
+            self._clearDummy(1 if index == 0 else 0)
 
-        except (IndexError, ValueError, Exception):
-            self._resetDataObject(temp_list)
-            raise
-        except RuntimeError as err:
-            logger.error('Collection not in sync!')
-            logger.exception(err)
-            self._resetDataObject(temp_list)
-            logger.error('Collection reset to previous state')
-            raise
-        finally:
-            if temp_list is not None:
-                for o in temp_list:
-                    del o
-            del temp_list
+    def addRows(self, rows):
+        """Append a list of rows to the collection.
 
-        # Do this after so it's not removed if something goes wrong
-        if self.has_dummy:
-            self.deleteRow(0, no_copy=True)
-            self.has_dummy = False
+        This is the bulk equivalent of calling addRow() for each row, but is
+        much quicker for a large number of rows. The keys are checked once
+        and each data object has all of its new values added in one go with
+        ADataRowObject.extendValues().
+
+        Keys that are missing from a row are given the data object default.
+
+        Note:
+            If there is a problem adding any of the rows none of them will be
+            added to the collection.
+
+        Args:
+            rows(list): of dicts in the same form as used by addRow().
+
+        Raises:
+            KeyError: If any of the keys don't exist.
+            ValueError: If a value is missing for a data object that has no
+                default, or any of the values are invalid.
+
+        See Also:
+            extendColumns()
+        """
+        if not rows:
+            return
+
+        keys = set()
+        for r in rows:
+            keys.update(r.keys())
+
+        columns = {}
+        for k in keys:
+            obj = self._dataObject(k)
+            default = obj.default
+            if default is None:
+                try:
+                    columns[k] = [r[k] for r in rows]
+                except KeyError:
+                    raise ValueError('No value for ROW_DATA_TYPE %s and no default is set' % k)
+            else:
+                columns[k] = [r.get(k, default) for r in rows]
+
+        self.extendColumns(columns)
+
+    def extendColumns(self, columns):
+        """Append whole columns of values to the collection.
+
+        Every sequence in columns must be the same length. Data objects that
+        are not included in columns are filled with their default value.
+
+        Note:
+            If there is a problem adding any of the values none of them will
+            be added to the collection.
+
+        Args:
+            columns(dict): ROW_DATA_TYPES keys with a sequence of the values
+                to add to that data object.
+
+        Raises:
+            KeyError: If any of the keys don't exist.
+            ValueError: If the columns are different lengths, a column is
+                missing for a data object that has no default, or any of the
+                values are invalid.
+        """
+        lengths = set(len(c) for c in columns.values())
+        if len(lengths) > 1:
+            raise ValueError('All columns must be the same length')
+        if not lengths:
+            return
+        length = lengths.pop()
+        if length == 0:
+            return
+
+        for k in columns.keys():
+            if self.indexOfDataObject(k) is None:
+                raise KeyError('ROW_DATA_TYPE ' + str(k) + ' is not in collection')
+
+        with self.transaction():
+            for obj in self._collection:
+                if obj.data_type in columns:
+                    values = columns[obj.data_type]
+                elif obj.default is not None:
+                    values = [obj.default] * length
+                else:
+                    raise ValueError('No values for ROW_DATA_TYPE %s and no default is set' % obj.data_type)
+                self._journalExtend(obj, values)
+
+            self._clearDummy()
 
     def deleteRow(self, index, **kwargs):
         """Delete a row from the collection.
 
         **kwargs:
-            'no_copy'(bool): if True the deepcopy of the object will not be
-                made. This is useful if you are loading a lot of data and don't
-                want the overhead of deepcopy - like deleting the dummy row. 
-                Default is False.
+            'no_copy'(bool): deprecated and ignored. Changes are now undone
+                with the transaction() journal so no copy is ever made.
 
         Args:
             index(int): the index to delete the values for.
@@ -532,30 +877,12 @@ class RowDataCollection(object):
         Raise:
             IndexError: if index is out of the bounds of the collection.
         """
-        no_copy = kwargs.get('no_copy', False)
-
         if index < 0 or index > self.row_count:
             raise IndexError
 
-        temp_list = None
-        try:
-            # Need to make a deep copy of the data_object so we can reset them back
-            # to the same place if there's a problem. That way we don't get the lists
-            # in the different objects out of sync.
-            if not no_copy:
-                temp_list = self._deepCopyDataObjects(self._collection)
-
+        with self.transaction():
             for obj in self._collection:
-                obj.deleteValue(index)
-
-        except (IndexError, ValueError, Exception):
-            self._resetDataObject(temp_list)
-            raise
-        finally:
-            if temp_list is not None:
-                for o in temp_list:
-                    del o
-            del temp_list
+                self._journalDelete(obj, index)
 
     def collectionTypes(self):
         """Get a list of the types (names) of all the objects in the collection.
@@ -588,12 +915,11 @@ class RowDataCollection(object):
             ADataRowObject or False if the key doesn't match any in the 
             collection.
         """
-        for obj in self._collection:
-            if obj.data_type == name_key:
-                obj_copy = self._deepCopyDataObjects(obj)
-                return obj_copy
-        else:
+        try:
+            obj = self._dataObject(name_key)
+        except KeyError:
             raise KeyError('name_key %s was not found in collection' % (name_key))
+        return self._deepCopyDataObjects(obj)
 
     def deleteDataObject(self, name_key):
         """Delete the ADataRowObject instance requested.
@@ -605,13 +931,14 @@ class RowDataCollection(object):
         Returns:
             True if the object was successfully deleted; False if not.
         """
-        for obj in self._collection:
-            if obj.data_type == name_key:
-                self._collection.remove(obj)
-                self._max = len(self._collection)
-                return True
-        else:
+        i = self.indexOfDataObject(name_key)
+        if i is None:
             return False
+        del self._collection[i]
+        self._max = len(self._collection)
+        self._changed = True
+        self._rebuildIndex()
+        return True
 
     def setDummyRow(self, row_vals):
         """Sets a special 'dummy row' as a placeholder until actual values.
@@ -624,21 +951,29 @@ class RowDataCollection(object):
         flag to True. When actual row data is added to the collection it will
         check the flag and delete the row if it's True.
         """
-        self.addRow(row_vals, no_copy=True)
-        if self.has_dummy:
-            self.deleteRow(0, no_copy=True)
+        self.addRow(row_vals)
         self.has_dummy = True
 
     def numberOfRows(self):
         """Return the number of rows held in the collection
 
+        All changes made through this collection are checked to make sure
+        that the data objects are still in sync when they finish (see
+        transaction()), so this only needs to look at the length of the first
+        data object. Set debug_sync_check to True to check all of them on
+        every call as well.
+
         Returns:
             int - number of rows in this collection.
+
+        Raises:
+            RuntimeError: if debug_sync_check is True and the data objects
+                are not in sync.
         """
-        if not self.checkRowsInSync():
+        if self.debug_sync_check and not self.checkRowsInSync():
             raise RuntimeError('RowCollection objects are not in sync')
 
-        if self.has_dummy:
+        if self.has_dummy or not self._collection:
             return 0
         else:
             return len(self._collection[0])
@@ -659,30 +994,243 @@ class RowDataCollection(object):
             True if all data collections have the same length, otherwise
                  False. 
         """
-        lengths = []
+        if not self._collection:
+            return True
+        length = len(self._collection[0])
         for obj in self._collection:
-            lengths.append(obj.record_length)
+            if len(obj) != length:
+                return False
+        return True
+
+    def _deepCopyDataObjects(self, obj):
+        """Create a deep copy of the data_objects
 
-        return lengths[1:] == lengths[:-1]
+        """
+        object_copy = copy.deepcopy(obj)
+        return object_copy
 
-    def _resetDataObject(self, temp_list):
-        """Reset the data_objects list to its previous state.
 
-        This method is called when there is a problem with updating the data_objects
-        list. It returns the self owned versions to their original state.
+class LazyRowDataCollection(RowDataCollection):
+    """RowDataCollection that reads its rows the first time it's used.
+
+    Created by AUnit's that are loaded with the 'lazy' option. The raw file
+    lines for the rows are kept along with a reader function and they're
+    only parsed into the data objects when something needs them. Until
+    then numberOfRows() and renderRows() work from the raw lines, so a unit
+    that is never touched is written back out with the rows exactly as they
+    were read.
+
+    Every method that uses the data objects goes through self._collection,
+    which is a property here that reads the rows first, so the collection
+    behaves exactly like a RowDataCollection.
+
+    Note:
+        Any problems with the row data, like non-numeric values, will be
+        raised the first time the collection is used rather than at load.
+    """
+
+    def __init__(self, **kwargs):
+        self._lines = None
+        self._reader = None
+        super(LazyRowDataCollection, self).__init__(**kwargs)
+
+    @classmethod
+    def fromCollection(cls, collection, lines, reader):
+        """Create a LazyRowDataCollection from an empty RowDataCollection.
+
+        Any dummy row in collection is removed.
 
         Args:
-            temp_list: The versions to return the objects to.
+            collection(RowDataCollection): setup with the data objects, but
+                no rows yet. It's contents are moved to the new collection.
+            lines(list): the raw file lines for the rows.
+            reader(func): called as reader(collection, lines) to read the
+                lines into the collection. It must be a module level function
+                or staticmethod so that the collection can be pickled.
+
+        Returns:
+            LazyRowDataCollection - in place of collection.
         """
-        if temp_list is not None:
-            self._collection = temp_list
-            for o in temp_list:
-                del o
-            del temp_list
+        collection._clearDummy()
+        lazy = cls.__new__(cls)
+        state = dict(collection.__dict__)
+        state['_objects'] = state.pop('_collection')
+        lazy.__dict__.update(state)
+        lazy._lines = lines
+        lazy._reader = reader
+        return lazy
 
-    def _deepCopyDataObjects(self, obj):
-        """Create a deep copy of the data_objects
+    @property
+    def _collection(self):
+        if self._lines is not None:
+            self.load()
+        return self._objects
 
+    @_collection.setter
+    def _collection(self, value):
+        self._objects = value
+
+    @property
+    def is_loaded(self):
+        """True if the rows have been read into the data objects."""
+        return self._lines is None
+
+    def load(self):
+        """Read the raw lines into the data objects, if not done already.
+
+        If the reader fails any rows that it added are removed and the
+        collection is left unloaded.
         """
-        object_copy = copy.deepcopy(obj)
-        return object_copy
+        if self._lines is None:
+            return
+        lines = self._lines
+        reader = self._reader
+        self._lines = None
+        self._reader = None
+        try:
+            with self.transaction():
+                reader(self, lines)
+        except Exception:
+            self._lines = lines
+            self._reader = reader
+            raise
+        self._loadedUnchanged()
+
+    def _loadedUnchanged(self):
+        """Reset the data objects change status after reading the rows.
+
+        Reading the rows that were already there isn't a change.
+        """
+        for obj in self._objects:
+            obj.has_changed = False
+
+    def loadJob(self):
+        """Get the information needed to load the rows in another process.
+
+        The data objects are copied without their callbacks, so that the
+        unit they belong to doesn't need to be sent too. Collections that
+        validate values one at a time with an update_callback and no
+        column_callback need the rest of the unit to do it, so they can't be
+        loaded elsewhere.
+
+        Returns:
+            tuple - (reader, lines, data objects) to pass to runLoadJobs(), or
+                None if already loaded or the rows can't be loaded elsewhere.
+        """
+        if self._lines is None:
+            return None
+        for obj in self._objects:
+            if obj.update_callback is not None and obj.column_callback is None:
+                return None
+        return (self._reader, self._lines, _withoutCallbacks(self._objects))
+
+    def setLoaded(self, columns):
+        """Put in the rows loaded from a loadJob() by runLoadJobs().
+
+        The column_callback of each data object is called to check the
+        values.
+
+        Args:
+            columns(list): the values for each data object returned by
+                runLoadJobs().
+
+        Raises:
+            ValueError: if a column_callback rejects the values.
+        """
+        for obj, (storage, values) in zip(self._objects, columns):
+            obj._replaceValues(values, storage)
+        self._lines = None
+        self._reader = None
+        for obj in self._objects:
+            if obj.column_callback is not None:
+                obj.column_callback(obj, 0)
+        self._loadedUnchanged()
+
+    @property
+    def has_changed(self):
+        """See RowDataCollection.has_changed. Doesn't read the rows."""
+        if self._lines is not None:
+            return self._changed
+        return super(LazyRowDataCollection, self).has_changed
+
+    def setChangeStatus(self, status):
+        """See RowDataCollection.setChangeStatus(). Doesn't read the rows."""
+        if self._lines is not None:
+            self._changed = status
+            return
+        super(LazyRowDataCollection, self).setChangeStatus(status)
+
+    def numberOfRows(self):
+        """See RowDataCollection.numberOfRows()."""
+        if self._lines is not None:
+            return len(self._lines)
+        return super(LazyRowDataCollection, self).numberOfRows()
+
+    def renderRows(self, start=0, stop=None):
+        """See RowDataCollection.renderRows().
+
+        If the rows haven't been read yet the raw lines are returned as
+        they were found in the file.
+        """
+        if self._lines is not None:
+            return [l.rstrip('\r\n') for l in self._lines[start:stop]]
+        return super(LazyRowDataCollection, self).renderRows(start, stop)
+
+    def renderJob(self):
+        """See RowDataCollection.renderJob(). Doesn't read the rows.
+
+        The data objects are still empty, so they're copied rather than
+        shared in case the job reads the rows.
+        """
+        if self._lines is None:
+            return super(LazyRowDataCollection, self).renderJob()
+        job = copy.copy(self)
+        job._updateCallback = None
+        job._journal = None
+        job._objects = [copy.deepcopy(o) for o in _withoutCallbacks(self._objects)]
+        return job
+
+
+def _withoutCallbacks(objects):
+    """Copy data objects without their update and column callbacks.
+
+    Args:
+        objects(list): the ADataRowObject's to copy.
+
+    Returns:
+        list - of shallow copies of objects with no callbacks.
+    """
+    out = []
+    for obj in objects:
+        obj = copy.copy(obj)
+        obj.update_callback = None
+        obj.column_callback = None
+        out.append(obj)
+    return out
+
+
+def runLoadJobs(jobs):
+    """Load the rows for a list of LazyRowDataCollection.loadJob()'s.
+
+    This is a module level function so that it can be run in another
+    process.
+
+    Args:
+        jobs(list): of the tuples returned by loadJob().
+
+    Returns:
+        list - for each job a list of (storage, values) tuples, one for
+            each data object, to pass to LazyRowDataCollection.setLoaded().
+    """
+    out = []
+    for reader, lines, objects in jobs:
+        collection = RowDataCollection.bulkInitCollection(objects)
+        reader(collection, lines)
+        columns = []
+        for obj in objects:
+            values = obj.data_collection
+            if obj.storage == st.CATEGORICAL:
+                values = values.tolist()
+            columns.append((obj.storage, values))
+        out.append(columns)
+    return out
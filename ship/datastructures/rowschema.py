@@ -0,0 +1,169 @@
+"""
+
+ Summary:
+    Contains the RowSchema class. This is used to read blocks of fixed
+    width rows from a dat file into a RowDataCollection.
+
+ Author:
+     SHIP contributors
+
+ Created:
+     16 Oct 2026
+
+ Copyright:
+     SHIP contributors 2026
+
+ TODO:
+
+ Updates:
+
+"""
+from __future__ import unicode_literals
+
+import re
+from operator import itemgetter
+
+import logging
+logger = logging.getLogger(__name__)
+"""logging references with a __name__ set to this module."""
+
+
+_schemas = {}
+"""RowSchema's built by collectionSchema() by key."""
+
+_WIDTH = re.compile(r'\{:\D*(\d+)')
+"""Finds the field width in a data object format_str, e.g. '{:>10}'."""
+
+
+def collectionSchema(key, collection, blanks=None):
+    """Get the RowSchema that reads rows in the layout they're printed in.
+
+    The schema is built from the collection with RowSchema.fromCollection()
+    the first time it's asked for and then shared by every collection with
+    the same key. If the data objects in collection don't match the shared
+    schema a new one is built for it.
+
+    Args:
+        key(str): identifies the type of collection, e.g. 'river.main'.
+        collection(RowDataCollection): the collection that will be read
+            into.
+        blanks=None(dict): see RowSchema.
+
+    Returns:
+        RowSchema - for the collection.
+    """
+    schema = _schemas.get(key, None)
+    data_types = tuple(collection.collectionTypes())
+    if schema is None or schema.data_types != data_types:
+        schema = RowSchema.fromCollection(collection, blanks)
+        _schemas.setdefault(key, schema)
+    return schema
+
+
+class RowSchema(object):
+    """Fixed width layout of the rows of a RowDataCollection in a dat file.
+
+    Declares the start and end of each column in the file rows. The column
+    slices are compiled into a single itemgetter, so each row is split in one
+    call, and whole blocks of rows are read at once with
+    RowDataCollection.extendColumns(). This lets each data object convert
+    all of its values in a single pass.
+
+    Fields for numeric data objects (those with a typecode) are passed on
+    as they are because int() and float() ignore the surrounding whitespace.
+    All other fields are stripped.
+
+    Example:
+        >>> schema = RowSchema([(rdt.CHAINAGE, 0, 10), (rdt.ELEVATION, 10, 20)])
+        >>> schema.read(collection, rows)
+    """
+
+    def __init__(self, columns, blanks=None):
+        """Constructor.
+
+        Args:
+            columns(list): (data_type, start, end) tuples giving the position
+                of each column in the rows.
+            blanks=None(dict): data_type keys with the value to use when
+                the field for that column is empty, e.g. None to apply the
+                data object default.
+        """
+        self.columns = tuple(tuple(c) for c in columns)
+        self.data_types = tuple(c[0] for c in self.columns)
+        self.blanks = dict(blanks) if blanks is not None else {}
+        self._numeric = None
+
+        slices = [slice(start, end) for data_type, start, end in self.columns]
+        if len(slices) == 1:
+            field = slices[0]
+            self._split = lambda row: (row[field],)
+        else:
+            self._split = itemgetter(*slices)
+
+    @classmethod
+    def fromCollection(cls, collection, blanks=None):
+        """Build a RowSchema from the print format of a collection.
+
+        The columns are placed one after the other using the field width
+        in each data object's format_str, so rows are read from the same
+        columns that they're written to.
+
+        Args:
+            collection(RowDataCollection): the collection to use.
+            blanks=None(dict): see __init__().
+
+        Raises:
+            ValueError: if a format_str doesn't have a field width.
+        """
+        columns = []
+        start = 0
+        for data_type in collection.collectionTypes():
+            obj = collection.dataObject(data_type)
+            match = _WIDTH.match(obj.format_str)
+            if match is None:
+                raise ValueError('No field width in format_str for %s' % data_type)
+            end = start + int(match.group(1))
+            columns.append((data_type, start, end))
+            start = end
+        return cls(columns, blanks)
+
+    def split(self, rows):
+        """Split rows into the raw field strings for each column.
+
+        Args:
+            rows(list): the file lines.
+
+        Returns:
+            dict - data_type keys with a sequence of the fields in each row.
+        """
+        if not rows:
+            return dict((k, []) for k in self.data_types)
+        return dict(zip(self.data_types, zip(*map(self._split, rows))))
+
+    def read(self, collection, rows):
+        """Read a block of rows into a collection.
+
+        Args:
+            collection(RowDataCollection): the collection to add the rows to.
+            rows(list): the file lines.
+
+        Raises:
+            KeyError: if any of the columns aren't in the collection.
+            ValueError: if any of the values are invalid. None of the rows
+                will be added.
+        """
+        if self._numeric is None:
+            self._numeric = frozenset(
+                k for k in self.data_types
+                if collection.dataObject(k).typecode is not None
+            )
+
+        columns = self.split(rows)
+        strip = type('').strip
+        for data_type, fields in columns.items():
+            if data_type in self.blanks:
+                blank = self.blanks[data_type]
+                columns[data_type] = [f if f else blank for f in map(strip, fields)]
+            elif not data_type in self._numeric:
+                columns[data_type] = list(map(strip, fields))
+        collection.extendColumns(columns)
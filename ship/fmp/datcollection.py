@@ -26,6 +26,8 @@
 from __future__ import unicode_literals
 
 import os
+import bisect
+from collections import deque
 from datetime import datetime
 
 from ship.fmp.datunits.isisunit import AUnit
@@ -33,9 +35,15 @@ from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 from ship.fmp.datunits.isisunit import CommentUnit
 from ship.fmp import fmpunitfactory as iuf
 from ship.fmp import unitgroups as ugroups
+from ship.fmp.unitnetwork import UnitNetwork
 from ship.utils import utilfunctions as uf
 from ship.utils import filetools as ft
 
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
 import logging
 logger = logging.getLogger(__name__)
 """logging references with a __name__ set to this module."""
@@ -49,9 +57,20 @@ class DatCollection(object):
 
     Each unit that is loaded is added to this class. They can then be accessed
     through the convenience methods outlined here.
+
+    Note:
+        The units are indexed by name, type and category so they can be
+        found quickly. Use addUnit(), removeUnit(), setUnit(), etc to change
+        the units and the index is kept up to date. If self.units is changed
+        directly, or any units are renamed, call rebuildIndices() afterwards.
+        Some direct changes are noticed, like units being inserted or
+        removed, or a unit that is found having moved, but not all of them.
     """
     FULL_PATH, DIRECTORY, FILENAME, FILENAME_AND_EXTENSION = range(4)
 
+    ORDER_GAP = 1 << 16
+    """Spacing of the order tags given to the units. See _insertUnit()."""
+
     def __init__(self, path_holder):
         """Constructor.
 
@@ -72,6 +91,233 @@ class DatCollection(object):
         self._max = len(self.units)
         self._current = 0
 
+        # (start, end, unit) byte offsets of the units in the file they were
+        # read from, in file order. Only set by the DatLoader 'mmap' option
+        self.unit_offsets = []
+        # (hash, number of lines, unit) of the file lines that each unit was
+        # read from, in file order. Used by refresh(). Only kept when
+        # incremental is set
+        self.unit_sources = []
+        # The file that the units were loaded from. Used by
+        # write(incremental=True) to copy the text of unchanged units
+        self.source_path = None
+        # Default for write(incremental=None). Set by the DatLoader for
+        # 'lazy' and 'mmap' loads so untouched units are written verbatim
+        self.incremental = False
+
+        self._resetIndices()
+
+    def _resetIndices(self):
+        """Clear the unit lookups.
+
+        The lookups let units be found by name, type, etc without searching
+        self.units. Each unit is given an order tag; tags increase through
+        self.units and _tags holds them in the same order. A unit's position
+        is found with a bisect of _tags, so the tags don't need to change
+        when units are inserted before it. New tags are put half way between
+        their neighbours and all of the tags are only renumbered when there
+        is no space left.
+        """
+        self._tags = []
+        """Order tags of the units in self.units, in the same order."""
+        self._order = {}
+        """Lookup of unit to its order tag."""
+        self._keys = {}
+        """Lookup of unit to the (name, name_ds, unit_type, unit_category) it was indexed with."""
+        self._by_name = {}
+        self._by_name_type = {}
+        self._by_name_ds = {}
+        self._by_type = {}
+        self._by_category = {}
+        self._network = None
+        """UnitNetwork of the units. Built the first time network() is called."""
+
+    def rebuildIndices(self):
+        """Update the unit lookups after self.units or unit names are changed.
+
+        Only needed if units are renamed, or if self.units is changed
+        directly rather than through the methods of this class.
+        """
+        self._rebuildIndices()
+
+    def _rebuildIndices(self):
+        """Rebuild all of the unit lookups from self.units."""
+        self._resetIndices()
+        for u in self.units:
+            self._indexUnit(u)
+        self._renumber()
+
+    def _renumber(self):
+        """Give every unit a new, evenly spaced, order tag."""
+        gap = DatCollection.ORDER_GAP
+        self._tags = list(range(gap, (len(self.units) + 1) * gap, gap))
+        self._order = dict(zip(self.units, self._tags))
+
+    def _indicesValid(self):
+        """Quick check that self.units hasn't been changed directly."""
+        units = self.units
+        if len(self._tags) != len(units):
+            return False
+        if units and (self._order.get(units[0]) != self._tags[0] or
+                      self._order.get(units[-1]) != self._tags[-1]):
+            return False
+        return True
+
+    def _checkIndices(self):
+        """Rebuild the unit lookups if self.units has been changed directly."""
+        if not self._indicesValid():
+            self._rebuildIndices()
+
+    def _inPlace(self, units):
+        """Check that units are all still where the lookups say they are.
+
+        Return:
+            bool - False if any of the units has been replaced or moved in
+                self.units directly.
+        """
+        tags = self._tags
+        for u in units:
+            index = bisect.bisect_left(tags, self._order[u])
+            if index >= len(self.units) or not self.units[index] is u:
+                return False
+        return True
+
+    def _lookup(self, find):
+        """Find units with find() and check they are still in place.
+
+        If they aren't self.units has been changed directly, so the lookups
+        are rebuilt and find() is called again.
+
+        Args:
+            find(func): returns a list of units from the lookups.
+
+        Return:
+            list - of the units found, in collection order.
+        """
+        self._checkIndices()
+        units = find()
+        if not self._inPlace(units):
+            self._rebuildIndices()
+            units = find()
+        return self._sorted(units)
+
+    def _indexUnit(self, unit):
+        """Add unit to the name, type and category lookups."""
+        keys = (unit.name, unit.name_ds, unit.unit_type, unit.unit_category)
+        self._keys[unit] = keys
+        self._by_name.setdefault(keys[0], []).append(unit)
+        self._by_name_type.setdefault((keys[0], keys[2]), []).append(unit)
+        self._by_name_ds.setdefault(keys[1], []).append(unit)
+        self._by_type.setdefault(keys[2], []).append(unit)
+        self._by_category.setdefault(keys[3], []).append(unit)
+
+    def _unindexUnit(self, unit):
+        """Remove unit from the name, type and category lookups."""
+        keys = self._keys.pop(unit, None)
+        if keys is None:
+            return
+        for lookup, key in (
+                (self._by_name, keys[0]), (self._by_name_type, (keys[0], keys[2])),
+                (self._by_name_ds, keys[1]), (self._by_type, keys[2]),
+                (self._by_category, keys[3])):
+            bucket = lookup[key]
+            bucket.remove(unit)
+            if not bucket:
+                del lookup[key]
+
+    def _insertUnit(self, index, unit):
+        """Insert unit into self.units at index and update the lookups."""
+        self._checkIndices()
+        self.units.insert(index, unit)
+        index = min(index, len(self._tags))
+
+        tags = self._tags
+        lo = tags[index - 1] if index > 0 else 0
+        hi = tags[index] if index < len(tags) else lo + 2 * DatCollection.ORDER_GAP
+        if hi - lo < 2:
+            self._renumber()
+        else:
+            tag = (lo + hi) // 2
+            tags.insert(index, tag)
+            self._order[unit] = tag
+        self._indexUnit(unit)
+        if self._network is not None:
+            self._network.addUnit(unit)
+
+    def _replaceUnit(self, index, unit):
+        """Put unit in place of the unit at index and update the lookups."""
+        self._checkIndices()
+        old = self.units[index]
+        self.units[index] = unit
+        self._unindexUnit(old)
+        del self._order[old]
+        self._order[unit] = self._tags[index]
+        self._indexUnit(unit)
+        if self._network is not None:
+            self._network.removeUnit(old)
+            self._network.addUnit(unit)
+
+    def _deleteUnit(self, index):
+        """Delete the unit at index from self.units and update the lookups."""
+        self._checkIndices()
+        unit = self.units.pop(index)
+        del self._tags[index]
+        del self._order[unit]
+        self._unindexUnit(unit)
+        if self._network is not None:
+            self._network.removeUnit(unit)
+
+        if self._ic_index != -999 and index < self._ic_index:
+            self._ic_index -= 1
+        if self._gis_index != -999 and index < self._gis_index:
+            self._gis_index -= 1
+
+    def _position(self, unit):
+        """Get the index of unit in self.units.
+
+        Return:
+            int - the index of unit, or -1 if it isn't in the collection.
+        """
+        self._checkIndices()
+        tag = self._order.get(unit)
+        if tag is None:
+            return -1
+        index = bisect.bisect_left(self._tags, tag)
+        if index < len(self.units) and self.units[index] is unit:
+            return index
+
+        # self.units has been changed directly
+        self._rebuildIndices()
+        return self._position(unit)
+
+    def _sorted(self, units):
+        """Sort units into the same order they are in the collection."""
+        return sorted(units, key=self._order.__getitem__)
+
+    def _named(self, name, unit_type=None):
+        """Get the units with the given name, in collection order.
+
+        The units in the lookups are checked to make sure they still have
+        the name they were indexed with. Units that have been renamed since
+        they were added aren't found by their new name until
+        rebuildIndices() is called.
+
+        Args:
+            name(str): the AUnit.name to find.
+            unit_type=None(str): if given only units of this type are found.
+
+        Return:
+            list - of the units named name.
+        """
+        def lookup():
+            if unit_type is None:
+                units = self._by_name.get(name, ())
+            else:
+                units = self._by_name_type.get((name, unit_type), ())
+            return [u for u in units if u.name == name]
+
+        return self._lookup(lookup)
+
     def __iter__(self):
         """Return an iterator for the units list"""
         return iter(self.units)
@@ -145,29 +391,29 @@ class DatCollection(object):
                 unit._unit_type == 'initial_conditions':
             if unit._unit_type == 'header':
                 if self.units and self.units[0]._unit_type == 'header':
-                    self.units[0] = unit
+                    self._replaceUnit(0, unit)
                 else:
-                    self.units.insert(0, unit)
+                    self._insertUnit(0, unit)
 
             elif unit._unit_type == 'gis_info':
                 if self._gis_index == -999:
-                    self.units.append(unit)
+                    self._insertUnit(len(self.units), unit)
                     self._gis_index = len(self.units) - 1
                 else:
-                    self.units[self._gis_index] = unit
+                    self._replaceUnit(self._gis_index, unit)
 
             else:
                 # If it already exists in the collection
                 if self._ic_index != -999:
-                    self.units[self._ic_index] = unit
+                    self._replaceUnit(self._ic_index, unit)
                 else:
                     # If gis_info unit exists put it before that, otherwise it
                     # goes on the end
                     if self._gis_index == -999:
-                        self.units.append(unit)
+                        self._insertUnit(len(self.units), unit)
                         self._ic_index = len(self.units) - 1
                     else:
-                        self.units.insert(self._gis_index, unit)
+                        self._insertUnit(self._gis_index, unit)
                         self._ic_index = self._gis_index - 1
 
             self._max = len(self.units)
@@ -185,11 +431,11 @@ class DatCollection(object):
         elif self._gis_index != -999 and index > self._gis_index:
             index = self._gis_index
         elif index > len(self.units):
-            self.units.append(unit)
+            self._insertUnit(len(self.units), unit)
             index = None
 
         if index is not None:
-            self.units.insert(index, unit)
+            self._insertUnit(index, unit)
             if self._ic_index != -999:
                 self._ic_index += 1
             if self._gis_index != -999:
@@ -199,12 +445,117 @@ class DatCollection(object):
 
         if not self._ic_index == -999 and update_node_count and unit.has_ics:
             header = self.units[0]
-            temp = unit.icLabels()
+            rows = []
             for name in unit.icLabels():
-                ics[rdt.LABEL] = name
-                node_count = self.units[self._ic_index].addRow(ics, unit._unit_type,
-                                                               **kwargs)
-                header.head_data['node_count'].value = node_count
+                row = dict(ics)
+                row[rdt.LABEL] = name
+                rows.append(row)
+            node_count = self.units[self._ic_index].addRows(rows, unit._unit_type)
+            header.head_data['node_count'].value = node_count
+
+    def addUnits(self, units, index=None, **kwargs):
+        """Add a list of new units to the collection in one go.
+
+        The bulk equivalent of calling addUnit() for each of the units, in
+        order, but much quicker for a large number of units. The units are
+        inserted together at index, the initial conditions of all of them
+        are added in a single InitialConditionsUnit.addRows() call and the
+        header node_count is only updated once.
+
+        Everything is checked before the collection is changed, so if an
+        error is raised none of the units or initial conditions are added.
+
+        Header, initial conditions and gis_info units can't be added this
+        way. Use addUnit() for those.
+
+        Accepts ``**kwargs``:
+
+            update_node_count(bool): if False no initial conditions are
+                added for any of the units and the node count at the top of
+                the .dat file isn't changed. Defaults to True.
+            ics(dict | list): initial conditions for the units, as in
+                addUnit(). Either a dict used for all of the units or a list
+                with a dict for each unit. A None in the list means that no
+                initial conditions are added for that unit.
+
+        Args:
+            units(list): the AUnit's to add, in the order they should be in.
+            index=None(int): Index to insert the first unit at. The same
+                rules as addUnit() apply.
+
+        Raises:
+            AttributeError: When a non-isisunit type is given.
+            ValueError: if a unit is a header, initial conditions or
+                gis_info unit, or is already in the collection, or if ics is
+                a list that isn't the same length as units. Also raised by
+                the initial conditions if any of the values are invalid.
+        """
+        update_node_count = kwargs.get('update_node_count', True)
+        ics = kwargs.get('ics', {})
+        if isinstance(ics, dict):
+            ics = [ics] * len(units)
+        elif not len(ics) == len(units):
+            raise ValueError('ics must be a dict or the same length as units')
+
+        added = set()
+        for u in units:
+            if not isinstance(u, AUnit):
+                raise AttributeError('Given unit is not of type AUnit')
+            if u._unit_type in ('header', 'gis_info', 'initial_conditions'):
+                raise ValueError('Use addUnit() to add %s units' % u._unit_type)
+            if id(u) in added or u in self._order:
+                raise ValueError('Unit %s is already in the collection' % u.name)
+            added.add(id(u))
+        if not units:
+            return
+
+        self._checkIndices()
+        if index is None or index > len(self.units):
+            index = len(self.units)
+        if self._ic_index != -999 and index > self._ic_index:
+            index = self._ic_index
+        elif self._gis_index != -999 and index > self._gis_index:
+            index = self._gis_index
+
+        # Adding the initial conditions is the only thing that can fail
+        # and it doesn't change anything if it does
+        if not self._ic_index == -999 and update_node_count:
+            rows = []
+            unit_types = []
+            for u, unit_ics in zip(units, ics):
+                if unit_ics is None or not u.has_ics:
+                    continue
+                for name in u.icLabels():
+                    row = dict(unit_ics)
+                    row[rdt.LABEL] = name
+                    rows.append(row)
+                    unit_types.append(u._unit_type)
+            if rows:
+                node_count = self.units[self._ic_index].addRows(rows, unit_types)
+                self.units[0].head_data['node_count'].value = node_count
+
+        self.units[index:index] = units
+        if self._ic_index != -999:
+            self._ic_index += len(units)
+        if self._gis_index != -999:
+            self._gis_index += len(units)
+        self._max = len(self.units)
+
+        # Spread the new order tags evenly between the neighbours
+        tags = self._tags
+        lo = tags[index - 1] if index > 0 else 0
+        hi = tags[index] if index < len(tags) else lo + (len(units) + 1) * DatCollection.ORDER_GAP
+        step = (hi - lo) // (len(units) + 1)
+        if step < 1:
+            self._renumber()
+        else:
+            new_tags = [lo + step * (i + 1) for i in range(len(units))]
+            tags[index:index] = new_tags
+            self._order.update(zip(units, new_tags))
+        for u in units:
+            self._indexUnit(u)
+            if self._network is not None:
+                self._network.addUnit(u)
 
     def removeUnit(self, unit, unit_type=None, **kwargs):
         """Remove one of the units previously added to the list.
@@ -250,7 +601,7 @@ class DatCollection(object):
                         logger.warning('No intitial conditions found for initial conditions label: ' + name)
 
             header.head_data['node_count'].value = ic.node_count
-            del self.units[index]
+            self._deleteUnit(index)
             self._max = len(self.units)
             return True
 
@@ -276,49 +627,167 @@ class DatCollection(object):
         Return:
             int - the index of the given unit, or -1 if it could not be found.
         """
-        index = -1
         if isinstance(unit, AUnit):
-            index = self.units.index(unit)
+            return self._position(unit)
         elif uf.isString(unit):
-            for i, u in enumerate(self.units):
-                if u.name == unit:
-                    if unit_type == u.unit_type:
-                        index = i
-                        break
-                    elif unit_type is None:
-                        index = i
-                        break
-        else:
-            index = -1
-
-        return index
+            if unit_type is None:
+                units = self._named(unit)
+            else:
+                units = self._named(unit, unit_type)
+            if units:
+                return self._position(units[0])
+        return -1
 
-    def getPrintableContents(self):
+    def getPrintableContents(self, workers=None):
         """Get the formatted contents of each isisunit in the collection.
 
         Iterates through each of the units in the collection and
         calls their getData() method.
 
+        Args:
+            workers=None(int): the number of processes to format the units
+                in. See iterPrintableContents().
+
         Returns:
             List containing all lines for each unit formatted for printing
                 out to the dat file.
         """
-        out_data = []
+        return list(self.iterPrintableContents(workers))
+
+    def iterPrintableContents(self, workers=None):
+        """Generator version of getPrintableContents().
+
+        Calls the iterData() method of each unit in turn, so only the lines
+        of the unit currently being formatted are held in memory.
+
+        If workers is given the units are split into chunks, in order, and
+        formatted in a ProcessPoolExecutor instead. The output is exactly
+        the same. See _iterRendered().
+
+        Args:
+            workers=None(int): the number of processes to use. If None, < 2
+                or concurrent.futures isn't available the units are
+                formatted in this process.
+
+        Yields:
+            str - each line formatted for printing out to the dat file.
+        """
         logger.debug('Returning printable unit data')
 
         # For each unit call the isisunit object and ask it
         # for its .DAT file formatted text to save to file
-        for u in self.units:
-            logger.debug('Unit Type: ' + u._unit_type)
-            out_data.extend(u.getData())
+        for lines in self._iterRendered(self.units, workers):
+            for line in lines:
+                yield line
+
+    def _iterRendered(self, units, workers=None):
+        """Generator of the formatted lines of each of units, in order.
+
+        Without workers this is the iterData() of each unit. Otherwise the
+        units are split into contiguous chunks that are formatted in a
+        ProcessPoolExecutor by runRenderJobs(). Each unit is sent as its
+        AUnit.renderJob() rather than being pickled with everything that
+        refers to it. Only a few chunks per worker are sent ahead of the
+        one being returned, so the formatted contents of the whole file are
+        never held at once.
+
+        Args:
+            units(list): the AUnit's to format.
+            workers=None(int): the number of processes to use.
+
+        Yields:
+            iterable - of the str lines of each unit.
+        """
+        if ProcessPoolExecutor is None or workers is None or workers < 2 or len(units) < 2:
+            for u in units:
+                logger.debug('Unit Type: ' + u._unit_type)
+                yield u.iterData()
+            return
+
+        size = uf.chunkSize(len(units), workers)
+        with ProcessPoolExecutor(workers) as executor:
+            pending = deque()
+            for i in range(0, len(units), size):
+                jobs = [u.renderJob() for u in units[i:i + size]]
+                pending.append(executor.submit(runRenderJobs, jobs))
+                if len(pending) > workers * 2:
+                    for lines in pending.popleft().result():
+                        yield lines
+            while pending:
+                for lines in pending.popleft().result():
+                    yield lines
+
+    def iterIncrementalContents(self, source, workers=None):
+        """Version of iterPrintableContents() that reuses the original text.
+
+        Units that haven't changed since they were loaded (see
+        AUnit.has_changed) are copied from the lines they were read from
+        in source instead of being formatted again. The lines are only
+        copied if their hash still matches the one taken when the unit was
+        read, so if the file has been changed since the unit is formatted
+        as usual.
+
+        Args:
+            source(filetools.MappedFile): the file the units were loaded
+                from, or None to format every unit.
+            workers=None(int): the number of processes to format the
+                changed units in. See iterPrintableContents().
+
+        Yields:
+            str - each line formatted for printing out to the dat file.
+        """
+        # Imported here because the loader imports this module
+        from ship.utils.fileloaders.datloader import sourceDigest
+
+        reuse = [
+            source is not None and u._source is not None and not u.has_changed
+            for u in self.units
+        ]
+        rendered = self._iterRendered(
+            [u for u, r in zip(self.units, reuse) if not r], workers
+        )
+        for u, r in zip(self.units, reuse):
+            if not r:
+                for line in next(rendered):
+                    yield line
+                continue
+
+            start, end, digest = u._source
+            lines = source[start:end]
+            if sourceDigest(lines) == digest:
+                for line in lines:
+                    yield line.rstrip('\n')
+            else:
+                for line in u.iterData():
+                    yield line
+        # Shuts down any process pool
+        rendered.close()
 
-        return out_data
+    def _openSource(self):
+        """Memory map the file that the units were loaded from.
 
-    def write(self, filepath=None, overwrite=False):
+        Returns:
+            filetools.MappedFile - or None if there's no source_path or it
+                can't be opened.
+        """
+        if self.source_path is None:
+            return None
+        try:
+            return ft.MappedFile(self.source_path)
+        except (IOError, OSError, ValueError):
+            logger.warning('Unable to open source file: %s' % self.source_path)
+            return None
+
+    def write(self, filepath=None, overwrite=False, atomic=False,
+              buffer_size=ft.WRITE_BUFFER, incremental=None, workers=None):
         """Write the contents of this file to disk.
 
         Writes out to file in the format required for reading by ISIS/FMP.
 
+        The units are formatted as they are written, using
+        iterPrintableContents(), so the contents of the whole file are never
+        held in memory at once. See filetools.writeLines() for details.
+
         Note:
             If a filepath is not provided and the settings in this objects
             PathHolder class have not been updated you will write over the
@@ -330,6 +799,19 @@ class DatCollection(object):
                 object path_holder object will be used.
             overwrite=False(bool): if the file already exists it will raise
                 an IOError.
+            atomic=False(bool): if True the file is written to a temporary
+                file first and then renamed to filepath, so an existing file
+                is never left partly written.
+            buffer_size=ft.WRITE_BUFFER(int): the size in bytes of the write
+                buffer.
+            incremental=None(bool): if True the units that haven't changed
+                since they were loaded are copied from source_path rather
+                than being formatted again. See iterIncrementalContents().
+                If filepath is source_path the write is always atomic. If
+                None self.incremental is used, which is True for models
+                loaded with the DatLoader 'lazy' or 'mmap' options.
+            workers=None(int): the number of processes to format the units
+                in. Worth using for large models. See iterPrintableContents().
 
         Raises:
             IOError - If unable to write to file.
@@ -340,8 +822,33 @@ class DatCollection(object):
         if not overwrite and os.path.exists(filepath):
             raise IOError('filepath %s already exists. Set overwrite=True to ignore this warning.' % filepath)
 
-        contents = self.getPrintableContents()
-        ft.writeFile(contents, filepath)
+        if incremental is None:
+            incremental = self.incremental
+        if not incremental:
+            ft.writeLines(self.iterPrintableContents(workers), filepath,
+                          buffer_size=buffer_size, atomic=atomic)
+            return
+
+        source = self._openSource()
+        if source is not None and os.path.abspath(filepath) == os.path.abspath(self.source_path):
+            # Can't overwrite the file while it's being read from
+            atomic = True
+        def contents():
+            # Closed before writeLines() renames the file, as that fails on
+            # Windows if it's still mapped
+            try:
+                for line in self.iterIncrementalContents(source, workers):
+                    yield line
+            finally:
+                if source is not None:
+                    source.close()
+
+        try:
+            ft.writeLines(contents(), filepath, buffer_size=buffer_size,
+                          atomic=atomic)
+        finally:
+            if source is not None:
+                source.close()
 
     def unitsByCategory(self, unit_keys):
         """Return all the units in the requested unit(s).
@@ -366,12 +873,13 @@ class DatCollection(object):
         if uf.isString(unit_keys):
             unit_keys = [unit_keys]
 
-        types = []
-        for u in self.units:
-            if u.unit_category in unit_keys:
-                types.append(u)
+        def lookup():
+            types = []
+            for k in set(unit_keys):
+                types.extend(self._by_category.get(k, ()))
+            return types
 
-        return types
+        return self._lookup(lookup)
 
     def unitsByType(self, type_keys):
         """Return all of the units of the requested type.
@@ -401,12 +909,13 @@ class DatCollection(object):
         if uf.isString(type_keys):
             type_keys = [type_keys]
 
-        types = []
-        for u in self.units:
-            if u.unit_type in type_keys:
-                types.append(u)
+        def lookup():
+            types = []
+            for k in set(type_keys):
+                types.extend(self._by_type.get(k, ()))
+            return types
 
-        return types
+        return self._lookup(lookup)
 
     def allUnits(self):
         """Get all of the isisunit in the collection
@@ -463,24 +972,84 @@ class DatCollection(object):
             else:
                 return False
 
-        for u in self.units:
-            if u.name == key:
-                if unit_type is None and unit_category is None:
-                    return u
-                elif unit_type and u.unit_type == unit_type:
-                    return u
-                elif unit_category and u.unit_category == unit_category:
-                    return u
+        if unit_type and unit_category is None:
+            units = self._named(key, unit_type)
+            return units[0] if units else False
+
+        for u in self._named(key):
+            if unit_type is None and unit_category is None:
+                return u
+            elif unit_type and u.unit_type == unit_type:
+                return u
+            elif unit_category and u.unit_category == unit_category:
+                return u
         else:
             return False
 
+    def refresh(self, arg_dict={}):
+        """Update the collection to match the current contents of its file.
+
+        Only the units that have changed in the file since it was loaded are
+        read again. Units that haven't changed are kept as the same objects.
+        See DatLoader.refreshDat() for details.
+
+        Args:
+            arg_dict={}(dict): load settings for the units that are read.
+                See DatLoader.refreshDat().
+
+        Returns:
+            dict - 'added': list of the units that were read from the file,
+                'removed': list of the units that are no longer in the file.
+        """
+        # Imported here because the loader imports this module
+        from ship.utils.fileloaders.datloader import DatLoader
+
+        loader = DatLoader()
+        changes = loader.refreshDat(self, arg_dict)
+        refreshed = loader.units
+        self.units = refreshed.units
+        self.unit_sources = refreshed.unit_sources
+        self.unit_offsets = refreshed.unit_offsets
+        self.source_path = refreshed.source_path
+        self.incremental = refreshed.incremental
+        self._ic_index = refreshed._ic_index
+        self._gis_index = refreshed._gis_index
+        self._max = len(self.units)
+        self._rebuildIndices()
+        return changes
+
+    def unitAtOffset(self, offset):
+        """Fetch the unit that was read from a byte offset in the .dat file.
+
+        Only works if the collection was loaded with the DatLoader 'mmap'
+        option. Units added since then aren't in the file so can't be found
+        this way, and units that have been removed won't be returned.
+
+        Args:
+            offset(int): byte offset in the file that the model was loaded
+                from.
+
+        Returns:
+            isisunit object read from the given offset, or False if there
+                isn't one.
+        """
+        # (offset + 1,) sorts after every entry starting at or before offset
+        i = bisect.bisect_left(self.unit_offsets, (offset + 1,)) - 1
+        if i < 0:
+            return False
+        start, end, unit = self.unit_offsets[i]
+        if offset >= end or not unit in self.units:
+            return False
+        return unit
+
     def setUnit(self, unit):
         """Replace the contents of a certain unit with the given one.
 
         Each isisunit have a .name and .unit_type variable. The .nane and
         .unit_type will be checked against the collection. If the name and
         matching unit_type is found within thecollection that unit will be 
-        replaced with the given one. 
+        replaced with the given one. If there is more than one the first
+        will be replaced.
 
         Args:
             unit (AUnit): the unit to replace.
@@ -490,19 +1059,19 @@ class DatCollection(object):
             be found.
         """
         try:
-            name = unit._name
+            name = unit.name
             utype = unit._unit_type
         except (NameError, AttributeError) as err:
             logger.error('Provided AUnit does not have a name and/or unit_type variable - Data Corruption!')
             logger.exception(err)
             raise
 
-        index = self.index(unit._name, unit._unit_type)
-        self.units[index] = unit
+        existing = self._named(name, utype)
+        if not existing:
+            raise AttributeError('No %s unit named %s in the collection' % (utype, name))
 
-        for i, u in enumerate(self.units, 0):
-            if u.name == unit.name:
-                self.units[i] = unit
+        if not existing[0] is unit:
+            self._replaceUnit(self._position(existing[0]), unit)
 
     def numberOfUnits(self):
         """The number of units currently held in the collection.
@@ -512,65 +1081,56 @@ class DatCollection(object):
         """
         return len(self.units)
 
-    def linkedUnits(self, unit):
+    def network(self):
+        """Get the graph of the connections between the units.
+
+        The UnitNetwork is built the first time this is called and is then
+        kept up to date by addUnit(), removeUnit() and setUnit(). It can be
+        used to find the units linked to a unit, the units that can be
+        reached from it, the connected groups of units and any labels that
+        are referenced but don't exist. See UnitNetwork for details.
+
+        Note:
+            If the names or link labels (e.g. spills, laterals, remote_us)
+            of a unit are changed after it has been added, call
+            network().updateUnit(unit) to update it.
+
+        Return:
+            UnitNetwork - for the units in this collection.
         """
+        self._checkIndices()
+        if self._network is None:
+            self._network = UnitNetwork(self)
+        return self._network
+
+    def linkedUnits(self, unit):
+        """Get all of the units that are directly associated with unit.
+
+        See unitgroups.LinkedUnits for the details of what is returned.
+
+        The links are found with network(). The labels of unit are read again
+        first in case they have changed, but changes to the other units
+        are only picked up if they've been updated in the network.
+
+        Args:
+            unit(AUnit): the unit to find the links for.
+
+        Return:
+            LinkedUnits - containing the units linked to unit.
         """
+        network = self.network()
+        if unit in network:
+            network.updateUnit(unit)
+
         linksect = ugroups.LinkedUnits(unit)
         index = self.index(unit)
         linksect.addLinkedUnit(self.units[index - 1], 'upstream')
         linksect.addLinkedUnit(self.units[index + 1], 'downstream')
 
-        unit_links = [val for val in unit.linkLabels().values() if val.strip() != '']
-        unit_links = set(unit_links)
-        associates = []         # Used for named_units in linksect
-        temp_junctions = []     # Store any junctions that refer to this unit
-
-        # Store the name, name_ds and index of the units in this collection
-        # so that we don't have to loop twice
-        temp_locations = {}
-        for i, u in enumerate(self.units):
-
-            # Add the name, name_ds and index of all the units
-            # Same name's/name_ds' are stored in a list
-            if not u.name in temp_locations.keys():
-                temp_locations[u.name] = []
-            if u.name_ds != 'unknown' and not u.name_ds in temp_locations.keys():
-                temp_locations[u.name_ds] = []
-            if not i in temp_locations[u.name]:
-                temp_locations[u.name].append(i)
-            if u.name_ds != 'unknown' and not i in temp_locations[u.name_ds]:
-                temp_locations[u.name_ds].append(i)
-
-            # Check if unit is in the linkLabels of u and add to associates or
-            # temp_junctions as appropriate if it is
-            links = [val for val in u.linkLabels().values() if val.strip() != '']
-            if not unit_links.isdisjoint(links):
-                if u.unit_type == 'junction':
-                    temp_junctions.append((u, links))
-                else:
-                    if not u == unit:
-                        associates.append(u)
-
-        # Check all of the junction linkLabels that we found and put the actual
-        # unit in the list for each name it references
-        junctions = []
-        if temp_junctions:
-            for i, junc in enumerate(temp_junctions):
-                junctions.append((junc[0], []))
-                for link in junc[1]:
-                    for index in temp_locations[link]:
-                        if not self.units[index] in junctions[i][1] and not \
-                                self.units[index].unit_type == 'junction':
-                            junctions[i][1].append(self.units[index])
-
-        linksect.named_units = associates
-        linksect.junctions = junctions
-
-        del junctions
-        del associates
-        del temp_junctions
-        del temp_locations
-
+        linksect.named_units = network.namedUnits(unit)
+        linksect.junctions = [
+            (j, network.junctionUnits(j)) for j in network.junctions(unit)
+        ]
         return linksect
 
     @classmethod
@@ -596,7 +1156,8 @@ class DatCollection(object):
                 that is included in units. The list must be the same length
                 as units, or not included. If no kwargs for a particular unit
                 are to be given an empty dict should be used as a placholder in
-                the list. 
+                the list. The units are all added with addUnits(), so only
+                the 'ics' and 'update_node_count' kwargs are used.
 
         Args:
             dat_path(str): the path to set for the newly created .dat file.
@@ -616,6 +1177,24 @@ class DatCollection(object):
         dat.addUnit(hunit, update_node_count=False)
         dat.addUnit(cunit, update_node_count=False)
         dat.addUnit(icunit, update_node_count=False)
-        for i, u in enumerate(units):
-            dat.addUnit(u, **unit_kwargs[i])
+        ics = [
+            kw.get('ics', {}) if kw.get('update_node_count', True) else None
+            for kw in unit_kwargs
+        ]
+        dat.addUnits(units, ics=ics)
         return dat
+
+
+def runRenderJobs(units):
+    """Format a chunk of units for DatCollection._iterRendered().
+
+    This is a module level function so that it can be run in another
+    process.
+
+    Args:
+        units(list): of the AUnit.renderJob()'s to format.
+
+    Returns:
+        list - of the getData() lines of each unit.
+    """
+    return [u.getData() for u in units]
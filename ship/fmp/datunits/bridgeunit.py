@@ -34,6 +34,7 @@ from collections import OrderedDict
 from ship.fmp.datunits.isisunit import AUnit
 from ship.datastructures import dataobject as do
 from ship.datastructures.rowdatacollection import RowDataCollection
+from ship.datastructures.rowschema import RowSchema, collectionSchema
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 from ship.fmp.headdata import HeadDataItem
 from ship.utils.tools import geometry
@@ -58,6 +59,14 @@ class BridgeUnit (AUnit):
     UNIT_CATEGORY = 'bridge'
     FILE_KEY = None
     FILE_KEY2 = None
+    LAZY_ROWS = True
+
+    # The embankment is written right aligned after the roughness, so it
+    # ends up in the same column as it's read from here
+    GEOMETRY_SCHEMA = RowSchema([
+        (rdt.CHAINAGE, 0, 10), (rdt.ELEVATION, 10, 20),
+        (rdt.ROUGHNESS, 20, 30), (rdt.EMBANKMENT, 40, 51),
+    ])
 
     def __init__(self, **kwargs):
         """Constructor.
@@ -88,8 +97,12 @@ class BridgeUnit (AUnit):
                                            rdt.ROUGHNESS: 0})
 
         open_dobjs = [
-            do.FloatData(rdt.OPEN_START, format_str='{:>10}', no_of_dps=3, update_callback=self.checkOpening),
-            do.FloatData(rdt.OPEN_END, format_str='{:>10}', no_of_dps=3, update_callback=self.checkOpening),
+            do.FloatData(rdt.OPEN_START, format_str='{:>10}', no_of_dps=3,
+                         update_callback=self.checkOpening,
+                         column_callback=self.checkOpeningColumns),
+            do.FloatData(rdt.OPEN_END, format_str='{:>10}', no_of_dps=3,
+                         update_callback=self.checkOpening,
+                         column_callback=self.checkOpeningColumns),
             do.FloatData(rdt.SPRINGING_LEVEL, format_str='{:>10}', no_of_dps=3, default=0.0),
             do.FloatData(rdt.SOFFIT_LEVEL, format_str='{:>10}', no_of_dps=3, default=0.0),
         ]
@@ -115,7 +128,7 @@ class BridgeUnit (AUnit):
         """
         return self.row_data['opening'].row_count
 
-    def readUnitData(self, unit_data, file_line):
+    def readUnitData(self, unit_data, file_line, **kwargs):
         """Reads the unit data into the geometry objects.
 
         See Also:
@@ -124,10 +137,14 @@ class BridgeUnit (AUnit):
         Args:
             unit_data (list): The section of the isis dat file pertaining to
                 this section.
+            **kwargs:
+                lazy=False(bool): if True the rows are not read until they're
+                    used. See AUnit._readRows().
         """
+        lazy = kwargs.get('lazy', False)
         file_line = self._readHeadData(unit_data, file_line)
-        file_line = self._readMainRowData(unit_data, file_line)
-        file_line = self._readAdditionalRowData(unit_data, file_line)
+        file_line = self._readMainRowData(unit_data, file_line, lazy)
+        file_line = self._readAdditionalRowData(unit_data, file_line, lazy)
         file_line -= 1
         return file_line
 
@@ -142,7 +159,7 @@ class BridgeUnit (AUnit):
         """
         raise NotImplementedError
 
-    def _readMainRowData(self, unit_data, file_line):
+    def _readMainRowData(self, unit_data, file_line, lazy=False):
         """Reads the units rows into the row collection.
 
         This is all the geometry data that occurs after the no of rows variable in
@@ -150,32 +167,44 @@ class BridgeUnit (AUnit):
 
         Args:
             unit_data (list): the data pertaining to this unit.
+            lazy=False(bool): if True don't read the rows until they're used.
         """
         no_of_chainage_rows = int(unit_data[file_line].strip())
         file_line += 1
         out_line = file_line + no_of_chainage_rows
+        self._readRows(unit_data[file_line:out_line], BridgeUnit._readGeometryRows,
+                       lazy=lazy)
+        return out_line
+
+    @staticmethod
+    def _readGeometryRows(collection, rows):
+        """Read the geometry rows into the 'main' RowDataCollection.
+
+        Args:
+            collection(RowDataCollection): the 'main' row data.
+            rows(list): the geometry lines from the file.
+        """
         try:
-            # Load the geometry data
-            for i in range(file_line, out_line):
-
-                chain = unit_data[i][0:10].strip()
-                elev = unit_data[i][10:20].strip()
-                rough = unit_data[i][20:30].strip()
-                try:
-                    bank = unit_data[i][40:51].strip()
-                except:
-                    bank = None
-
-                self.row_data['main'].addRow({
-                    rdt.CHAINAGE: chain, rdt.ELEVATION: elev,
-                    rdt.ROUGHNESS: rough, rdt.EMBANKMENT: bank
-                }, no_copy=True)
+            BridgeUnit.GEOMETRY_SCHEMA.read(collection, rows)
 
         except NotImplementedError:
             logger.error('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
             raise
 
-        return out_line
+    @staticmethod
+    def _readOpeningRows(collection, rows):
+        """Read the opening rows into the 'opening' RowDataCollection.
+
+        Args:
+            collection(RowDataCollection): the 'opening' row data.
+            rows(list): the opening lines from the file.
+        """
+        try:
+            collectionSchema('bridge.opening', collection).read(collection, rows)
+
+        except NotImplementedError:
+            logger.error('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
+            raise
 
     def getData(self):
         """Retrieve the data in this unit.
@@ -218,8 +247,7 @@ class BridgeUnit (AUnit):
         out_data = []
         no_of_rows = self.row_data['main'].row_count
         out_data.append(self._formatDataItem(no_of_rows, 10, is_head_item=False))
-        for i in range(0, no_of_rows):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
+        out_data.extend(self.row_data['main'].renderRows(0, no_of_rows))
 
         return out_data
 
@@ -385,6 +413,40 @@ class BridgeUnit (AUnit):
                 if not value >= self.row_data['opening'].dataObject(rdt.OPEN_START)[details['next_index']]:
                     raise ValueError('Bridge: OPEN_END must be < than next OPEN_START value')
 
+    def checkOpeningColumns(self, data_obj, start=0):
+        """Ensures that the bridge opening values are ok from start onwards.
+
+        This is the column wide equivalent of checkOpening() and is used as
+        the column_callback for the OPEN_START and OPEN_END data objects, so
+        a block of opening rows is checked in one pass. The same rules as
+        checkOpening() apply.
+
+        The columns are filled one at a time, so only the rows that have
+        both an OPEN_START and an OPEN_END yet are checked. The last column
+        to be filled checks the whole block.
+
+        Args:
+            data_obj(RowDataObj): the data object that was changed.
+            start=0(int): the first row index to check against the row
+                before it.
+
+        Raises:
+            ValueError - if any of the rows fail the tests.
+        """
+        starts = self.row_data['opening'].dataObject(rdt.OPEN_START).data_collection
+        ends = self.row_data['opening'].dataObject(rdt.OPEN_END).data_collection
+        for i in range(max(start, 1), min(len(starts), len(ends))):
+            if starts[i - 1]:
+                if not starts[i] >= starts[i - 1]:
+                    raise ValueError('Bridge: OPEN_START must be > than previous value')
+                if not starts[i] >= ends[i - 1]:
+                    raise ValueError('Bridge: OPEN_START must be > than previous OPEN_END value')
+            if ends[i - 1]:
+                if not ends[i] >= ends[i - 1]:
+                    raise ValueError('Bridge: OPEN_END must be > than previous OPEN_END value')
+                if not ends[i] >= starts[i]:
+                    raise ValueError('Bridge: OPEN_END must be > than OPEN_START value')
+
     def area(self):
         """Returns the cross sectional area of the bridge openings.
 
@@ -500,21 +562,22 @@ class BridgeUnitUsbpr (BridgeUnit):
 
         return file_line + 8
 
-    def _readAdditionalRowData(self, unit_data, file_line):
+    def _readAdditionalRowData(self, unit_data, file_line, lazy=False):
         """Get any additional data rows.
 
         See Also:
             BridgeUnit
         """
-        file_line = self._readArchRowData(unit_data, file_line)
-        file_line = self._readCulvertRowData(unit_data, file_line)
+        file_line = self._readArchRowData(unit_data, file_line, lazy)
+        file_line = self._readCulvertRowData(unit_data, file_line, lazy)
         return file_line
 
-    def _readArchRowData(self, unit_data, file_line):
+    def _readArchRowData(self, unit_data, file_line, lazy=False):
         """Load the data defining the openings in the bridge.
 
         Args:
             unit_data (list): the data pertaining to this unit.
+            lazy=False(bool): if True don't read the rows until they're used.
 
         TODO:
             Change the name of this function to _readOpeningRowData.
@@ -522,31 +585,31 @@ class BridgeUnitUsbpr (BridgeUnit):
         no_of_opening_rows = int(unit_data[file_line].strip())
         file_line += 1
         out_line = file_line + no_of_opening_rows
-        try:
-            # Load the geometry data
-            for i in range(file_line, out_line):
-
-                ostart = unit_data[i][0:10].strip()
-                oend = unit_data[i][10:20].strip()
-                spring = unit_data[i][20:30].strip()
-                soffit = unit_data[i][30:40].strip()
-
-                self.row_data['opening'].addRow({
-                    rdt.OPEN_START: ostart, rdt.OPEN_END: oend,
-                    rdt.SPRINGING_LEVEL: spring, rdt.SOFFIT_LEVEL: soffit
-                }, no_copy=True)
-
-        except NotImplementedError:
-            logger.error('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
-            raise
-
+        self._readRows(unit_data[file_line:out_line], BridgeUnit._readOpeningRows,
+                       'opening', lazy)
         return out_line
 
-    def _readCulvertRowData(self, unit_data, file_line):
+    def _readCulvertRowData(self, unit_data, file_line, lazy=False):
         """Load the data defining the culvert openings in the bridge.
 
         Args:
             unit_data (list): the data pertaining to this unit.
+            lazy=False(bool): if True don't read the rows until they're used.
+        """
+        no_of_culvert_rows = int(unit_data[file_line].strip())
+        file_line += 1
+        out_line = file_line + no_of_culvert_rows
+        self._readRows(unit_data[file_line:out_line], BridgeUnitUsbpr._readCulvertRows,
+                       'culvert', lazy)
+        return out_line
+
+    @staticmethod
+    def _readCulvertRows(collection, rows):
+        """Read the culvert rows into the 'culvert' RowDataCollection.
+
+        Args:
+            collection(RowDataCollection): the 'culvert' row data.
+            rows(list): the culvert lines from the file.
 
         TODO:
             These errors are cryptic here as they're very specific to the
@@ -554,32 +617,13 @@ class BridgeUnitUsbpr (BridgeUnit):
             little more relevant by raising a different error. Or they could
             be dealt with better here.
         """
-        no_of_culvert_rows = int(unit_data[file_line].strip())
-        file_line += 1
-        out_line = file_line + no_of_culvert_rows
         try:
-            # Load the geometry data
-            for i in range(file_line, out_line):
-
-                invert = unit_data[i][0:10].strip()
-                soffit = unit_data[i][10:20].strip()
-                area = unit_data[i][20:30].strip()
-                cd_part = unit_data[i][30:40].strip()
-                cd_full = unit_data[i][40:50].strip()
-                drowning = unit_data[i][50:60].strip()
-
-                self.row_data['culvert'].addRow({
-                    rdt.INVERT: invert, rdt.SOFFIT: soffit, rdt.AREA: area,
-                    rdt.CD_PART: cd_part, rdt.CD_FULL: cd_full,
-                    rdt.DROWNING: drowning
-                }, no_copy=True)
+            collectionSchema('bridge.culvert', collection).read(collection, rows)
 
         except NotImplementedError:
             logger.error('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
             raise
 
-        return out_line
-
     def _getHeadData(self):
         """Return the extracted header data.
 
@@ -613,13 +657,11 @@ class BridgeUnitUsbpr (BridgeUnit):
 
         no_of_rows = self.row_data['opening'].row_count
         out_data.append(self._formatDataItem(no_of_rows, 10, is_head_item=False))
-        for i in range(0, no_of_rows):
-            out_data.append(self.row_data['opening'].getPrintableRow(i))
+        out_data.extend(self.row_data['opening'].renderRows(0, no_of_rows))
 
         no_of_rows = self.row_data['culvert'].row_count
         out_data.append(self._formatDataItem(no_of_rows, 10, is_head_item=False))
-        for i in range(0, no_of_rows):
-            out_data.append(self.row_data['culvert'].getPrintableRow(i))
+        out_data.extend(self.row_data['culvert'].renderRows(0, no_of_rows))
 
         return out_data
 
@@ -740,11 +782,12 @@ class BridgeUnitArch (BridgeUnit):
 
         return file_line + 5
 
-    def _readAdditionalRowData(self, unit_data, file_line):
+    def _readAdditionalRowData(self, unit_data, file_line, lazy=False):
         """Load the data defining the openings in the bridge.
 
         Args:
             unit_data (list): the data pertaining to this unit.
+            lazy=False(bool): if True don't read the rows until they're used.
 
         TODO:
             Change the name of this function to _readOpeningRowData.
@@ -752,24 +795,8 @@ class BridgeUnitArch (BridgeUnit):
         no_of_opening_rows = int(unit_data[file_line].strip())
         file_line += 1
         out_line = file_line + no_of_opening_rows
-        try:
-            # Load the geometry data
-            for i in range(file_line, out_line):
-
-                ostart = unit_data[i][0:10].strip()
-                oend = unit_data[i][10:20].strip()
-                spring = unit_data[i][20:30].strip()
-                soffit = unit_data[i][30:40].strip()
-
-                self.row_data['opening'].addRow({
-                    rdt.OPEN_START: ostart, rdt.OPEN_END: oend,
-                    rdt.SPRINGING_LEVEL: spring, rdt.SOFFIT_LEVEL: soffit
-                }, no_copy=True)
-
-        except NotImplementedError:
-            logger.error('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
-            raise
-
+        self._readRows(unit_data[file_line:out_line], BridgeUnit._readOpeningRows,
+                       'opening', lazy)
         return out_line
 
     def _getAdditionalRowData(self):
@@ -781,7 +808,6 @@ class BridgeUnitArch (BridgeUnit):
         out_data = []
         no_of_rows = self.row_data['opening'].row_count
         out_data.append(self._formatDataItem(no_of_rows, 10, is_head_item=False))
-        for i in range(0, no_of_rows):
-            out_data.append(self.row_data['opening'].getPrintableRow(i))
+        out_data.extend(self.row_data['opening'].renderRows(0, no_of_rows))
 
         return out_data
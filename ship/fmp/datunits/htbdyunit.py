@@ -77,7 +77,9 @@ class HtbdyUnit (AUnit):
 
         dobjs = [
             do.FloatData(rdt.ELEVATION, format_str='{:>10}', no_of_dps=3),
-            do.FloatData(rdt.TIME, format_str='{:>10}', no_of_dps=3, update_callback=self.checkIncreases),
+            do.FloatData(rdt.TIME, format_str='{:>10}', no_of_dps=3,
+                         update_callback=self.checkIncreases,
+                         column_callback=self.checkColumnIncreases),
         ]
         self.row_data['main'] = RowDataCollection.bulkInitCollection(dobjs)
         self.row_data['main'].setDummyRow({rdt.TIME: 0, rdt.ELEVATION: 0})
@@ -153,13 +155,11 @@ class HtbdyUnit (AUnit):
         out_line = file_line + rows
         try:
             # Load the geometry data
-            for i in range(file_line, out_line):
-                elev = unit_data[i][0:10].strip()
-                time = unit_data[i][10:20].strip()
-
-                self.row_data['main'].addRow({
-                    rdt.ELEVATION: elev, rdt.TIME: time
-                }, no_copy=True)
+            rows = unit_data[file_line:out_line]
+            self.row_data['main'].extendColumns({
+                rdt.ELEVATION: [r[0:10].strip() for r in rows],
+                rdt.TIME: [r[10:20].strip() for r in rows],
+            })
 
         except NotImplementedError:
             logger.ERROR('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
@@ -189,11 +189,7 @@ class HtbdyUnit (AUnit):
         Returns:
             list containing the formatted unit rows.
         """
-        out_data = []
-        for i in range(0, self.row_data['main'].numberOfRows()):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
-
-        return out_data
+        return self.row_data['main'].renderRows()
 
     def _getHeadData(self):
         """Get the header data formatted for printing out.
@@ -25,8 +25,10 @@ from __future__ import unicode_literals
 
 from ship.fmp.datunits.isisunit import AUnit
 from ship.datastructures.rowdatacollection import RowDataCollection
+from ship.datastructures.rowschema import collectionSchema
 from ship.datastructures import dataobject as do
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
+from ship.utils import utilfunctions as uf
 
 import logging
 logger = logging.getLogger(__name__)
@@ -60,12 +62,16 @@ class InitialConditionsUnit (AUnit):
         self._name = "initial_conditions"
         self._name_types = {}
         self._node_count = 0
+        self._label_index = {}
+        """Lookup of LABEL to row index in row_data['main']. See _labelIndex()."""
+        self._indexed_rows = 0
+        """Number of rows in row_data['main'] when _label_index was updated."""
 #         self.has_datarows = True
 #         self.has_ics = False
 
         dobjs = [
             do.StringData(rdt.LABEL, format_str='{:<12}'),
-            do.StringData(rdt.QMARK, format_str='{:>2}', default='y'),
+            do.StringData(rdt.QMARK, format_str='{:>2}', default='y', categorical=True),
             do.FloatData(rdt.FLOW, format_str='{:>10}', default=0.000, no_of_dps=3),
             do.FloatData(rdt.STAGE, format_str='{:>10}', default=0.000, no_of_dps=3),
             do.FloatData(rdt.FROUDE_NO, format_str='{:>10}', default=0.000, no_of_dps=3),
@@ -87,42 +93,92 @@ class InitialConditionsUnit (AUnit):
         self._node_count = kwargs['node_count']
         self._name_types = kwargs['name_types']
 
-        i = file_line
+        # Skip the first couple of header lines
         out_line = file_line + self._node_count + 2
-        for i in range(file_line, out_line):
-            if i < file_line + 2:
-                continue  # Skip the first couple of header lines
-
-            label = unit_data[i][0:12].strip()
-            qmark = unit_data[i][12:14].strip()
-            flow = unit_data[i][14:24].strip()
-            stage = unit_data[i][24:34].strip()
-            froude_no = unit_data[i][34:44].strip()
-            velocity = unit_data[i][44:54].strip()
-            umode = unit_data[i][54:64].strip()
-            ustate = unit_data[i][64:74].strip()
-            elevation = unit_data[i][74:84].strip()
-
-            self.row_data['main'].addRow({
-                rdt.LABEL: label, rdt.QMARK: qmark, rdt.FLOW: flow,
-                rdt.STAGE: stage, rdt.FROUDE_NO: froude_no, rdt.VELOCITY: velocity,
-                rdt.UMODE: umode, rdt.USTATE: ustate,
-                rdt.ELEVATION: elevation
-            }, no_copy=True)
+        rows = unit_data[file_line + 2:out_line]
+        collection = self.row_data['main']
+        collectionSchema('initial_conditions.main', collection).read(collection, rows)
+        self._rebuildLabelIndex()
 
         return out_line - 1
 
+    def _rebuildLabelIndex(self):
+        """Rebuild the LABEL to row index lookup from the row data.
+
+        If a label is in the rows more than once the first one is used, to
+        match the behaviour of list.index().
+        """
+        labels = self.row_data['main'].dataObject(rdt.LABEL).data_collection
+        self._label_index = {}
+        for i, l in enumerate(labels):
+            if not l in self._label_index:
+                self._label_index[l] = i
+        self._indexed_rows = len(labels)
+
+    def _unindexRow(self, label, index):
+        """Update the LABEL to row index lookup after a row is deleted.
+
+        The label is removed and only the labels of the rows after it are
+        moved down one, so the rest of the lookup isn't touched.
+
+        Args:
+            label(str): the LABEL of the deleted row.
+            index(int): the row index that was deleted.
+        """
+        if self._label_index.get(label) == index:
+            del self._label_index[label]
+        labels = self.row_data['main'].dataObject(rdt.LABEL).data_collection
+        for i in range(index, len(labels)):
+            l = labels[i]
+            if self._label_index.get(l) == i + 1:
+                self._label_index[l] = i
+        self._indexed_rows -= 1
+
+    def _labelIndex(self, label):
+        """Get the row index of the given label.
+
+        The lookup is checked against the row data before it's returned. If
+        the rows have been changed without going through this unit (e.g.
+        directly on row_data['main']) it's rebuilt first.
+
+        Args:
+            label(str): the LABEL to find.
+
+        Return:
+            int - the row index of label, or None if it isn't in the rows.
+        """
+        labels = self.row_data['main'].dataObject(rdt.LABEL).data_collection
+        i = self._label_index.get(label)
+        if i is not None and i < len(labels) and labels[i] == label:
+            return i
+        if i is None and self._indexed_rows == len(labels):
+            return None
+
+        self._rebuildLabelIndex()
+        return self._label_index.get(label)
+
+    def _addNameType(self, label, unit_type):
+        """Keep a record of multiple unit types under the same name."""
+        if label in self._name_types:
+            if not unit_type in self._name_types[label]:
+                self._name_types[label].append(unit_type)
+        else:
+            self._name_types[label] = [unit_type]
+
     def getData(self):
         """
         """
-        out_data = []
-        out_data.append('INITIAL CONDITIONS')
-        out_data.append(' label   ?      flow     stage froude no  velocity     umode    ustate         z')
-#         for i in range(0, self._node_count):
-        for i in range(0, self.row_data['main'].numberOfRows()):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
+        return list(self.iterData())
 
-        return out_data
+    def iterData(self):
+        """Overrides superclass method.
+
+        The rows are rendered a block at a time rather than all at once.
+        """
+        yield 'INITIAL CONDITIONS'
+        yield ' label   ?      flow     stage froude no  velocity     umode    ustate         z'
+        for row in self.row_data['main'].iterRenderedRows():
+            yield row
 
 
 #     def updateDataRow(self, row_vals, index):
@@ -171,15 +227,18 @@ class InitialConditionsUnit (AUnit):
         See Also:
             ADataObject and subclasses for information on the parameters.
         """
-        labels = self.row_data['main'].dataObjectAsList(rdt.LABEL)
-        try:
-            index = labels.index(name)
-        except ValueError:
+        index = self._labelIndex(name)
+        if index is None:
             raise KeyError('Name does not exist in initial conditions: ' + str(name))
 
         # Call superclass method to add the new row
         AUnit.updateRow(self, row_vals=row_vals, index=index, **kwargs)
 
+        # Keep the lookup up to date if the label was changed
+        new_name = row_vals.get(rdt.LABEL, name)
+        if new_name != name:
+            self._rebuildLabelIndex()
+
 
 #     def addDataRow(self, row_vals):
     def addRow(self, row_vals, unit_type, **kwargs):
@@ -213,23 +272,76 @@ class InitialConditionsUnit (AUnit):
             logger.error('Required values of LABEL not given')
             raise AttributeError("Required value 'LABEL' not given")
 
-        # Keep a record of multiple unit types under the same name
-        if row_vals[rdt.LABEL] in self._name_types.keys():
-            if not unit_type in self._name_types[row_vals[rdt.LABEL]]:
-                self._name_types[row_vals[rdt.LABEL]].append(unit_type)
-        else:
-            self._name_types[row_vals[rdt.LABEL]] = [unit_type]
+        label = row_vals[rdt.LABEL]
+        self._addNameType(label, unit_type)
 
         # Don't add the same ic's in twice
-        labels = self.row_data['main'].dataObjectAsList(rdt.LABEL)
-        if row_vals[rdt.LABEL] in labels:
+        if self._labelIndex(label) is not None:
             return self._node_count
 
         # Call superclass method to add the new row
         AUnit.addRow(self, row_vals=row_vals, index=None, **kwargs)
+        self._label_index[label] = self._indexed_rows
+        self._indexed_rows += 1
         self._node_count += 1
         return self._node_count
 
+    def addRows(self, rows, unit_type, **kwargs):
+        """Adds a list of new rows to the InitialCondition units row_collection.
+
+        This is the bulk equivalent of calling addRow() for each of the rows.
+        The rows are all appended to the end of the collection in one go.
+        Rows with a LABEL that is already in the initial conditions, or that
+        is repeated in rows, are only added once.
+
+        Args:
+            rows(list): of dicts in the same form as used by addRow().
+            unit_type(str | list): the unit_type of the unit that each of the
+                rows is for. Either a single unit_type for all of them or a
+                list the same length as rows.
+
+        Return:
+            int - the node_count after the rows have been added.
+
+        Raises:
+            AttributeError: If LABEL is not given for any of the rows.
+            ValueError: If the given value is not accepted by the DataObject's.
+                None of the rows will be added.
+
+        See Also:
+            addRow(), RowDataCollection.addRows().
+        """
+        for r in rows:
+            if not rdt.LABEL in r:
+                logger.error('Required values of LABEL not given')
+                raise AttributeError("Required value 'LABEL' not given")
+
+        if uf.isString(unit_type):
+            unit_types = [unit_type] * len(rows)
+        else:
+            unit_types = unit_type
+            if not len(unit_types) == len(rows):
+                raise ValueError('unit_type must be a str or the same length as rows')
+
+        new_rows = []
+        new_labels = set()
+        for r in rows:
+            label = r[rdt.LABEL]
+            if label in new_labels or self._labelIndex(label) is not None:
+                continue
+            new_labels.add(label)
+            new_rows.append(r)
+
+        self.row_data['main'].addRows(new_rows)
+
+        for r, utype in zip(rows, unit_types):
+            self._addNameType(r[rdt.LABEL], utype)
+        for r in new_rows:
+            self._label_index[r[rdt.LABEL]] = self._indexed_rows
+            self._indexed_rows += 1
+        self._node_count += len(new_rows)
+        return self._node_count
+
     def deleteRowByName(self, unit_name, unit_type, **kwargs):
         """Delete one of the RowDataCollection objects in the row_collection.
 
@@ -243,10 +355,8 @@ class InitialConditionsUnit (AUnit):
         Raises:
             KeyError - if section_name does not exist.
         """
-        labels = self.row_data['main'].dataObjectAsList(rdt.LABEL)
-        try:
-            index = labels.index(unit_name)
-        except ValueError:
+        index = self._labelIndex(unit_name)
+        if index is None:
             raise KeyError('Name does not exist in initial conditions: ' + str(unit_name))
 
         # Delete the ic if the unit_name is the only one using it
@@ -259,6 +369,57 @@ class InitialConditionsUnit (AUnit):
             self.deleteRow(index, **kwargs)
             self._node_count -= 1
             del self._name_types[unit_name]
+            self._unindexRow(unit_name, index)
+
+    def deleteRowsByName(self, unit_names, unit_type, **kwargs):
+        """Delete the rows for a list of names from the row_collection.
+
+        This is the bulk equivalent of calling deleteRowByName() for each of
+        the names. The rows are deleted in a single transaction and the label
+        lookup is only updated once at the end.
+
+        Args:
+            unit_names(list): the names of the AUnit's to be removed from
+                the initial conditions.
+            unit_type(str): the unit_type of the AUnit's being removed.
+
+        Raises:
+            KeyError - if any of the unit_names do not exist. None of the
+                rows will be deleted.
+        """
+        for name in unit_names:
+            if self._labelIndex(name) is None:
+                raise KeyError('Name does not exist in initial conditions: ' + str(name))
+
+        # Work out the changes first and only make them once the rows have
+        # been deleted, so a failed delete leaves _name_types as it was
+        indices = set()
+        deleted = set()
+        shared = set()
+        for name in unit_names:
+            if not name in self._name_types:
+                continue
+            elif len(self._name_types[name]) > 1:
+                if unit_type in self._name_types[name]:
+                    shared.add(name)
+            else:
+                indices.add(self._labelIndex(name))
+                deleted.add(name)
+
+        if not indices and not shared:
+            return
+
+        collection = self.row_data['main']
+        with collection.transaction():
+            for i in sorted(indices, reverse=True):
+                self.deleteRow(i, **kwargs)
+            for name in shared:
+                self._name_types[name].remove(unit_type)
+            for name in deleted:
+                del self._name_types[name]
+        if indices:
+            self._node_count -= len(indices)
+            self._rebuildLabelIndex()
 
     def rowByName(self, section_name):
         """Get the data vals in a particular row by name.
@@ -275,10 +436,9 @@ class InitialConditionsUnit (AUnit):
         Return:
             dict - containing the values for the requested row.
         """
-        labels = self.row_data['main'].dataObjectAsList(rdt.LABEL)
-        index = labels.index(section_name)
+        index = self._labelIndex(section_name)
 
-        if index == -1:
-            raise AttributeError('Name does not exist in initial conditions: ' + str(section_name))
+        if index is None:
+            raise ValueError('Name does not exist in initial conditions: ' + str(section_name))
 
         return self.row(index)
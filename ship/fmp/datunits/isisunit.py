@@ -32,6 +32,7 @@ import copy
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 from ship.datastructures import DATA_TYPES as dt
 from ship.fmp.headdata import HeadDataItem
+from ship.datastructures.rowdatacollection import LazyRowDataCollection
 
 import logging
 logger = logging.getLogger(__name__)
@@ -67,6 +68,9 @@ class AUnit(object):
     """
 #     __metaclass__ = ABCMeta
 
+    LAZY_ROWS = False
+    """True if readUnitData() supports the lazy kwarg. See _readRows()."""
+
     def __init__(self, **kwargs):
         """Constructor
 
@@ -109,6 +113,17 @@ class AUnit(object):
         data in the .dat file.
         """
 
+        self._changed = True
+        """Set by setChangeStatus(). New units are always changed."""
+        self._clean_state = None
+        """_changeState() when setChangeStatus(False) was last called."""
+        self._source = None
+        """(start, end, digest) of the file lines the unit was loaded from.
+
+        Set by the DatLoader. Used by DatCollection.write(incremental=True)
+        to copy the original text of units that haven't changed.
+        """
+
     @property
     def name(self):
         return self._name
@@ -125,6 +140,94 @@ class AUnit(object):
     def name_ds(self, value):
         self._name_ds = value
 
+    @property
+    def has_changed(self):
+        """True if the unit has changed since it was loaded.
+
+        The unit has changed if any of its HeadDataItem's or row data have
+        changed, its name or name_ds have been changed, or any of its other
+        values (e.g. head_data that isn't a HeadDataItem, or CommentUnit.data)
+        are different. Units that weren't loaded from a file are always
+        changed.
+
+        Note:
+            Changes made to the data objects without going through their
+            methods (e.g. directly to data_collection) are not detected. Call
+            setChangeStatus(True) after doing this.
+        """
+        if self._changed:
+            return True
+        for item in self.head_data.values():
+            if isinstance(item, HeadDataItem) and item.has_changed:
+                return True
+        for collection in self.row_data.values():
+            if collection.has_changed:
+                return True
+        return self._changeState() != self._clean_state
+
+    def setChangeStatus(self, status):
+        """Set whether the unit has changed.
+
+        Args:
+            status(bool): if False the current state of the unit is stored
+                and has_changed will be False until it's changed. If True
+                has_changed will be True until this is called with False.
+        """
+        if status:
+            self._changed = True
+            return
+
+        for item in self.head_data.values():
+            if isinstance(item, HeadDataItem):
+                item.has_changed = False
+        for collection in self.row_data.values():
+            collection.setChangeStatus(False)
+        self._clean_state = self._changeState()
+        self._changed = False
+
+    def _changeState(self):
+        """Get the values of the unit that don't track their own changes.
+
+        These are the names, the row data collections that are held, any
+        head_data that isn't a HeadDataItem and the public attributes of the
+        unit. Lists and dicts are copied so that changes to their contents
+        are found.
+
+        Return:
+            tuple - that compares equal to an earlier one if none of the
+                values have changed.
+        """
+        def snapshot(value):
+            if isinstance(value, (list, dict)):
+                return copy.copy(value)
+            return value
+
+        head = dict(
+            (k, snapshot(v)) for k, v in self.head_data.items()
+            if not isinstance(v, HeadDataItem)
+        )
+        attrs = dict(
+            (k, snapshot(v)) for k, v in self.__dict__.items()
+            if not k.startswith('_') and k != 'head_data' and k != 'row_data'
+        )
+        return (self._name, self._name_ds, dict(self.row_data), head, attrs)
+
+    def renderJob(self):
+        """Get a copy of the unit that can be formatted in another process.
+
+        The row data is copied with RowDataCollection.renderJob() and the
+        change tracking state is left out, so pickling the copy doesn't
+        pickle the unit, or anything that refers to it, as well. Only
+        getData() should be called on the copy.
+
+        Return:
+            AUnit - a shallow copy of this unit.
+        """
+        job = copy.copy(self)
+        job._clean_state = None
+        job.row_data = dict((k, c.renderJob()) for k, c in self.row_data.items())
+        return job
+
     @property
     def has_ics(self):
         if not self.icLabels():
@@ -238,6 +341,20 @@ class AUnit(object):
         """
         raise NotImplementedError
 
+    def iterData(self):
+        """Generator version of getData().
+
+        Yields the same lines as getData(). Units that can have a very large
+        number of lines (e.g. InitialConditionsUnit) override this so that
+        their lines don't all need to be held in memory at once. By default
+        it just yields the lines from getData().
+
+        Yields:
+            str - each line formatted for writing to .dat file.
+        """
+        for line in self.getData():
+            yield line
+
     def readUnitData(self, data, file_line, **kwargs):
         """Reads the unit data supplied to the object.
 
@@ -264,6 +381,28 @@ class AUnit(object):
         """
         self.head_data['all'] = data
 
+    def _readRows(self, rows, reader, rowdata_key='main', lazy=False):
+        """Read the raw file lines for a RowDataCollection.
+
+        Calls reader(collection, rows) to read the rows into
+        row_data[rowdata_key]. If lazy is True the collection is replaced by
+        a LazyRowDataCollection instead and the rows are only read when it's
+        first used.
+
+        Args:
+            rows(list): the raw file lines containing the row data.
+            reader(func): reads the rows into the collection. Must be a
+                module level function or staticmethod.
+            rowdata_key='main'(str): key to a RowDataCollection in row_data.
+            lazy=False(bool): if True delay reading the rows.
+        """
+        if lazy and rows:
+            self.row_data[rowdata_key] = LazyRowDataCollection.fromCollection(
+                self.row_data[rowdata_key], rows, reader
+            )
+        else:
+            reader(self.row_data[rowdata_key], rows)
+
     def deleteRow(self, index, rowdata_key='main', **kwargs):
         """Removes a data row from the RowDataCollection.
 
@@ -349,7 +488,10 @@ class AUnit(object):
         Note:
             the ARowDataObject class accepts a callback function called
             update_callback which is called whenever an item is added or
-            updated. That is how this method is generally used.
+            updated. That is how this method is generally used. When adding
+            or updating a lot of values it's quicker to defer the checks
+            with RowDataCollection.deferValidation() so that
+            checkColumnIncreases() is called once instead.
 
         Args:
             data_obj(RowDataObject): containing the values to check against.
@@ -360,14 +502,45 @@ class AUnit(object):
         Returns:
             False if not prev_value < value < next_value. Otherwise True.
         """
-        details = self._getAdjacentDataObjDetails(data_obj, value, index)
-        if details['prev_value']:
-            if not value >= details['prev_value']:
+        vals = data_obj.data_collection
+        if index is None:
+            index = len(vals)
+        if index < 0:
+            raise ValueError('Index must be > 0')
+
+        if index > 0:
+            prev_value = vals[index - 1]
+            if prev_value and not value >= prev_value:
                 raise ValueError('VALUE must be > prev index and < next index.')
-        if details['next_value']:
-            if not value <= details['next_value']:
+        if index < len(vals):
+            next_value = vals[index]
+            if next_value and not value <= next_value:
                 raise ValueError('VALUE must be > prev index and < next index.')
 
+    def checkColumnIncreases(self, data_obj, start=0):
+        """Checks that the values in data_obj increase from index start onwards.
+
+        This is the column wide equivalent of checkIncreases() and is used as
+        the column_callback for ADataRowObject's. It's called once after a
+        block of values is added so it can check them all in a single pass.
+
+        The same rules as checkIncreases() apply: each value must be >= the
+        one before it, unless the one before it is zero.
+
+        Args:
+            data_obj(RowDataObject): containing the values to check.
+            start=0(int): the first index to check against the value before it.
+
+        Raises:
+            ValueError: if any value is less than the one before it. The
+                message will contain all of the offending indexes.
+        """
+        vals = data_obj.data_collection
+        bad = [i for i in range(max(start, 1), len(vals))
+               if vals[i - 1] and not vals[i] >= vals[i - 1]]
+        if bad:
+            raise ValueError('VALUE must be > prev index and < next index. Failed at indexes: %s' % bad)
+
     def _getAdjacentDataObjDetails(self, data_obj, value, index):
         """Safely check the status of adjacent values in an ADataRowObject.
 
@@ -100,7 +100,7 @@ class JunctionUnit(AUnit):
 #         names = names.split(' ')
 
         # Break line into list for every 12th character
-        line = unit_data[file_line + 2]
+        line = unit_data[file_line + 2].rstrip()
         names = [line[i:i + 12].strip() for i in range(0, len(line), 12)]
 
         self.head_data['names'] = names
@@ -28,6 +28,7 @@ logger = logging.getLogger(__name__)
 
 from ship.fmp.datunits.isisunit import AUnit
 from ship.datastructures.rowdatacollection import RowDataCollection
+from ship.datastructures.rowschema import collectionSchema
 from ship.datastructures import dataobject as do
 from ship.datastructures import DATA_TYPES as dt
 from ship.fmp.headdata import HeadDataItem
@@ -53,6 +54,7 @@ class RefhUnit(AUnit):
     UNIT_CATEGORY = 'inflows'
     FILE_KEY = 'REFHBDY'
     FILE_KEY2 = None
+    LAZY_ROWS = True
 
     def __init__(self, **kwargs):
         """Constructor.
@@ -196,7 +198,7 @@ class RefhUnit(AUnit):
             self.head_data['revision'].value = '1'
             self.has_urban = False
 
-    def readUnitData(self, unit_data, file_line):
+    def readUnitData(self, unit_data, file_line, **kwargs):
         """Reads the unit data into the geometry objects.
 
         See Also:
@@ -205,9 +207,13 @@ class RefhUnit(AUnit):
         Args:
             unit_data (list): The section of the isis dat file pertaining
                 to this section
+            **kwargs:
+                lazy=False(bool): if True the rainfall rows are not read
+                    until they're used. See AUnit._readRows().
         """
         file_line, storm_rows = self._readHeadData(unit_data, file_line)
-        file_line = self._readStormData(unit_data, file_line, storm_rows)
+        file_line = self._readStormData(unit_data, file_line, storm_rows,
+                                        kwargs.get('lazy', False))
         file_line = self._readSuffix(unit_data, file_line)
         return file_line
 
@@ -292,17 +298,19 @@ class RefhUnit(AUnit):
         file_line = file_line + 5
         return file_line, storm_rows
 
-    def _readStormData(self, unit_data, file_line, storm_rows):
+    def _readStormData(self, unit_data, file_line, storm_rows, lazy=False):
         """
         """
         out_line = file_line + storm_rows
-        for i in range(file_line, out_line):
-            self.row_data['main'].addRow(
-                {rdt.RAIN: unit_data[i][0:10].strip()}, no_copy=True
-            )
-
+        self._readRows(unit_data[file_line:out_line], RefhUnit._readRainRows,
+                       lazy=lazy)
         return out_line
 
+    @staticmethod
+    def _readRainRows(collection, rows):
+        """Read the rainfall rows into the 'main' RowDataCollection."""
+        collectionSchema('refh.main', collection).read(collection, rows)
+
     def _readSuffix(self, unit_data, file_line):
         """
         """
@@ -393,8 +401,7 @@ class RefhUnit(AUnit):
         """
         out_data = []
         out_data = ['{:>10}'.format(self.row_data['main'].numberOfRows())]
-        for i in range(self.row_data['main'].numberOfRows()):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
+        out_data.extend(self.row_data['main'].renderRows())
         return out_data
 #         out_data = ['{:>10}'.format(self.row_data['main'].numberOfRows())]
 #         for line in self.row_data['main']:
@@ -180,7 +180,7 @@ class ReservoirUnit (AUnit):
 
                 self.row_data['main'].addRow({
                     rdt.ELEVATION: elev, rdt.AREA: area,
-                }, no_copy=True)
+                })
 
         except NotImplementedError:
             logger.ERROR('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
@@ -218,8 +218,7 @@ class ReservoirUnit (AUnit):
         """
         out_data = []
         out_data.append('{:>10}'.format(num_rows))
-        for i in range(0, num_rows):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
+        out_data.extend(self.row_data['main'].renderRows(0, num_rows))
         return out_data
 
     def _getHeadData(self, num_rows):
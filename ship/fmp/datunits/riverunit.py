@@ -26,6 +26,7 @@ from __future__ import unicode_literals
 from ship.fmp.datunits.isisunit import AUnit
 from ship.datastructures import dataobject as do
 from ship.datastructures.rowdatacollection import RowDataCollection
+from ship.datastructures.rowschema import collectionSchema
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 from ship.fmp.headdata import HeadDataItem
 from ship.datastructures import DATA_TYPES as dt
@@ -54,6 +55,7 @@ class RiverUnit (AUnit):
     UNIT_CATEGORY = 'river'
     FILE_KEY = 'RIVER'
     FILE_KEY2 = 'SECTION'
+    LAZY_ROWS = True
 
     def __init__(self, **kwargs):
         """Constructor.
@@ -91,7 +93,9 @@ class RiverUnit (AUnit):
         '''
         dobjs = [
             # update_callback is called every time a value is added or updated
-            do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=3, update_callback=self.checkIncreases),
+            do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=3,
+                         update_callback=self.checkIncreases,
+                         column_callback=self.checkColumnIncreases),
             do.FloatData(rdt.ELEVATION, format_str='{:>10}', no_of_dps=3),
             do.FloatData(rdt.ROUGHNESS, format_str='{:>10}', default=0.039, no_of_dps=3),
             do.SymbolData(rdt.PANEL_MARKER, '*', format_str='{:<5}', default=False),
@@ -101,7 +105,7 @@ class RiverUnit (AUnit):
             do.FloatData(rdt.NORTHING, format_str='{:>10}', default=0.0, no_of_dps=2),
             do.ConstantData(rdt.DEACTIVATION, ('', 'LEFT', 'RIGHT'), format_str='{:<10}', default=''),
             # Default == '~' means to ignore formatting and apply '' when value is None
-            do.StringData(rdt.SPECIAL, format_str='{:<10}', default='~'),
+            do.StringData(rdt.SPECIAL, format_str='{:<10}', default='~', categorical=True),
         ]
         self.row_data['main'] = RowDataCollection.bulkInitCollection(dobjs)
         self.row_data['main'].setDummyRow({rdt.CHAINAGE: 0, rdt.ELEVATION: 0, rdt.ROUGHNESS: 0})
@@ -142,7 +146,7 @@ class RiverUnit (AUnit):
                 out[k] = v.value
         return out
 
-    def readUnitData(self, unit_data, file_line):
+    def readUnitData(self, unit_data, file_line, **kwargs):
         """Reads the unit data into the geometry objects.
 
         See Also:
@@ -151,9 +155,12 @@ class RiverUnit (AUnit):
         Args:
             unit_data (list): The section of the isis dat file pertaining
                 to this section
+            **kwargs:
+                lazy=False(bool): if True the geometry rows are not read
+                    until they're used. See AUnit._readRows().
         """
         file_line = self._readHeadData(unit_data, file_line)
-        file_line = self._readRowData(unit_data, file_line)
+        file_line = self._readRowData(unit_data, file_line, kwargs.get('lazy', False))
         return file_line - 1
 
     def _readHeadData(self, unit_data, file_line):
@@ -176,7 +183,7 @@ class RiverUnit (AUnit):
 
         return file_line + 4
 
-    def _readRowData(self, unit_data, file_line):
+    def _readRowData(self, unit_data, file_line, lazy=False):
         """Reads the units rows into the row collection.
 
         This is all the geometry data that occurs after the no of rows variable in
@@ -184,45 +191,33 @@ class RiverUnit (AUnit):
 
         Args:
             unit_data (list): the data pertaining to this unit.
+            lazy=False(bool): if True don't read the rows until they're used.
         """
         end_line = int(unit_data[file_line].strip())
         file_line += 1
+        rows = unit_data[file_line:end_line + file_line]
+        self._readRows(rows, RiverUnit._readGeometryRows, lazy=lazy)
+        return end_line + file_line
+
+    @staticmethod
+    def _readGeometryRows(collection, rows):
+        """Read the geometry rows into the 'main' RowDataCollection.
+
+        Args:
+            collection(RowDataCollection): the 'main' row data.
+            rows(list): the geometry lines from the file.
+        """
         try:
-            # Load the geometry data
-            for i in range(file_line, end_line + file_line):
-                chain = unit_data[i][0:10].strip()
-                elev = unit_data[i][10:20].strip()
-                rough = unit_data[i][20:30].strip()
-                panel = unit_data[i][30:35].strip()
-                rpl = unit_data[i][35:40].strip()
-                bank = unit_data[i][40:50].strip()
-                east = unit_data[i][50:60].strip()
-                north = unit_data[i][60:70].strip()
-                deact = unit_data[i][70:80].strip()
-                special = unit_data[i][80:90].strip()
-
-                if east == '':
-                    east = None
-                if north == '':
-                    north = None
-
-                self.row_data['main'].addRow(
-                    {rdt.CHAINAGE: chain, rdt.ELEVATION: elev, rdt.ROUGHNESS: rough,
-                        rdt.RPL: rpl, rdt.PANEL_MARKER: panel, rdt.BANKMARKER: bank,
-                        rdt.EASTING: east, rdt.NORTHING: north,
-                        rdt.DEACTIVATION: deact, rdt.SPECIAL: special
-                     },
-                    # We don't need to make backup copies here. If it fails the
-                    # load fails anyway and this will just really slow us down
-                    no_copy=True
-                )
+            # The rows are read from the same columns that they're printed to
+            schema = collectionSchema(
+                'river.main', collection, blanks={rdt.EASTING: None, rdt.NORTHING: None}
+            )
+            schema.read(collection, rows)
 
         except NotImplementedError:
             logger.ERROR('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
             raise
 
-        return end_line + file_line
-
     def getData(self):
         """Retrieve the data in this unit.
 
@@ -247,10 +242,7 @@ class RiverUnit (AUnit):
         Returns:
             list = containing the formatted unit rows.
         """
-        out_data = []
-        for i in range(0, row_count):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
-        return out_data
+        return self.row_data['main'].renderRows(0, row_count)
 
     def _getHeadData(self, row_count):
         """Get the header data formatted for printing out to file.
@@ -146,7 +146,7 @@ class SpillUnit (AUnit):
                 self.row_data['main'].addRow({
                     rdt.CHAINAGE: chain, rdt.ELEVATION: elev,
                     rdt.EASTING: east, rdt.NORTHING: north
-                }, no_copy=True)
+                })
 
         except NotImplementedError:
             logger.ERROR('Unable to read Unit Data(dataRowObject creation) - NotImplementedError')
@@ -179,8 +179,7 @@ class SpillUnit (AUnit):
             list containing the formatted unit rows.
         """
         out_data = []
-        for i in range(0, num_rows):
-            out_data.append(self.row_data['main'].getPrintableRow(i))
+        out_data.extend(self.row_data['main'].renderRows(0, num_rows))
 
         return out_data
 
@@ -27,6 +27,8 @@
 
 from __future__ import unicode_literals
 
+import re
+
 from ship.fmp.datunits import spillunit
 from ship.fmp.datunits import riverunit
 from ship.fmp.datunits import junctionunit
@@ -72,6 +74,12 @@ class FmpUnitFactory(object):
         reservoirunit.ReservoirUnit,
     )
 
+    _dispatch = None
+    """Shared lookup of unit classes. See dispatchTable()."""
+
+    _key_line = None
+    """Regex matching the first word of lines that could be a FILE_KEY."""
+
     def __init__(self):
         """Constructor.
 
@@ -83,6 +91,8 @@ class FmpUnitFactory(object):
         self.reach_number = 0
         self.same_reach = False
         self._ic_name_types = {}
+        self.lazy = False
+        """If True units that support it won't read their rows until used."""
 
         try:
             self._getFileKeys()
@@ -98,14 +108,53 @@ class FmpUnitFactory(object):
         defines the key word used in the .dat file. This is then used to
         recognise when a unit of that type has been found.
         """
-        self.unit_keys = [k.FILE_KEY for k in FmpUnitFactory.available_units if k.FILE_KEY is not None]
-        self.units = {}
-        for u in FmpUnitFactory.available_units:
-            if u.FILE_KEY is None:
-                continue
-            if not u.FILE_KEY in self.units.keys():
-                self.units[u.FILE_KEY] = []
-            self.units[u.FILE_KEY].append((u.FILE_KEY2, u))
+        self.units = FmpUnitFactory.dispatchTable()
+        self.unit_keys = list(self.units.keys())
+
+    @classmethod
+    def dispatchTable(cls):
+        """Get the lookup of unit classes by FILE_KEY and FILE_KEY2.
+
+        The table is built from available_units the first time that it's
+        needed and then shared by every factory.
+
+        Returns:
+            dict - {FILE_KEY: {FILE_KEY2: AUnit class}}. FILE_KEY2 is None
+                for units that only have a single type.
+        """
+        if cls._dispatch is None:
+            table = {}
+            for u in cls.available_units:
+                if u.FILE_KEY is None:
+                    continue
+                table.setdefault(u.FILE_KEY, {})[u.FILE_KEY2] = u
+
+            # Only lines where the first word starts with the same character
+            # as a FILE_KEY need to be looked at any further
+            starts = ''.join(sorted(set(k[0] for k in table)))
+            cls._key_line = re.compile(r'\s*([' + re.escape(starts) + r']\S*)')
+            cls._dispatch = table
+        return cls._dispatch
+
+    def fileKey(self, line):
+        """Get the FILE_KEY that a line of the .dat file starts with.
+
+        This is called for every line that isn't part of a known unit, so
+        it avoids splitting lines that can't start with a FILE_KEY.
+
+        Args:
+            line(str): the line to check.
+
+        Returns:
+            str - the FILE_KEY, or None if the line doesn't start with one.
+        """
+        match = self._key_line.match(line)
+        if match is None:
+            return None
+        word = match.group(1)
+        if word in self.units:
+            return word
+        return None
 
     def createUnitFromFile(self, contents, file_line, file_key, file_order, reach_number=None):
         """
@@ -125,28 +174,24 @@ class FmpUnitFactory(object):
 
         # Check if we know what the unit is. If we do, instantiate it, if not
         # return the current line number and False to let the loader know
-        found = False
+        unit_type = None
 
         # Make sure the given FILE_KEY is found (it should be if we're here)
-        if file_key in self.units.keys():
-            u = self.units[file_key]
+        types = self.units.get(file_key, None)
+        if types is not None:
 
             # If FILE_KEY2 is none there's only a single type of this unit so
             # grab it
-            if u[0][0] is None:
-                unit_type = u[0][1]
-                found = True
+            if None in types:
+                unit_type = types[None]
             else:
 
                 # If not then find which one it is and  grab that
                 key2 = contents[file_line + 1].split()[0].strip()
-                for s in u:
-                    if s[0] == key2:
-                        unit_type = s[1]
-                        found = True
+                unit_type = types.get(key2, None)
 
         # If something went wrong send back as part of UnknownUnit instead
-        if not found:
+        if unit_type is None:
             return file_line, False
 
         read_kwargs = {}
@@ -156,6 +201,8 @@ class FmpUnitFactory(object):
             read_kwargs['name_types'] = self._ic_name_types
         elif file_key == 'RIVER':
             constructor_kwargs['reach_number'] = self.reach_number
+        if self.lazy and unit_type.LAZY_ROWS:
+            read_kwargs['lazy'] = True
 
         unit = unit_type(**constructor_kwargs)
         file_line = unit.readUnitData(contents, file_line, **read_kwargs)
@@ -183,12 +230,8 @@ class FmpUnitFactory(object):
             head_data: dict of head_data values to set in the AUnit.
             row_data: dict of row_data keys containing lists of row data to
                 set in the unit.
-            no_copy(bool): When adding any row_data given to a new unit the
-                no_copy flag will be given to the RowDataCollection.addRow()
-                method. When True it stops the call to deepcopy while updating
-                the rows. It's probably not needed when creating a new unit and
-                it can be time-consuming. The default is True. See 
-                RowDataCollection.addRow() for more details.
+            no_copy(bool): deprecated and ignored. RowDataCollection no
+                longer makes a copy of the data objects when adding rows.
 
         The row_data kwarg is expected to be set out like the following::
 
@@ -230,7 +273,6 @@ class FmpUnitFactory(object):
         row_data = kwargs.get('row_data', None)
         unit.name = kwargs.get('name', 'unknown')
         unit.name_ds = kwargs.get('name_ds', 'unknown')
-        no_copy = kwargs.get('no_copy', True)
 
         if unit.unit_category == 'river':
             unit.reach_number = kwargs.get('reach_number', -1)
@@ -250,10 +292,27 @@ class FmpUnitFactory(object):
                 if row_key in rowdata_keys:
                     # For different rows to add
                     for entry in row_data:
-                        unit.row_data[row_key].addRow(entry, no_copy=no_copy)
+                        unit.row_data[row_key].addRow(entry)
 
         return unit
 
+    def addExistingUnit(self, unit):
+        """Update the factory for a unit that was read earlier.
+
+        Used when a unit from an earlier read of the file is reused instead
+        of calling createUnitFromFile(), so that the units read after it are
+        set up in the same way.
+
+        Args:
+            unit(AUnit): the unit being reused.
+        """
+        if unit._unit_type != 'river':
+            self.same_reach = False
+        if unit._unit_type == 'header':
+            self.unit_count = unit.head_data['node_count'].value
+        elif unit._unit_type != 'initial_conditions':
+            self.findIcLabels(unit)
+
     def findIcLabels(self, unit):
         """
         """
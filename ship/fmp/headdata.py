@@ -24,17 +24,92 @@ import logging
 logger = logging.getLogger(__name__)
 """logging references with a __name__ set to this module."""
 
+from collections import namedtuple
+
 from ship.datastructures import DATA_TYPES as dt
 from ship.utils import utilfunctions as uf
 
 
+_spec_cache = {}
+"""HeadDataSpec's that have already been created, keyed by their arguments."""
+
+
+class HeadDataSpec(namedtuple('HeadDataSpec', [
+        'dtype', 'format_str', 'default', 'allow_blank', 'choices', 'dps',
+        'decimal_format', 'update_callback', 'options'])):
+    """The checks and formatting used by a HeadDataItem.
+
+    These don't change after a HeadDataItem is created and are the same for
+    every instance of the same item in a unit type (e.g. the 'distance' in
+    every RiverUnit), so they're stored in a single shared, immutable object
+    rather than in every HeadDataItem. Use get() to create them so that
+    they're shared.
+
+    The options field holds the original kwargs as a tuple of (key, value)
+    pairs so that HeadDataItem.kwargs can still be provided.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def get(cls, format_str, **kwargs):
+        """Get the shared HeadDataSpec for the given arguments.
+
+        Args:
+            format_str(str): the format to return the item with.
+            **kwargs: the HeadDataItem kwargs.
+
+        Raises:
+            AttributeError: if dtype == CONSTANT and there are no choices.
+            ValueError: if choices is not a tuple.
+        """
+        options = tuple(sorted(kwargs.items()))
+        # Include the types so that e.g. default=0 and default=0.0 are kept apart
+        key = (format_str, tuple((k, v.__class__, v) for k, v in options))
+        try:
+            return _spec_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # One of the kwargs can't be hashed so it can't be shared
+            key = None
+
+        dtype = kwargs.get('dtype', dt.STRING)
+        if dtype == dt.CONSTANT:
+            if not 'choices' in kwargs.keys():
+                raise AttributeError("Keyword args must contain 'choices=(str1, str2, strN)' when dtype == CONSTANT")
+            elif not isinstance(kwargs['choices'], tuple):
+                raise ValueError('choices must be a tuple')
+
+        dps = kwargs.get('dps', 1)
+        spec = cls(
+            dtype, format_str, kwargs.get('default', None),
+            kwargs.get('allow_blank', False), kwargs.get('choices', None),
+            dps, '%0.' + str(dps) + 'f', kwargs.get('update_callback', None),
+            options
+        )
+        if key is not None:
+            _spec_cache[key] = spec
+        return spec
+
+
 class HeadDataItem(object):
     """Objects stored in the head_data dict in AUnit's.
 
     Allow for formatting variables and value checks to be encapsulated in one
     place rather than littered around all subclasses of AUnit.
+
+    There are a lot of these in a large model so they only store their value
+    and location. Everything else is held in a shared HeadDataSpec.
+
+    Attributes:
+        has_changed(bool): set to True when the item is created and whenever
+            value is set to something different. The DatLoader resets it to
+            False once a unit has been loaded. See AUnit.has_changed.
     """
 
+    __slots__ = ('spec', 'line_no', 'col_no', '_value', 'has_changed')
+
     def __init__(self, initial_value, format_str, line_no, col_no, **kwargs):
         """Constructor.
 
@@ -56,26 +131,32 @@ class HeadDataItem(object):
                 0 indexed.
             col_no(int): the column that the value occurs in - 0 indexed.
         """
-
-        kkeys = kwargs.keys()
-        dtype = kwargs.get('dtype', dt.STRING)
-        default = kwargs.get('default', None)
-        self.allow_blank = kwargs.get('allow_blank', False)
-        if dtype == dt.CONSTANT:
-            if not 'choices' in kkeys:
-                raise AttributeError("Keyword args must contain 'choices=(str1, str2, strN)' when dtype == CONSTANT")
-            elif not isinstance(kwargs['choices'], tuple):
-                raise ValueError('choices must be a tuple')
-
-        self.dtype = dtype
-        self.format_str = format_str
+        self.spec = HeadDataSpec.get(format_str, **kwargs)
         self.line_no = line_no
         self.col_no = col_no
-        self.kwargs = kwargs
+        self._value = self._checkValue(initial_value)
+        self.has_changed = True
+
+    @property
+    def dtype(self):
+        return self.spec.dtype
+
+    @property
+    def format_str(self):
+        return self.spec.format_str
 
-        value = self._checkValue(initial_value)
-        self._value = value
-        self._update_callback = kwargs.get('update_callback', None)
+    @property
+    def allow_blank(self):
+        return self.spec.allow_blank
+
+    @property
+    def kwargs(self):
+        """The kwargs given to the constructor."""
+        return dict(self.spec.options)
+
+    @property
+    def _update_callback(self):
+        return self.spec.update_callback
 
     @property
     def value(self):
@@ -89,6 +170,8 @@ class HeadDataItem(object):
             ValueError: if value is not the correct type.
         """
         val = self._checkValue(val)
+        if val != self._value:
+            self.has_changed = True
         self._value = val
 
     def format(self, auto_newline=False):
@@ -99,25 +182,24 @@ class HeadDataItem(object):
         A newline char '\n' will be appended to the start of the returned 
         string if it's col_no == 0 and auto_newline == True.
         """
+        spec = self.spec
         out = ''
-        if self.allow_blank and self._value == '':
+        if spec.allow_blank and self._value == '':
             if auto_newline and self.col_no == 0:
                 return '\n' + out
             else:
                 return out
 
-        if self.dtype == dt.FLOAT:
-            dps = self.kwargs.get('dps', 1)
-            decimal_format = '%0.' + str(dps) + 'f'
-            value = decimal_format % float(self._value)
-            out = self.format_str.format(value)
+        if spec.dtype == dt.FLOAT:
+            value = spec.decimal_format % float(self._value)
+            out = spec.format_str.format(value)
         else:
-            out = self.format_str.format(self._value)
+            out = spec.format_str.format(self._value)
 
         if auto_newline and self.col_no == 0:
             out = '\n' + out
 
-        return self.format_str.format(out)
+        return spec.format_str.format(out)
 
     def compare(self, compare_val):
         """Check equality of given value against self.value.
@@ -137,10 +219,11 @@ class HeadDataItem(object):
             return False
 
     def _checkValue(self, value, **kwargs):
-        if self.allow_blank and value == '':
+        spec = self.spec
+        if spec.allow_blank and value == '':
             return value
-        dtype = self.kwargs.get('dtype', dt.STRING)
-        default = self.kwargs.get('default', None)
+        dtype = spec.dtype
+        default = spec.default
 
         if dtype == dt.STRING:
             if not uf.isString(value):
@@ -164,7 +247,7 @@ class HeadDataItem(object):
             else:
                 return float(value)
         if dtype == dt.CONSTANT:
-            choices = self.kwargs['choices']
+            choices = spec.choices
             if not value in choices:
                 raise ValueError("value %s is not in CONSTANT 'choices' tuple %s" % (value, choices))
             else:
@@ -0,0 +1,317 @@
+"""
+
+ Summary:
+    Contains the UnitNetwork class. This is a graph of the way that the
+    units in a DatCollection are connected to each other. See
+    DatCollection.network() for more information.
+
+ Author:
+     SHIP contributors
+
+ Created:
+     16 Oct 2026
+
+ Copyright:
+     SHIP contributors 2026
+
+ TODO:
+
+ Updates:
+
+"""
+from __future__ import unicode_literals
+
+from collections import deque
+
+import logging
+logger = logging.getLogger(__name__)
+"""logging references with a __name__ set to this module."""
+
+
+class UnitNetwork(object):
+    """Graph of the connections between the units in a DatCollection.
+
+    Each unit in the collection is a node. The edges between them are:
+
+        - 'upstream' and 'downstream': the units immediately above and below
+          a unit in the .dat file.
+        - 'named': units that share any of their AUnit.linkLabels(), e.g. a
+          RiverUnit and the SpillUnit named in its spill1 value, or a
+          BridgeUnit and the units named in its remote_us/remote_ds.
+        - 'junction': a JunctionUnit and each of the units whose name or
+          name_ds is one of the junction names.
+
+    Blank labels and the 'unknown' default name are ignored.
+
+    The link labels of each unit are read when it's added to the network.
+    DatCollection keeps the network up to date as units are added, removed
+    and replaced, but if the names or head_data of a unit are changed after
+    that updateUnit() must be called to update its edges.
+
+    Order of units in the lists returned is always the order of the units
+    in the collection.
+    """
+
+    UPSTREAM = 'upstream'
+    DOWNSTREAM = 'downstream'
+    NAMED = 'named'
+    JUNCTION = 'junction'
+
+    LABEL_EDGES = (NAMED, JUNCTION)
+    """Edge types followed by default by reachable() and components().
+
+    The upstream/downstream edges are not included because units next to
+    each other in the file aren't always hydraulically connected (e.g. at
+    the end of a reach).
+    """
+
+    def __init__(self, collection):
+        """Build the network for all of the units in collection.
+
+        Args:
+            collection(DatCollection): the units to build the network for.
+        """
+        self._collection = collection
+        self._labels = {}
+        """Lookup of unit to the (labels, node labels) it was added with."""
+        self._refs = {}
+        """Lookup of label to the units with the label in their linkLabels()."""
+        self._nodes = {}
+        """Lookup of label to the non-junction units with that name or name_ds."""
+
+        for u in collection.units:
+            self.addUnit(u)
+
+    def __contains__(self, unit):
+        return unit in self._labels
+
+    def addUnit(self, unit):
+        """Add a unit to the network.
+
+        Args:
+            unit(AUnit): the unit to add.
+        """
+        if unit in self._labels:
+            return
+
+        labels = []
+        for l in unit.linkLabels().values():
+            if l.strip() != '' and l != 'unknown' and not l in labels:
+                labels.append(l)
+
+        nodes = []
+        if unit.unit_type != 'junction':
+            if unit.name != 'unknown':
+                nodes.append(unit.name)
+            if unit.name_ds != 'unknown' and unit.name_ds != unit.name:
+                nodes.append(unit.name_ds)
+
+        self._labels[unit] = (labels, nodes)
+        for l in labels:
+            self._refs.setdefault(l, []).append(unit)
+        for l in nodes:
+            self._nodes.setdefault(l, []).append(unit)
+
+    def removeUnit(self, unit):
+        """Remove a unit from the network.
+
+        Args:
+            unit(AUnit): the unit to remove.
+        """
+        entry = self._labels.pop(unit, None)
+        if entry is None:
+            return
+
+        labels, nodes = entry
+        for lookup, keys in ((self._refs, labels), (self._nodes, nodes)):
+            for l in keys:
+                units = lookup[l]
+                units.remove(unit)
+                if not units:
+                    del lookup[l]
+
+    def updateUnit(self, unit):
+        """Update the edges of a unit after its names or labels have changed.
+
+        Args:
+            unit(AUnit): the unit to update.
+        """
+        self.removeUnit(unit)
+        self.addUnit(unit)
+
+    def _sorted(self, units):
+        """Sort units into the order they are in the collection."""
+        return sorted(units, key=self._collection.index)
+
+    def linkLabels(self, unit):
+        """Get the non-blank link labels that unit was added with.
+
+        Return:
+            list - of str labels.
+        """
+        return list(self._labels[unit][0])
+
+    def references(self, label):
+        """Get the units that reference label in their linkLabels().
+
+        Return:
+            list - of AUnit's.
+        """
+        return self._sorted(self._refs.get(label, ()))
+
+    def labelUnits(self, label):
+        """Get the units, other than junctions, with label as name or name_ds.
+
+        Return:
+            list - of AUnit's.
+        """
+        return self._sorted(self._nodes.get(label, ()))
+
+    def _linked(self, unit):
+        """Get the set of units that share any link labels with unit."""
+        linked = set()
+        for l in self._labels[unit][0]:
+            linked.update(self._refs[l])
+        return linked
+
+    def namedUnits(self, unit):
+        """Get the units, other than junctions, that share labels with unit.
+
+        Return:
+            list - of AUnit's, not including unit.
+        """
+        return self._sorted(
+            u for u in self._linked(unit)
+            if u.unit_type != 'junction' and not u is unit
+        )
+
+    def junctions(self, unit):
+        """Get the junctions that share any labels with unit.
+
+        If unit is a junction it will be included.
+
+        Return:
+            list - of JunctionUnit's.
+        """
+        return self._sorted(
+            u for u in self._linked(unit) if u.unit_type == 'junction'
+        )
+
+    def junctionUnits(self, junction):
+        """Get the units connected by a junction.
+
+        Return:
+            list - of the units, other than junctions, with a name or name_ds
+                that is one of the junction names. They are in the order of
+                the junction names and then the collection.
+        """
+        out = []
+        for l in self._labels[junction][0]:
+            for u in self.labelUnits(l):
+                if not u in out:
+                    out.append(u)
+        return out
+
+    def neighbours(self, unit, edge_types=None):
+        """Get the units that are connected to unit by any of edge_types.
+
+        Args:
+            unit(AUnit): the unit to find the neighbours of.
+            edge_types=None(list): the UnitNetwork edge types to include. If
+                None all of them are used.
+
+        Return:
+            list - of AUnit's.
+        """
+        if edge_types is None:
+            edge_types = (UnitNetwork.UPSTREAM, UnitNetwork.DOWNSTREAM,
+                          UnitNetwork.NAMED, UnitNetwork.JUNCTION)
+
+        out = set()
+        if UnitNetwork.UPSTREAM in edge_types or UnitNetwork.DOWNSTREAM in edge_types:
+            units = self._collection.units
+            index = self._collection.index(unit)
+            if UnitNetwork.UPSTREAM in edge_types and index > 0:
+                out.add(units[index - 1])
+            if UnitNetwork.DOWNSTREAM in edge_types and -1 < index < len(units) - 1:
+                out.add(units[index + 1])
+
+        if UnitNetwork.NAMED in edge_types:
+            out.update(self.namedUnits(unit))
+
+        if UnitNetwork.JUNCTION in edge_types:
+            if unit.unit_type == 'junction':
+                out.update(self.junctionUnits(unit))
+            else:
+                for l in self._labels[unit][1]:
+                    out.update(
+                        u for u in self._refs.get(l, ())
+                        if u.unit_type == 'junction'
+                    )
+
+        out.discard(unit)
+        return self._sorted(out)
+
+    def reachable(self, unit, edge_types=LABEL_EDGES):
+        """Get all of the units that can be reached from unit.
+
+        Args:
+            unit(AUnit): the unit to start from.
+            edge_types=LABEL_EDGES(list): the edge types to follow. See
+                neighbours().
+
+        Return:
+            list - of AUnit's, including unit.
+        """
+        return self._sorted(self._search(unit, edge_types))
+
+    def _search(self, unit, edge_types):
+        """Breadth first search of the network from unit.
+
+        Return:
+            set - of the units found, including unit.
+        """
+        found = set([unit])
+        queue = deque([unit])
+        while queue:
+            for n in self.neighbours(queue.popleft(), edge_types):
+                if not n in found:
+                    found.add(n)
+                    queue.append(n)
+        return found
+
+    def components(self, edge_types=LABEL_EDGES):
+        """Get the groups of units that are connected to each other.
+
+        Args:
+            edge_types=LABEL_EDGES(list): the edge types to follow. See
+                neighbours().
+
+        Return:
+            list - of lists of AUnit's. The groups are in the order of their
+                first unit in the collection.
+        """
+        out = []
+        found = set()
+        for u in self._collection.units:
+            if u in found or not u in self._labels:
+                continue
+            group = self._search(u, edge_types)
+            found.update(group)
+            out.append(self._sorted(group))
+        return out
+
+    def danglingLabels(self):
+        """Get the labels that are referenced but don't exist in the model.
+
+        These are the link labels, e.g. a spill or lateral name, that are not
+        the name or name_ds of any unit other than a junction.
+
+        Return:
+            dict - of label to the list of units that reference it.
+        """
+        out = {}
+        for l, units in self._refs.items():
+            if not l in self._nodes:
+                out[l] = self._sorted(units)
+        return out
@@ -41,6 +41,9 @@ class AssociatedParts(object):
     references to any other TuflowPart's that it has an association with.
     """
 
+    __slots__ = ('_parent', 'sibling_prev', 'sibling_next', '_logic',
+                 'notify_active_changed')
+
     def __init__(self, parent, **kwargs):
         self._parent = None
         self.parent = parent
@@ -85,8 +88,14 @@ class TuflowPart(object):
     """Interface for all TuflowPart's.
 
     All components containing data stored by ControlFile subclass this one.
+
+    The metadata shared by all parts is stored in slots. Subclasses don't
+    declare __slots__ so they still have a __dict__ for their own data.
     """
 
+    __slots__ = ('TOP_CLASS', 'hash', 'obj_type', '_active', 'filepart_type',
+                 'associates', 'observers')
+
     def __init__(self, parent, obj_type, **kwargs):
         self.TOP_CLASS = 'part'
         self.hash = uuid.uuid4()
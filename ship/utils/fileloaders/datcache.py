@@ -0,0 +1,235 @@
+"""
+
+ Summary:
+    Functions for caching loaded DatCollection's on disk.
+
+    Used by the DatLoader 'cache' option. After a .dat file has been loaded
+    the DatCollection is pickled into the cache directory along with a key
+    describing the file it came from. Later loads of the same file reuse the
+    pickled model if the key still matches, which is much quicker than
+    reading the file again.
+
+    The key contains the path, size, modified time and sha1 hash of the file
+    and the load options that change the model. It also contains a version
+    made from the source of the unit and data structure classes so that
+    cached models are not reused after the library has changed.
+
+    Loading a pickle can run code, so cache directories and files that
+    other users could write to are never used. See isSecure().
+
+ Author:
+     SHIP contributors
+
+ Created:
+     16 Oct 2026
+
+ Copyright:
+     SHIP contributors 2026
+
+ TODO:
+
+ Updates:
+
+"""
+from __future__ import unicode_literals
+
+import os
+import gc
+import sys
+import hashlib
+import tempfile
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import logging
+logger = logging.getLogger(__name__)
+"""logging references with a __name__ set to this module."""
+
+
+CACHE_FORMAT = 1
+"""Changed whenever the layout of the cache files changes."""
+
+_SOURCE_PACKAGES = ('fmp', 'datastructures')
+"""Packages in ship whose source makes up the cacheVersion()."""
+
+_version = None
+
+
+def defaultCacheDir():
+    """The directory used when the 'cache' option is True.
+
+    This is in the user's own cache folder rather than a shared one, e.g.
+    ~/.cache/ship/datcache, or %LOCALAPPDATA%\\ship\\datcache on Windows.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ship', 'datcache')
+
+
+def isSecure(path):
+    """Check that only the current user can change a cache file or directory.
+
+    The cached models are pickles, so anyone who can write to the cache
+    can run code in the process that loads it. The path must be owned by
+    the current user and must not be writable by the group or others.
+    Ownership can't be checked like this on Windows, where it's always True.
+
+    Returns:
+        bool - True if the path is safe to use.
+    """
+    if not hasattr(os, 'getuid'):
+        return True
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def cacheVersion():
+    """Get the version of the classes that make up a loaded model.
+
+    This is a hash of the source files of the ship.fmp and
+    ship.datastructures packages, the cache format and the Python version.
+    It's worked out once per process.
+
+    Returns:
+        str - the version.
+    """
+    global _version
+    if _version is None:
+        ship_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        sha = hashlib.sha1()
+        sha.update(('%d %d.%d' % ((CACHE_FORMAT,) + tuple(sys.version_info[:2]))).encode())
+        for package in _SOURCE_PACKAGES:
+            for root, dirs, files in os.walk(os.path.join(ship_dir, package)):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith('.py'):
+                        with open(os.path.join(root, name), 'rb') as f:
+                            sha.update(f.read())
+        _version = sha.hexdigest()
+    return _version
+
+
+def contentHash(file_path, chunk_size=1 << 20):
+    """Get the sha1 hash of the contents of a file.
+
+    Returns:
+        str - the hex digest.
+    """
+    sha = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        chunk = f.read(chunk_size)
+        while chunk:
+            sha.update(chunk)
+            chunk = f.read(chunk_size)
+    return sha.hexdigest()
+
+
+def fileKey(file_path, options=()):
+    """Get the key that a cached model must match to be used.
+
+    Args:
+        file_path(str): the .dat file.
+        options=()(tuple): the load options that change the model.
+
+    Returns:
+        dict - the key.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    return {
+        'version': cacheVersion(),
+        'path': path,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'sha1': contentHash(path),
+        'options': tuple(options),
+    }
+
+
+def cachePath(cache_dir, key):
+    """Get the cache file used for the file in key."""
+    name = hashlib.sha1(key['path'].encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, name + '.pickle')
+
+
+def loadCached(cache_dir, key):
+    """Load a cached model if there is one matching key.
+
+    Any problem reading the cache is logged and treated as a miss. So is a
+    cache directory or file that fails isSecure().
+
+    Args:
+        cache_dir(str): the cache directory.
+        key(dict): returned by fileKey().
+
+    Returns:
+        DatCollection - the cached model, or None if there isn't a usable one.
+    """
+    path = cachePath(cache_dir, key)
+    if not os.path.exists(path):
+        return None
+    if not (isSecure(cache_dir) and isSecure(path)):
+        logger.warning('Not using cached model %s: the cache can be changed by other users' % path)
+        return None
+
+    enabled = gc.isenabled()
+    try:
+        with open(path, 'rb') as f:
+            if pickle.load(f) != key:
+                return None
+            # The model is a large number of small objects that don't need
+            # to be checked for cycles while they're created
+            gc.disable()
+            return pickle.load(f)
+    except Exception as err:
+        logger.warning('Unable to read cached model %s: %s' % (path, err))
+        return None
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def saveCached(cache_dir, key, units):
+    """Save a model to the cache.
+
+    The cache file is written to a temporary file first and moved into place
+    so that other processes never see a partly written one. Any problem
+    writing the cache is logged and ignored.
+
+    Args:
+        cache_dir(str): the cache directory. Created, only accessible by
+            the current user, if it doesn't exist. Nothing is saved if it
+            fails isSecure().
+        key(dict): returned by fileKey().
+        units(DatCollection): the model to cache.
+
+    Returns:
+        bool - True if the model was saved.
+    """
+    path = cachePath(cache_dir, key)
+    temp_path = None
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        if not isSecure(cache_dir):
+            logger.warning('Not caching model in %s: it can be changed by other users' % cache_dir)
+            return False
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(key, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(units, f, pickle.HIGHEST_PROTOCOL)
+        getattr(os, 'replace', os.rename)(temp_path, path)
+        return True
+    except Exception as err:
+        logger.warning('Unable to write cached model %s: %s' % (path, err))
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
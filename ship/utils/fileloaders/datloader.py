@@ -28,20 +28,120 @@
 from __future__ import unicode_literals
 
 import os
+import hashlib
+from collections import namedtuple
+from contextlib import contextmanager
 
 from ship.utils.atool import ATool
 from ship.utils.fileloaders.loader import ALoader
+from ship.utils.fileloaders import datcache
 from ship.utils import filetools as ftools
 from ship.fmp.fmpunitfactory import FmpUnitFactory
 from ship.utils import utilfunctions as uf
 from ship.fmp.datunits.isisunit import UnknownUnit
 from ship.fmp.datcollection import DatCollection
+from ship.datastructures import dataobject
+from ship.datastructures.rowdatacollection import LazyRowDataCollection, runLoadJobs
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
 
 import logging
 logger = logging.getLogger(__name__)
 """logging references with a __name__ set to this module."""
 
 
+UnitIndexEntry = namedtuple('UnitIndexEntry', ['unit_type', 'name', 'start', 'end'])
+"""Where a unit is in a .dat file. start and end are byte offsets."""
+
+
+def sourceDigest(lines):
+    """Get the hash of the file lines that a unit was read from.
+
+    Args:
+        lines(list): the lines, including any line endings.
+
+    Returns:
+        str - the sha1 hex digest.
+    """
+    return hashlib.sha1(''.join(lines).encode('utf-8')).hexdigest()
+
+
+class UnitSources(object):
+    """Matches units against those from an earlier read of the same file.
+
+    Used by DatLoader.refreshDat() to find the units that haven't changed
+    since the file was last read, so that they can be reused rather than
+    read again.
+
+    The DatCollection.unit_sources of the earlier read are gone through in
+    order. The next expected unit is checked with expected() before a unit
+    is read and units that have been read are looked up by their text with
+    match(), which gets things back in step after units have been added,
+    removed or moved.
+    """
+
+    def __init__(self, sources):
+        """Constructor.
+
+        Args:
+            sources(list): the DatCollection.unit_sources of the earlier
+                read.
+        """
+        self.sources = sources
+        self.next = 0
+        self.used = set()
+        self._by_digest = {}
+        for i, source in enumerate(sources):
+            self._by_digest.setdefault(source[0], []).append(i)
+
+    def _use(self, index):
+        self.used.add(index)
+        self.next = index + 1
+        return self.sources[index][2]
+
+    def expected(self, contents, start):
+        """Get the next expected unit if its text is unchanged at start.
+
+        Unknown units are never returned because where they end depends on
+        the lines after them. They're found with match() instead.
+
+        Returns:
+            tuple - (unit, number of lines) or None if it doesn't match.
+        """
+        if self.next >= len(self.sources):
+            return None
+        digest, line_count, unit = self.sources[self.next]
+        if self.next in self.used or unit._unit_type == 'unknown':
+            return None
+        lines = contents[start:start + line_count]
+        if len(lines) != line_count or sourceDigest(lines) != digest:
+            return None
+        return self._use(self.next), line_count
+
+    def match(self, lines, unit):
+        """Get the unit from the earlier read with the same text.
+
+        Args:
+            lines(list): the lines that unit was read from.
+            unit(AUnit): the unit that was read.
+
+        Returns:
+            AUnit - the earlier unit if there is an unused one with the same
+                text, otherwise unit.
+        """
+        for index in self._by_digest.get(sourceDigest(lines), ()):
+            if not index in self.used and self.sources[index][2]._unit_type == unit._unit_type:
+                return self._use(index)
+        return unit
+
+    def unused(self):
+        """Get the earlier units that haven't been matched."""
+        return [s[2] for i, s in enumerate(self.sources) if not i in self.used]
+
+
 class DatLoader(ATool, ALoader):
     """
     Isis data file (.DAT) I/O methods.
@@ -66,6 +166,8 @@ class DatLoader(ATool, ALoader):
         self.contents = []          # Contents of dat file
         self.temp_unit = None       # AUnit
         self.is_ied = False         # If used to load an .ied file
+        self.lazy = False           # If set units will read their rows when used
+        self.unit_span = None       # (start, end) lines of the last unit read
         self._ic_name_types = {}
 
         # reach_info dictionary. Keeps track of the information needed to identify
@@ -91,6 +193,35 @@ class DatLoader(ATool, ALoader):
 
         Args:
             file_path (str): path to the .dat file to load.
+            arg_dict={}(dict): optional load settings. Supports:
+                'storage': one of the datastructures.STORAGE_TYPES to use for
+                    the row data of the loaded units. ARRAY uses much less
+                    memory on large models.
+                'stream': if True the file is read as the units are built
+                    rather than being loaded into memory first. Lowers the
+                    peak memory used when loading very large files.
+                'lazy': if True the river, bridge and refh units keep the
+                    raw file lines for their rows and only read them when
+                    they're first used. Much quicker if only a few units
+                    are going to be changed. DatCollection.incremental is
+                    set, so units that haven't changed are written back
+                    exactly as they were read, and a hash of each unit is
+                    kept so that DatCollection.refresh() only reads the
+                    units that have changed.
+                'workers': the number of processes to use to read the row
+                    data. The units are found in this process, the same as
+                    with 'lazy', and then the rows are read in parallel.
+                    Everything is read before returning. Ignored if < 2 or
+                    concurrent.futures isn't available.
+                'mmap': if True the file is memory mapped rather than read
+                    into memory and the units are lazy loaded, as with
+                    'lazy'. The byte offsets of the units are recorded in
+                    DatCollection.unit_offsets (see unitAtOffset()).
+                'cache': True, or the path of a directory, to cache the
+                    loaded model on disk. If a cached model matches the
+                    file, the load options and the version of the library
+                    it's returned instead of reading the file. True uses
+                    datcache.defaultCacheDir(). See the datcache module.
 
         Returns:
             units - UnitCollection containing the dat file units or False if
@@ -108,15 +239,320 @@ class DatLoader(ATool, ALoader):
                 If they aren't then remove them rather than have them
                 cluttering up the file.
         """
-        line = ''
         # Used to populate the data for the UnknownUnit
         self.unknown_data = []
         # Composite for all dat units
         path_holder = ftools.PathHolder(file_path)
         self.units = DatCollection(path_holder)
+        self.units.source_path = file_path
 #         self.units.file_dir, self.units.filename = os.path.split(file_path)
 #         self.units.filename = os.path.splitext(self.units.filename)[0]
 
+        self._checkFileType(file_path)
+
+        workers = arg_dict.get('workers', None)
+        mapped = arg_dict.get('mmap', False)
+        self.lazy = arg_dict.get('lazy', False) or bool(workers) or mapped
+        # Models that are read in parallel are fully loaded
+        self.units.incremental = self.lazy and not workers
+
+        cache_dir = arg_dict.get('cache', None)
+        if cache_dir:
+            if cache_dir is True:
+                cache_dir = datcache.defaultCacheDir()
+            # Models that are read in parallel are fully loaded
+            options = (arg_dict.get('storage', None), self.lazy and not workers, bool(mapped))
+            cache_key = datcache.fileKey(file_path, options)
+            cached = datcache.loadCached(cache_dir, cache_key)
+            if cached is not None:
+                self.units = cached
+                return self.units
+
+        contents = self._openContents(file_path, arg_dict)
+        try:
+            with self._storageSet(arg_dict):
+                self.buildDat(contents, arg_dict)
+                if workers:
+                    self.loadRows(workers)
+        finally:
+            if mapped:
+                contents.close()
+                self.contents = []
+
+        if cache_dir:
+            datcache.saveCached(cache_dir, cache_key, self.units)
+        return self.units
+
+    def indexFile(self, file_path):
+        """Find where each of the units are in a .dat file.
+
+        The file is memory mapped and the units are lazy loaded to find
+        their extent, so this is much quicker than loading the model. The
+        index can be given to readUnit() to read single units later without
+        looking through the file again.
+
+        Args:
+            file_path (str): path to the .dat file to index.
+
+        Returns:
+            list - of UnitIndexEntry's in file order.
+
+        Raises:
+            IOError: If the file cannot be loaded or is empty.
+            AttributeError: if the file is not of an expected type (.dat/.ief).
+        """
+        self._checkFileType(file_path)
+        self.lazy = True
+        index = []
+        with ftools.MappedFile(file_path) as contents:
+            for unit in self._iterUnits(contents):
+                start, end = self._spanOffsets(contents)
+                index.append(UnitIndexEntry(unit.unit_type, unit.name, start, end))
+        return index
+
+    def readUnit(self, file_path, name, unit_type=None, index=None):
+        """Read a single unit from a .dat file.
+
+        Only reads as far as the unit that's wanted, or straight to it if an
+        index from indexFile() is given, so it's a quick way to get a few
+        units out of a large model without loading the rest of it.
+
+        Note:
+            The unit isn't part of a DatCollection, so river units will
+            have a reach_number of 0 if an index is used.
+
+        Args:
+            file_path (str): path to the .dat file.
+            name(str): the AUnit.name of the unit.
+            unit_type=None(str): the AUnit.unit_type. If None the first
+                unit with a matching name is returned.
+            index=None(list): UnitIndexEntry's returned by indexFile().
+
+        Returns:
+            AUnit - the unit, or False if it can't be found.
+
+        Raises:
+            IOError: If the file cannot be loaded or is empty.
+            AttributeError: if the file is not of an expected type (.dat/.ief).
+            ValueError: if the index doesn't match the file.
+        """
+        self._checkFileType(file_path)
+        self.lazy = True
+        with ftools.MappedFile(file_path) as contents:
+            if index is None:
+                for unit in self._iterUnits(contents):
+                    if unit.name == name and (unit_type is None or unit.unit_type == unit_type):
+                        return unit
+                return False
+
+            for entry in index:
+                if entry.name == name and (unit_type is None or entry.unit_type == unit_type):
+                    return self._readIndexedUnit(contents, entry)
+        return False
+
+    def _readIndexedUnit(self, contents, entry):
+        """Read the unit at a UnitIndexEntry in a mapped file.
+
+        Raises:
+            ValueError: if the unit found doesn't match the entry.
+        """
+        try:
+            start = contents.lineAt(entry.start)
+            end = contents.lineAt(entry.end) if entry.end < contents.size else len(contents)
+        except IndexError:
+            raise ValueError('Unit index does not match the file')
+        if contents.offset(start) != entry.start:
+            raise ValueError('Unit index does not match the file')
+
+        if entry.unit_type == 'unknown':
+            self.unknown_data = [l.rstrip('\n') for l in contents[start:end]]
+            self.createUnknownSection()
+            self.unknown_data = []
+            return self.temp_unit
+
+        unit_factory = FmpUnitFactory()
+        unit_factory.lazy = self.lazy
+        if entry.unit_type == 'header':
+            file_key = 'HEADER'
+        else:
+            file_key = unit_factory.fileKey(contents[start])
+
+        # There's no header to get the number of initial conditions from
+        unit_factory.unit_count = end - start - 2
+        unit = False
+        if file_key is not None:
+            i, unit = unit_factory.createUnitFromFile(contents, start, file_key, 0)
+        if unit == False or unit.unit_type != entry.unit_type:
+            raise ValueError('Unit index does not match the file')
+        return unit
+
+    def refreshDat(self, units, arg_dict={}):
+        """Update a DatCollection to match the current contents of its file.
+
+        The file is read again, but the units whose lines haven't changed
+        since the collection was loaded, or last refreshed, are reused. They
+        are kept as the same objects, along with any changes that have been
+        made to them, and only the units that are new or have changed are
+        read. self.units is set to the refreshed collection.
+
+        Units that were added to the collection rather than being loaded
+        from the file are not kept. If the collection has no unit_sources,
+        e.g. it was created with DatCollection.initialisedDat() or loaded
+        without the 'lazy' or 'mmap' options, every unit is read.
+
+        Args:
+            units(DatCollection): the collection to refresh.
+            arg_dict={}(dict): load settings for the units that are read.
+                Supports 'storage', 'stream', 'lazy' and 'mmap'. See
+                loadFile(). 'lazy' defaults to units.incremental, so the
+                collection is refreshed the same way it was loaded.
+
+        Returns:
+            dict - 'added': list of the units that were read from the file,
+                'removed': list of the units that are no longer in the file.
+
+        Raises:
+            IOError: If the file cannot be loaded or is empty.
+            AttributeError: if the file is not of an expected type (.dat/.ief).
+        """
+        file_path = units.path_holder.absolutePath()
+        self._checkFileType(file_path)
+        self.unknown_data = []
+        self.units = DatCollection(units.path_holder)
+        self.units.source_path = file_path
+        previous = UnitSources(units.unit_sources)
+
+        mapped = arg_dict.get('mmap', False)
+        self.lazy = arg_dict.get('lazy', units.incremental) or mapped
+        self.units.incremental = self.lazy
+        contents = self._openContents(file_path, arg_dict)
+        try:
+            with self._storageSet(arg_dict):
+                self.buildDat(contents, arg_dict, previous)
+        finally:
+            if mapped:
+                contents.close()
+                self.contents = []
+
+        reused = set(id(previous.sources[i][2]) for i in previous.used)
+        return {
+            'added': [u for u in self.units if not id(u) in reused],
+            'removed': previous.unused(),
+        }
+
+    def iterUnits(self, file_path, arg_dict={}):
+        """Read the units in a .DAT file one at a time.
+
+        Streams the file rather than loading all of the contents first and
+        yields each unit as soon as it has been read. Only the lines of the
+        unit currently being read are held in memory, so callers can process
+        or filter the units of very large models without holding the whole
+        file or every unit.
+
+        The units are not added to a DatCollection. If you want one use
+        loadFile() instead.
+
+        Note:
+            If the 'storage' option is given it will be set as the default
+            storage until the generator is finished with.
+
+        Args:
+            file_path (str): path to the .dat file to load.
+            arg_dict={}(dict): optional load settings. See loadFile().
+
+        Returns:
+            generator - of the AUnit's in the file, in file order.
+
+        Raises:
+            IOError: If the file cannot be loaded or is empty.
+            AttributeError: if the file is not of an expected type (.dat/.ief).
+        """
+        self._checkFileType(file_path)
+        contents = ftools.LineSource(ftools.iterFile(file_path))
+        if not contents.hasLine(0):
+            raise IOError('Unable to load file at: ' + file_path)
+
+        self.lazy = arg_dict.get('lazy', False)
+        with self._storageSet(arg_dict):
+            for unit in self._iterUnits(contents):
+                yield unit
+
+    def loadRows(self, workers=None):
+        """Read the rows of all of the lazy loaded units.
+
+        Row data that can be loaded in another process is split into chunks
+        and loaded in a ProcessPoolExecutor, the rest is loaded here. Units
+        are always found and read in order in this process, so the reach
+        numbers and initial conditions are the same as a normal load.
+
+        Args:
+            workers=None(int): the number of processes to use. If None, < 2
+                or concurrent.futures isn't available everything is loaded
+                in this process.
+
+        Raises:
+            ValueError: if any of the row data is invalid.
+        """
+        collections = [
+            c for unit in self.units for c in unit.row_data.values()
+            if isinstance(c, LazyRowDataCollection) and not c.is_loaded
+        ]
+        if ProcessPoolExecutor is None or workers is None or workers < 2:
+            for c in collections:
+                c.load()
+            return
+
+        remote = []
+        jobs = []
+        for c in collections:
+            job = c.loadJob()
+            if job is None:
+                c.load()
+            else:
+                remote.append(c)
+                jobs.append(job)
+        if not jobs:
+            return
+
+        size = uf.chunkSize(len(jobs), workers)
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(workers) as executor:
+            results = executor.map(runLoadJobs, chunks)
+            i = 0
+            for chunk in results:
+                for columns in chunk:
+                    remote[i].setLoaded(columns)
+                    i += 1
+
+    def _openContents(self, file_path, arg_dict):
+        """Get the contents of the file in the form set by arg_dict.
+
+        Returns:
+            list - of the file lines, or a LineSource or MappedFile if the
+                'stream' or 'mmap' options are set.
+
+        Raises:
+            IOError: If the file cannot be loaded or is empty.
+        """
+        if arg_dict.get('mmap', False):
+            return ftools.MappedFile(file_path)
+
+        if arg_dict.get('stream', False):
+            contents = ftools.LineSource(ftools.iterFile(file_path))
+            if not contents.hasLine(0):
+                raise IOError('Unable to load file at: ' + file_path)
+        else:
+            contents = self.__loadFile(file_path)
+            if(contents == False):
+                raise IOError('Unable to load file at: ' + file_path)
+        return contents
+
+    def _checkFileType(self, file_path):
+        """Check the file extension and set is_ied if it's an .ied file.
+
+        Raises:
+            AttributeError: if the file is not of an expected type.
+        """
         if not uf.checkFileType(file_path, ext=['.dat', '.DAT']):
             if not uf.checkFileType(file_path, ext=['.ied', '.IED']):
                 logger.error('Illegal File Error: ' + file_path + '\nDoes not have extension (.dat, .DAT, .ied, .IED)')
@@ -124,52 +560,144 @@ class DatLoader(ATool, ALoader):
             else:
                 self.is_ied = True
 
-        contents = self.__loadFile(file_path)
-        if(contents == False):
-            raise IOError('Unable to load file at: ' + file_path)
-
-        return self.buildDat(contents, arg_dict)
+    @contextmanager
+    def _storageSet(self, arg_dict):
+        """Set the default data object storage from arg_dict['storage'].
 
-    def buildDat(self, contents, arg_dict={}):
+        The units create their own data objects so set the default storage
+        while they're loaded and put it back afterwards.
         """
+        storage = arg_dict.get('storage', None)
+        if storage is None:
+            yield
+            return
+
+        prev_storage = dataobject.default_storage
+        dataobject.setDefaultStorage(storage)
+        try:
+            yield
+        finally:
+            dataobject.setDefaultStorage(prev_storage)
+
+    def buildDat(self, contents, arg_dict={}, previous=None):
+        """Build the units in contents and add them to self.units.
+
+        The units are marked as unchanged (see AUnit.has_changed). If
+        DatCollection.incremental is set ('lazy' and 'mmap' loads) the hash
+        of the lines that each unit is read from is added to the
+        DatCollection.unit_sources, so the collection can be refreshed, and
+        their lines are stored in AUnit._source for incremental writes.
+        Hashing every unit isn't free, so it's skipped for full loads.
+
+        Args:
+            contents(list): the lines of the .dat file. This can also be a
+                filetools.LineSource for streaming the file, or a
+                filetools.MappedFile, in which case the byte offsets of the
+                units are added to the DatCollection.unit_offsets.
+            arg_dict={}(dict): see loadFile().
+            previous=None(UnitSources): units from an earlier read of the
+                file to reuse where they haven't changed.
+
+        Returns:
+            DatCollection - self.units.
         """
         self.contents = contents
+        mapped = isinstance(contents, ftools.MappedFile)
+        sources = self.units.unit_sources
+        track = self.units.incremental
+        for unit in self._iterUnits(contents, previous):
+            self.units.addUnit(unit, update_node_count=False, no_copy=True)
+            # Reused units keep any changes made before the refresh
+            if unit._source is None:
+                unit.setChangeStatus(False)
+            if track:
+                start, end = self.unit_span
+                lines = contents[start:end]
+                digest = sourceDigest(lines)
+                sources.append((digest, len(lines), unit))
+                unit._source = (start, start + len(lines), digest)
+            else:
+                unit._source = None
+            if mapped:
+                start, end = self._spanOffsets(contents)
+                self.units.unit_offsets.append((start, end, unit))
+        return self.units
+
+    def _spanOffsets(self, contents):
+        """Get the byte offsets of self.unit_span in a MappedFile.
+
+        Returns:
+            tuple - (start, end) byte offsets of the last unit read.
+        """
+        start, end = self.unit_span
+        # Units at the end of the file can report a line past the end
+        if not contents.hasLine(end - 1):
+            end = len(contents)
+        return contents.offset(start), contents.offset(end)
+
+    def _iterUnits(self, contents, previous=None):
+        """Generator that builds the units in contents.
+
+        Walks the contents by index and hands them to the unit factory to
+        build each unit. If contents is a filetools.LineSource the lines
+        before the current position are released after each unit.
+
+        Args:
+            contents(list): the lines of the .dat file, or a LineSource.
+            previous=None(UnitSources): units from an earlier read of the
+                file. These are used instead of reading the unit again if
+                their text hasn't changed.
+
+        Returns:
+            generator - of the units in the order that they're found.
+        """
+        release = getattr(contents, 'release', None)
+        self.unknown_data = []
 
         # Counter for the number of rows that have been read from the
         # file contents list.
         i = 0
         # Get an instance of the unit factory with the number of nodes in the file.
         unit_factory = FmpUnitFactory()
-
-        # Dictionary containing the keys to identify units in the dat file
-        unit_vars = unit_factory.getUnitIdentifiers()
+        unit_factory.lazy = self.lazy
 
         # Create a unit from the header data in the first few lines of the dat file.
         if not self.is_ied:
-            i, self.temp_unit = unit_factory.createUnitFromFile(self.contents, 0, 'HEADER', 0)
-            in_unknown_section = False
+            reused = previous.expected(contents, 0) if previous is not None else None
+            if reused is not None:
+                unit, i = reused
+                unit_factory.addExistingUnit(unit)
+            else:
+                i, unit = unit_factory.createUnitFromFile(contents, 0, 'HEADER', 0)
+                if previous is not None:
+                    unit = previous.match(contents[0:i], unit)
+            self.cur_no_of_units += 1
+            self.unit_span = (0, i)
+            yield unit
 
-            # Now we can update the HeaderUnit subContents
-            self.updateSubContents()
+        unknown_start = i
 
-        in_unknown_section = False
-        while i < len(self.contents):
+        while True:
 
-            # Get the line and then split it to retrieve the first word.
-            # Check this word against the # unit_type keys we set above to see
-            line = self.contents[i]
-            temp_line = line.strip()
-            if temp_line:
-                first_word = line.split()[0].strip()
-            else:
-                first_word = 'Nothing'
+            # Get the line and check whether its first word is one of the
+            # unit FILE_KEY's
+            try:
+                line = contents[i]
+            except IndexError:
+                break
+            first_word = unit_factory.fileKey(line)
 
-            if first_word in unit_vars:
+            if first_word is not None:
 
                 # If building an UnknownUnit then create and reset
-                if(in_unknown_section == True):
+                if self.unknown_data:
                     self.createUnknownSection()
-                    self.updateSubContents()
+                    if previous is not None:
+                        self.temp_unit = previous.match(contents[unknown_start:i], self.temp_unit)
+                    self.unknown_data = []
+                    self.cur_no_of_units += 1
+                    self.unit_span = (unknown_start, i)
+                    yield self.temp_unit
 
                     # Reset the reach for the UnknownUnit
                     unit_factory.same_reach = False
@@ -177,36 +705,48 @@ class DatLoader(ATool, ALoader):
                 '''Call the unit creator function and get back the unit and the
                 updated contents list index.
                 Most of these variables are self explanatory, but
-                unit_vars[first_word] is the key for the unit type to make.
+                first_word is the FILE_KEY for the unit type to make.
                 '''
-#                 i, self.temp_unit = unit_factory.createUnit(self.contents, i,
-#                         unit_vars[first_word], self.cur_no_of_units)
-                i, self.temp_unit = unit_factory.createUnitFromFile(self.contents, i,
-                                                                    first_word,
-                                                                    self.cur_no_of_units)
+                start = i
+                reused = previous.expected(contents, i) if previous is not None else None
+                if reused is not None:
+                    unit, line_count = reused
+                    unit_factory.addExistingUnit(unit)
+                    i += line_count - 1
+                else:
+                    i, unit = unit_factory.createUnitFromFile(contents, i,
+                                                              first_word,
+                                                              self.cur_no_of_units)
+                    if previous is not None and unit != False:
+                        unit = previous.match(contents[start:i + 1], unit)
 
                 '''In case we got in but found something wasn't supported.
                 it's i-1 because we can't return onto the same line that was
                 read or it will loop forever, so store it here and move on
                 '''
-                if self.temp_unit == False:
-                    self.unknown_data.append(self.contents[i].rstrip('\n'))
+                if unit == False:
+                    if not self.unknown_data:
+                        unknown_start = i
+                    self.unknown_data.append(contents[i].rstrip('\n'))
                     i += 1
-                    self.unknown_data.append(self.contents[i].rstrip('\n'))
-                    in_unknown_section = True
+                    self.unknown_data.append(contents[i].rstrip('\n'))
                 else:
-                    self.updateSubContents()
-                    in_unknown_section = False
+                    self.cur_no_of_units += 1
+                    self.unit_span = (start, i + 1)
+                    yield unit
 
             else:
-                in_unknown_section = True
-                self.unknown_data.append(self.contents[i].rstrip('\n'))
+                if not self.unknown_data:
+                    unknown_start = i
+                self.unknown_data.append(contents[i].rstrip('\n'))
 
             i += 1
+            if release is not None:
+                # Keep the lines of an UnknownUnit until it's been built
+                release(unknown_start if self.unknown_data else i)
 
-        line = None
-        del self.unknown_data
-        return self.units
+        self.temp_unit = None
+        self.unknown_data = []
 
     def createUnknownSection(self):
         """Builds unidentified sections from the .DAT file.
@@ -240,7 +780,7 @@ class DatLoader(ATool, ALoader):
         # Don't update node count here as we aren't adding any 'new' nodes
         self.units.addUnit(self.temp_unit, update_node_count=False, no_copy=True)
         self.cur_no_of_units += 1
-        del self.temp_unit
+        self.temp_unit = None
         self.unknown_data = []
 
     def __loadFile(self, filepath):
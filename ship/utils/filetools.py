@@ -38,13 +38,26 @@
 from __future__ import unicode_literals
 
 import os
+import sys
+import mmap
+import array
+import bisect
+import locale
 import logging
+import tempfile
+from itertools import islice
 
 from ship.utils import utilfunctions as uf
 
 # logging references with a __name__ set to this module.
 logger = logging.getLogger(__name__)
 
+WRITE_BUFFER = 1 << 20
+"""Default size in bytes of the write buffer used by writeLines()."""
+
+WRITE_CHUNK = 4096
+"""Number of lines joined into each write() call by writeLines()."""
+
 
 def getFile(file_path):
     """Text file reader.
@@ -64,8 +77,10 @@ def getFile(file_path):
     file_contents = []
     line = ""
 
+    # 'U' is the default behaviour in Python 3 and was removed in 3.11
+    mode = 'rU' if sys.version_info[0] < 3 else 'r'
     try:
-        with open(file_path, 'rU') as f:
+        with open(file_path, mode) as f:
             for line in f:
                 file_contents.append(uf.encodeStr(line))
     except IOError:
@@ -78,6 +93,314 @@ def getFile(file_path):
     return file_contents
 
 
+def iterFile(file_path):
+    """Text file reader that yields the lines one at a time.
+
+    The same as getFile() except that the lines are yielded as they're read
+    rather than being collected into a list, so the whole file doesn't need
+    to be held in memory.
+
+    Args:
+        file_path (str): File path for text file to load.
+
+    Returns:
+        generator - of the lines in the file.
+
+    Raises:
+        IOError: if problem in reading file.
+    """
+    mode = 'rU' if sys.version_info[0] < 3 else 'r'
+    try:
+        with open(file_path, mode) as f:
+            for line in f:
+                yield uf.encodeStr(line)
+    except IOError:
+        logger.error('Read file IOError')
+        raise IOError('Unable to read file at: ' + file_path)
+
+
+class LineSource(object):
+    """Indexable window over the lines read from an iterator.
+
+    Allows code written to walk a contents list by index (like the
+    readUnitData() methods of the dat units) to read from a file as it's
+    being streamed. Lines are only read from the iterator when an index is
+    asked for, so any amount of lookahead is possible, and release() can be
+    called to drop the lines that have been finished with.
+
+    Indexes are always the position of the line in the whole file. Asking
+    for a line that has been released, or one past the end of the file,
+    raises an IndexError. Negative indexes aren't supported.
+    """
+
+    def __init__(self, lines):
+        """Constructor.
+
+        Args:
+            lines: an iterable of the lines, e.g. the generator returned by
+                iterFile().
+        """
+        self._lines = iter(lines)
+        self._buffer = []
+        self._start = 0
+        self._exhausted = False
+
+    def _fill(self, index):
+        """Read lines until index is in the buffer or there are no more.
+
+        Args:
+            index(int): the line index required. If None read to the end.
+
+        Returns:
+            bool - True if index is in the buffer.
+        """
+        buffer = self._buffer
+        if index is None:
+            if not self._exhausted:
+                buffer.extend(self._lines)
+                self._exhausted = True
+            return True
+
+        needed = index - self._start - len(buffer) + 1
+        while needed > 0 and not self._exhausted:
+            try:
+                buffer.append(next(self._lines))
+                needed -= 1
+            except StopIteration:
+                self._exhausted = True
+        return needed <= 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step is not None:
+                raise ValueError('LineSource does not support slice steps')
+            start = index.start if index.start is not None else self._start
+            if start < self._start or (index.stop is not None and index.stop < 0):
+                raise IndexError('line %d has already been released' % start)
+            if index.stop is None:
+                self._fill(None)
+            else:
+                self._fill(index.stop - 1)
+            stop = None if index.stop is None else index.stop - self._start
+            return self._buffer[start - self._start:stop]
+
+        if index < self._start:
+            raise IndexError('line %d has already been released' % index)
+        if not self._fill(index):
+            raise IndexError('LineSource index out of range')
+        return self._buffer[index - self._start]
+
+    def __len__(self):
+        """The number of lines in the file.
+
+        Note:
+            This has to read the rest of the file into memory.
+        """
+        self._fill(None)
+        return self._start + len(self._buffer)
+
+    def hasLine(self, index):
+        """Check if there is a line at index without raising an error.
+
+        Returns:
+            bool - False if index is past the end of the file.
+        """
+        return index >= self._start and self._fill(index)
+
+    def release(self, index):
+        """Drop all of the lines before index from the buffer.
+
+        Args:
+            index(int): lines from this index onwards will be kept.
+        """
+        if index > self._start:
+            self._fill(index - 1)
+            del self._buffer[:index - self._start]
+            self._start = index
+
+    @property
+    def buffered(self):
+        """The number of lines currently held in memory."""
+        return len(self._buffer)
+
+
+class MappedFile(object):
+    """Indexable lines of a memory mapped file.
+
+    Gives the same line access as the list returned by getFile() without
+    reading the file into memory. The file is mapped rather than read and
+    the line start offsets are found as the lines are asked for, so opening
+    is quick however large the file is and only the lines that are used are
+    decoded. offset() and lineAt() convert between line indexes and byte
+    offsets in the file.
+
+    The lines are returned with '\\r\\n' and '\\r' line endings changed to
+    '\\n', the same as reading the file in text mode with universal
+    newlines. Negative indexes aren't supported.
+
+    Close the file when finished with it, or use it as a context manager.
+    """
+
+    def __init__(self, file_path, encoding=None):
+        """Constructor.
+
+        Args:
+            file_path(str): the file to map.
+            encoding=None(str): used to decode the lines. Defaults to the
+                same encoding as open() uses.
+
+        Raises:
+            IOError: if the file can't be read or is empty.
+        """
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        self.encoding = encoding
+        self.buffer = None
+        try:
+            self._file = open(file_path, 'rb')
+        except IOError:
+            logger.error('Read file IOError')
+            raise IOError('Unable to read file at: ' + file_path)
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size == 0:
+            self._file.close()
+            raise IOError('Unable to map empty file at: ' + file_path)
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Start offset of each line found so far, followed by the end of
+        # the last one
+        self._starts = array.array('q', [0])
+        self._exhausted = False
+        # Offsets of the next '\n' and '\r' found, or size if there are no
+        # more. Kept so the file is only searched once for each
+        self._next_lf = -1
+        self._next_cr = -1
+
+    def _nextStart(self, start):
+        """Get the offset of the line after the one starting at start.
+
+        Lines can end with '\\n', '\\r\\n' or '\\r'.
+
+        Returns:
+            int - the offset, or None if the line has no line ending.
+        """
+        if self._next_lf < start:
+            pos = self.buffer.find(b'\n', start)
+            self._next_lf = pos if pos >= 0 else self.size
+        if self._next_cr < start:
+            pos = self.buffer.find(b'\r', start)
+            self._next_cr = pos if pos >= 0 else self.size
+        lf, cr = self._next_lf, self._next_cr
+        if lf <= cr:
+            return None if lf == self.size else lf + 1
+        if lf == cr + 1 and lf < self.size:
+            return lf + 1
+        return cr + 1
+
+    def _fill(self, index):
+        """Find line offsets until index is known or there are no more.
+
+        Args:
+            index(int): the line index required. If None find them all.
+
+        Returns:
+            bool - True if index is a line in the file.
+        """
+        starts = self._starts
+        while not self._exhausted and (index is None or len(starts) <= index + 1):
+            start = self._nextStart(starts[-1])
+            if start is None:
+                if starts[-1] < self.size:
+                    starts.append(self.size)
+                self._exhausted = True
+            else:
+                starts.append(start)
+        return index is None or index < len(starts) - 1
+
+    def _line(self, index):
+        line = self.buffer[self._starts[index]:self._starts[index + 1]].decode(self.encoding)
+        if line.endswith('\r\n'):
+            line = line[:-2] + '\n'
+        elif line.endswith('\r'):
+            line = line[:-1] + '\n'
+        return line
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step is not None:
+                raise ValueError('MappedFile does not support slice steps')
+            start = 0 if index.start is None else index.start
+            if start < 0 or (index.stop is not None and index.stop < 0):
+                raise IndexError('MappedFile does not support negative indexes')
+            if index.stop is None:
+                self._fill(None)
+                stop = len(self._starts) - 1
+            else:
+                self._fill(index.stop - 1)
+                stop = min(index.stop, len(self._starts) - 1)
+            return [self._line(i) for i in range(start, stop)]
+
+        if index < 0 or not self._fill(index):
+            raise IndexError('MappedFile index out of range')
+        return self._line(index)
+
+    def __len__(self):
+        """The number of lines in the file.
+
+        Note:
+            This has to find the start of every line in the file.
+        """
+        self._fill(None)
+        return len(self._starts) - 1
+
+    def hasLine(self, index):
+        """Check if there is a line at index without raising an error."""
+        return index >= 0 and self._fill(index)
+
+    def offset(self, index):
+        """Get the byte offset in the file of the start of a line.
+
+        Args:
+            index(int): the line index. Can be the number of lines in the
+                file, to get the offset of the end of the file.
+
+        Raises:
+            IndexError: if index is past the end of the file.
+        """
+        if index < 0 or not (self._fill(index) or index == len(self._starts) - 1):
+            raise IndexError('MappedFile index out of range')
+        return self._starts[index]
+
+    def lineAt(self, offset):
+        """Get the index of the line that contains a byte offset.
+
+        Args:
+            offset(int): the byte offset in the file.
+
+        Raises:
+            IndexError: if offset isn't in the file.
+        """
+        if offset < 0 or offset >= self.size:
+            raise IndexError('offset %d is not in the file' % offset)
+        starts = self._starts
+        while starts[-1] <= offset:
+            self._fill(len(starts) - 1)
+        return bisect.bisect_right(starts, offset) - 1
+
+    def close(self):
+        """Unmap and close the file."""
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 def writeFile(contents, file_path, add_newline=True):
     """Text file writer
 
@@ -107,6 +430,100 @@ def writeFile(contents, file_path, add_newline=True):
         logger.error('Write file TypeError')
         raise TypeError
 
+
+def writeLines(lines, file_path, buffer_size=WRITE_BUFFER, atomic=False):
+    """Streaming text file writer.
+
+    Writes the same output as writeFile(lines, file_path), but lines can be
+    any iterable, e.g. a generator, so the whole contents never need to be
+    held in memory. The lines are joined into blocks of WRITE_CHUNK lines
+    and written through a buffer of buffer_size bytes.
+
+    If atomic is True the lines are written to a temporary file in the same
+    folder, which is renamed to file_path once it is complete. This means
+    that file_path is never left partly written if there's an error, and
+    any existing file is only replaced when the new one is finished.
+
+    Args:
+        lines(iterable): str lines to write. A new-line is added to the end
+            of each one.
+        file_path(str): Name of file to create.
+        buffer_size=WRITE_BUFFER(int): size in bytes of the file buffer.
+        atomic=False(bool): if True write to a temporary file and rename
+            it to file_path when finished.
+
+    Raises:
+        IOError: if problem in writing file.
+        TypeError: if string not given for file_path
+    """
+    if atomic:
+        folder = os.path.dirname(os.path.abspath(file_path))
+        fd, write_path = tempfile.mkstemp(dir=folder, prefix='.ship_', suffix='.tmp')
+        os.close(fd)
+    else:
+        write_path = file_path
+
+    try:
+        with open(write_path, 'w', buffer_size) as f:
+            lines = iter(lines)
+            chunk = list(islice(lines, WRITE_CHUNK))
+            while chunk:
+                f.write('\n'.join(chunk))
+                f.write('\n')
+                chunk = list(islice(lines, WRITE_CHUNK))
+
+        if atomic:
+            _setNewFileMode(write_path, file_path)
+            _replaceFile(write_path, file_path)
+    except IOError:
+        logger.error('Write file IOError')
+        _removeQuietly(write_path, atomic)
+        raise IOError
+    except TypeError:
+        logger.error('Write file TypeError')
+        _removeQuietly(write_path, atomic)
+        raise TypeError
+    except BaseException:
+        _removeQuietly(write_path, atomic)
+        raise
+
+
+def _setNewFileMode(temp_path, file_path):
+    """Give temp_path the permissions that file_path has or would have.
+
+    tempfile.mkstemp() only allows the owner to read the file. If file_path
+    already exists its permissions are copied, otherwise the defaults for a
+    new file are used.
+    """
+    if os.path.exists(file_path):
+        mode = os.stat(file_path).st_mode & 0o777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(temp_path, mode)
+
+
+def _replaceFile(src, dst):
+    """Rename src to dst, replacing dst if it exists."""
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+    else:
+        # Python 2 on Windows won't rename over an existing file
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+def _removeQuietly(path, remove=True):
+    """Delete a temporary file if it exists, ignoring any errors."""
+    if not remove:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 ###############################
 #  Path Functions and classes #
 ###############################
@@ -239,6 +239,21 @@ def findMax(val1, val2):
         return val1, val2, False
 
 
+def chunkSize(count, workers):
+    """Get the number of jobs to send to a worker process at a time.
+
+    Args:
+        count(int): the total number of jobs.
+        workers(int): the number of worker processes.
+
+    Returns:
+        int - the chunk size. Always at least 1.
+    """
+    # A few chunks per worker keeps them all busy without sending
+    # too many small messages
+    return max(1, -(-count // (workers * 4)))
+
+
 def fileExtensionWithoutPeriod(filepath, name_only=False):
     """Extracts the extension without '.' from filepath.
 
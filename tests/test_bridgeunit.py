@@ -139,6 +139,29 @@ class BridgeUnitTests(unittest.TestCase):
         self.assertListEqual(b.row_data['opening'].dataObjectAsList(rdt.SPRINGING_LEVEL), spring)
         self.assertListEqual(b.row_data['opening'].dataObjectAsList(rdt.SOFFIT_LEVEL), soffit)
 
+    def test_readMultipleOpenings(self):
+        """Check that bridges with more than one opening are read ok."""
+        unitdata = self.arch_unitdata[:-2] + [
+            '         3',
+            '     0.710     3.000    34.470    36.000',
+            '     3.000     5.000    34.470    36.000',
+            '     5.500     6.441    34.470    36.000']
+        open_start = [0.71, 3.0, 5.5]
+        open_end = [3.0, 5.0, 6.441]
+
+        for lazy in (False, True):
+            b = bridgeunit.BridgeUnitArch()
+            b.readUnitData(unitdata, 0, lazy=lazy)
+            self.assertListEqual(b.row_data['opening'].dataObjectAsList(rdt.OPEN_START), open_start)
+            self.assertListEqual(b.row_data['opening'].dataObjectAsList(rdt.OPEN_END), open_end)
+            self.assertEqual(b.getData()[-4:], unitdata[-4:])
+
+        # Openings that overlap are still rejected
+        unitdata[-1] = '     4.000     6.441    34.470    36.000'
+        b = bridgeunit.BridgeUnitArch()
+        with self.assertRaises(ValueError):
+            b.readUnitData(unitdata, 0)
+
     def test_readUnitDataUsbpr(self):
         """
         """
@@ -61,3 +61,24 @@ class test_SpillUnit(unittest.TestCase):
         c.readUnitData(self.culvert_data, 0)
         out = c.getData()
         self.assertListEqual(out, test_out)
+
+    def test_factoryDispatch(self):
+        """Check the factory uses FILE_KEY2 to pick the culvert type."""
+        factory = FmpUnitFactory()
+        self.assertEqual(factory.fileKey(self.culvert_data[0]), 'CULVERT')
+        self.assertEqual(factory.fileKey('  CULVERT comment'), 'CULVERT')
+        self.assertIsNone(factory.fileKey(self.culvert_data[3]))
+        self.assertIsNone(factory.fileKey('CULVERTS'))
+        self.assertIsNone(factory.fileKey(''))
+
+        i, unit = factory.createUnitFromFile(self.culvert_data, 0, 'CULVERT', 0)
+        self.assertIsInstance(unit, culvertunit.CulvertUnitInlet)
+
+        table = FmpUnitFactory.dispatchTable()
+        self.assertIs(table['CULVERT']['OUTLET'], culvertunit.CulvertUnitOutlet)
+        self.assertIs(table['CULVERT']['INLET'], culvertunit.CulvertUnitInlet)
+
+        unknown = list(self.culvert_data)
+        unknown[1] = 'BEND'
+        i, unit = factory.createUnitFromFile(unknown, 0, 'CULVERT', 0)
+        self.assertEqual((i, unit), (0, False))
@@ -1,9 +1,12 @@
 from __future__ import unicode_literals
 
+import copy
+import pickle
 import unittest
 
 from ship.datastructures import dataobject as do
 from ship.datastructures.dataobject import ADataRowObject
+from ship.datastructures import STORAGE_TYPES as st
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 
 
@@ -133,3 +136,157 @@ class DataObjectsTest(unittest.TestCase):
         expected_output = ''
         self.assertEqual(self.txt.getPrintableValue(1), expected_output, 'Special getPrintableValue() 1 failure')
         self.failUnlessRaises(IndexError, lambda: self.txt.getPrintableValue(3))
+
+    def test_printFormatter(self):
+        """Check the compiled formatters match the general formatting."""
+        sn = do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=2, use_sn=1000)
+        integer = do.IntData(rdt.CHAINAGE, format_str='{:>10}')
+        txt = do.StringData(rdt.SPECIAL, format_str='{:<10}')
+        tests = [
+            (self.flt, [0.0, 103.142, -2.5, 1e12, 3, '']),
+            (sn, [999.0, 1000.0, 123456.789]),
+            (integer, [0, 12, -4, 3.0, '']),
+            (self.sym, [True, False, 1, 0, '']),
+            (self.con, ['LEFT', 'RIGHT', '', False, 0]),
+            (self.txt, ['1435', '', '~']),
+            (txt, ['1435', '', '~']),
+        ]
+        for obj, values in tests:
+            formatter = obj.printFormatter()
+            general = ADataRowObject._buildFormatter(obj)
+            for v in values:
+                self.assertEqual(formatter(v), general(v))
+
+        # Changing the format should rebuild the formatter
+        self.assertEqual(self.flt.printFormatter()(1.5), '     1.500')
+        self.flt.no_of_dps = 1
+        self.assertEqual(self.flt.printFormatter()(1.5), '       1.5')
+
+    def test_copy(self):
+        self.flt.addValue(1.5)
+        self.flt.getPrintableValue(0)
+        self.assertFalse(hasattr(self.flt, '__dict__'))
+
+        flt = pickle.loads(pickle.dumps(self.flt))
+        self.assertListEqual(list(flt.data_collection), [1.5])
+        self.assertEqual(flt.getPrintableValue(0), '     1.500')
+
+        flt = copy.deepcopy(self.flt)
+        flt.no_of_dps = 1
+        self.assertEqual(flt.getPrintableValue(0), '       1.5')
+        self.assertEqual(self.flt.getPrintableValue(0), '     1.500')
+
+    def test_array_storage(self):
+        """Check FloatData and IntData behave the same with array storage."""
+        flt = do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=3, storage=st.ARRAY)
+        self.assertEqual(flt.storage, st.ARRAY)
+        flt.addValue(1.5)
+        flt.addValue('4.25')
+        flt.addValue(3, 1)
+        self.assertListEqual(list(flt), [1.5, 3.0, 4.25])
+        flt.setValue(2.0, 1)
+        self.assertEqual(flt[1], 2.0)
+        flt.deleteValue(0)
+        self.assertListEqual(list(flt), [2.0, 4.25])
+        self.assertEqual(flt.getPrintableValue(1), '     4.250')
+        with self.assertRaises(IndexError):
+            flt.addValue(5.1, 10)
+
+        intd = do.IntData(rdt.CHAINAGE, storage=st.ARRAY)
+        intd.addValue('3')
+        intd.addValue(4)
+        self.assertListEqual(list(intd), [3, 4])
+
+        # Data objects without a typecode always use list storage
+        txt = do.StringData(rdt.SPECIAL, storage=st.ARRAY)
+        self.assertEqual(txt.storage, st.LIST)
+
+    def test_array_storage_fallback(self):
+        """Values an array can't hold should switch the object to a list."""
+        flt = do.FloatData(rdt.CHAINAGE, no_of_dps=3, storage=st.ARRAY)
+        flt.addValue(1.0)
+        flt.addValue()
+        self.assertEqual(flt.storage, st.LIST)
+        self.assertListEqual(flt.data_collection, [1.0, None])
+
+    def test_setDefaultStorage(self):
+        do.setDefaultStorage(st.ARRAY)
+        try:
+            flt = do.FloatData(rdt.CHAINAGE, no_of_dps=3)
+        finally:
+            do.setDefaultStorage(st.LIST)
+        self.assertEqual(flt.storage, st.ARRAY)
+        with self.assertRaises(ValueError):
+            do.setDefaultStorage(99)
+
+    def test_categorical_storage(self):
+        """Check ConstantData, SymbolData and StringData categorical storage."""
+        const = do.ConstantData(rdt.BANKMARKER, ('', 'LEFT', 'RIGHT', 'BED'), '{:<10}', default='')
+        self.assertEqual(const.storage, st.CATEGORICAL)
+        const.extendValues(['LEFT', '', '', 'BED'])
+        const.addValue('RIGHT')
+        const.addValue('BED', 0)
+        const.setValue('', 1)
+        self.assertListEqual(list(const), ['BED', '', '', '', 'BED', 'RIGHT'])
+        const.deleteValue(0)
+        self.assertListEqual(const.data_collection.tolist(), ['', '', '', 'BED', 'RIGHT'])
+        self.assertListEqual(const.indicesOf('BED'), [3])
+        self.assertEqual(const.getPrintableValue(4), 'RIGHT     ')
+
+        # Columns of the same type share the categories
+        const2 = do.ConstantData(rdt.BANKMARKER, ('', 'LEFT', 'RIGHT', 'BED'), '{:<10}', default='')
+        self.assertIs(const.data_collection.categories, const2.data_collection.categories)
+
+        sym = do.SymbolData(rdt.PANEL_MARKER, '*', format_str='{:<5}', default=False)
+        self.assertEqual(sym.storage, st.CATEGORICAL)
+        sym.extendValues(['*', False])
+        self.assertListEqual(list(sym), [True, False])
+
+        # StringData is only categorical when asked
+        self.assertEqual(do.StringData(rdt.SPECIAL).storage, st.LIST)
+        txt = do.StringData(rdt.SPECIAL, categorical=True)
+        self.assertEqual(txt.storage, st.CATEGORICAL)
+        txt = do.StringData(rdt.SPECIAL, categorical=True, storage=st.LIST)
+        self.assertEqual(txt.storage, st.LIST)
+
+        flt = copy.deepcopy(const)
+        flt.addValue('LEFT')
+        self.assertEqual(len(const), 5)
+        self.assertIs(flt.data_collection.categories, const.data_collection.categories)
+        self.assertListEqual(list(pickle.loads(pickle.dumps(const))), list(const))
+
+    def test_categorical_storage_fallback(self):
+        """Check the codes are widened and too many categories use a list."""
+        cats = do.Categories()
+        col = do.CategoricalColumn(cats, ['a', 'b'])
+        self.assertEqual(col.codes.typecode, 'B')
+        col.extend([str(i) for i in range(300)])
+        self.assertEqual(col.codes.typecode, 'H')
+        self.assertEqual(col[301], '299')
+        del col[2:]
+        self.assertEqual(col, ['a', 'b'])
+        self.assertTrue('b' in col)
+        self.assertFalse('c' in col)
+        self.assertEqual(col.count('a'), 1)
+
+        key = 'test_fallback'
+        txt = do.StringData(key, categorical=True)
+        txt.extendValues([str(i) for i in range(txt.max_categories)])
+        self.assertEqual(txt.storage, st.CATEGORICAL)
+        txt.addValue('one too many')
+        self.assertEqual(txt.storage, st.LIST)
+        self.assertEqual(txt[-1], 'one too many')
+        self.assertEqual(len(txt), txt.max_categories + 1)
+
+        # Each column counts its own values and nothing is kept globally
+        txt2 = do.StringData(key, categorical=True)
+        txt2.extendValues(['a', 'b'])
+        self.assertEqual(txt2.storage, st.CATEGORICAL)
+        self.assertEqual(len(txt2.data_collection.categories), 2)
+        self.assertNotIn(('StringData', key), do._shared_categories)
+
+        # Copies don't share the column's Categories
+        txt3 = copy.deepcopy(txt2)
+        txt3.addValue('c')
+        self.assertIsNot(txt3.data_collection.categories, txt2.data_collection.categories)
+        self.assertEqual(len(txt2.data_collection.categories), 2)
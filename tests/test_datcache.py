@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ship.utils.fileloaders import datcache
+
+
+class DatCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        fd, self.path = tempfile.mkstemp(suffix='.dat')
+        with os.fdopen(fd, 'w') as f:
+            f.write('some\ncontents\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        os.remove(self.path)
+
+    def test_fileKey(self):
+        key = datcache.fileKey(self.path, ('option',))
+        self.assertEqual(key['path'], os.path.abspath(self.path))
+        self.assertEqual(key['size'], 14)
+        self.assertEqual(key['sha1'], datcache.contentHash(self.path))
+        self.assertEqual(key['version'], datcache.cacheVersion())
+        self.assertEqual(key['options'], ('option',))
+
+    def test_loadCached(self):
+        key = datcache.fileKey(self.path)
+        self.assertIsNone(datcache.loadCached(self.cache_dir, key))
+        self.assertTrue(datcache.saveCached(self.cache_dir, key, {'units': [1, 2]}))
+        self.assertEqual(datcache.loadCached(self.cache_dir, key), {'units': [1, 2]})
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(datcache.cachePath(self.cache_dir, key))])
+
+        # Different options or file contents don't match
+        self.assertIsNone(datcache.loadCached(self.cache_dir, datcache.fileKey(self.path, ('lazy',))))
+        with open(self.path, 'w') as f:
+            f.write('other\ncontents\n')
+        self.assertIsNone(datcache.loadCached(self.cache_dir, datcache.fileKey(self.path)))
+
+    def test_corruptCache(self):
+        key = datcache.fileKey(self.path)
+        with open(datcache.cachePath(self.cache_dir, key), 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertIsNone(datcache.loadCached(self.cache_dir, key))
+
+    def test_defaultCacheDir(self):
+        self.assertFalse(datcache.defaultCacheDir().startswith(tempfile.gettempdir()))
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'needs posix file ownership')
+    def test_insecureCache(self):
+        """Caches that other users can write to aren't used."""
+        key = datcache.fileKey(self.path)
+        self.assertTrue(datcache.saveCached(self.cache_dir, key, {'units': [1, 2]}))
+        os.chmod(self.cache_dir, 0o777)
+        self.assertIsNone(datcache.loadCached(self.cache_dir, key))
+        self.assertFalse(datcache.saveCached(self.cache_dir, key, {'units': [1, 2]}))
+
+        os.chmod(self.cache_dir, 0o700)
+        os.chmod(datcache.cachePath(self.cache_dir, key), 0o666)
+        self.assertIsNone(datcache.loadCached(self.cache_dir, key))
+
+        new_dir = os.path.join(self.cache_dir, 'new')
+        self.assertTrue(datcache.saveCached(new_dir, key, {'units': [1, 2]}))
+        self.assertEqual(os.stat(new_dir).st_mode & 0o077, 0)
@@ -1,12 +1,14 @@
 from __future__ import unicode_literals
 
 import os
+import tempfile
 import unittest
 from ship.fmp.datcollection import DatCollection
 from ship.fmp import fmpunitfactory as iuf
 from ship.fmp.datunits import riverunit
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
 from ship.utils.filetools import PathHolder
+from ship.utils import filetools
 
 
 class IsisUnitCollectionTest(unittest.TestCase):
@@ -126,6 +128,40 @@ class IsisUnitCollectionTest(unittest.TestCase):
         self.assertListEqual(ic_flow, [3.0, 0.0, 0.0], 'Initial conditions flow update error')
         self.assertListEqual(ic_elev, [10.0, 0.0, 0.0], 'Initial conditions elevation update error')
 
+    def test_addUnits(self):
+        """Add a list of units in one go."""
+        self.dat.addUnit(self.riv1)
+        network = self.dat.network()
+        self.dat.addUnits([self.riv2, self.brg1], 3,
+                          ics=[{rdt.FLOW: 3.0}, {rdt.FLOW: 4.0}])
+        self.dat.addUnits([self.riv3], 2)
+        self.assertListEqual(self.dat.units[2:-1], [self.riv3, self.riv1, self.riv2, self.brg1])
+        self.assertEqual(self.dat.index(self.brg1), 5)
+        self.assertEqual(self.dat.index('riv3', 'river'), 2)
+        self.assertIn(self.brg1, network)
+
+        ic = self.dat.unit('initial_conditions')
+        self.assertEqual(self.dat.index(ic), 6)
+        self.assertListEqual(ic.row_data['main'].dataObjectAsList(rdt.LABEL),
+                             ['riv1', 'riv2', 'brg1', 'brg1ds', 'riv3'])
+        self.assertListEqual(ic.row_data['main'].dataObjectAsList(rdt.FLOW),
+                             [0.0, 3.0, 4.0, 4.0, 0.0])
+        self.assertEqual(self.dat.units[0].head_data['node_count'].value, 5)
+
+        # Nothing is changed if any of the units can't be added
+        riv4 = iuf.FmpUnitFactory.createUnit('river', name='riv4')
+        riv5 = iuf.FmpUnitFactory.createUnit('river', name='riv5')
+        before = list(self.dat.units)
+        with self.assertRaises(ValueError):
+            self.dat.addUnits([riv4, self.riv1])
+        with self.assertRaises(ValueError):
+            self.dat.addUnits([riv4, riv5], ics=[{rdt.FLOW: 'bad'}, {}])
+        with self.assertRaises(AttributeError):
+            self.dat.addUnits([riv4, {}])
+        self.assertListEqual(self.dat.units, before)
+        self.assertEqual(ic.row_data['main'].numberOfRows(), 5)
+        self.assertEqual(self.dat.units[0].head_data['node_count'].value, 5)
+
     def test_removeUnit(self):
         """Delete units from the collection."""
         self.dat.addUnit(self.riv1)
@@ -305,3 +341,89 @@ class IsisUnitCollectionTest(unittest.TestCase):
         self.assertEqual(links3.main_unit, riv6)
         self.assertEqual(links3.us_unit, riv5)
         self.assertEqual(links3.ds_unit, riv7)
+
+    def test_unitIndices(self):
+        """Check the unit lookups stay correct as the collection changes."""
+        self.dat.addUnit(self.riv1)
+        self.dat.addUnit(self.riv3)
+        self.dat.addUnit(self.brg1)
+        self.dat.addUnit(self.riv2, 3)
+        refh = iuf.FmpUnitFactory.createUnit('refh', name='riv2')
+        self.dat.addUnit(refh, 2)
+
+        names = [u.name for u in self.dat.units[2:-1]]
+        self.assertListEqual(names, ['riv2', 'riv1', 'riv2', 'riv3', 'brg1'])
+        self.assertEqual(self.dat.index(self.riv2), 4)
+        self.assertEqual(self.dat.index('riv2'), 2)
+        self.assertEqual(self.dat.index('riv2', 'river'), 4)
+        self.assertEqual(self.dat.index('riv9'), -1)
+        self.assertIs(self.dat.unit('riv2', 'river'), self.riv2)
+        self.assertIs(self.dat.unit('riv2', unit_category='river'), self.riv2)
+        self.assertListEqual(self.dat.unitsByType('river'),
+                             [self.riv1, self.riv2, self.riv3])
+        self.assertListEqual(self.dat.unitsByCategory(['bridge', 'river']),
+                             [self.riv1, self.riv2, self.riv3, self.brg1])
+
+        # Lots of inserts in the same place use up the gaps in the order tags
+        for i in range(40):
+            unit = iuf.FmpUnitFactory.createUnit('river', name='new%s' % i)
+            self.dat.addUnit(unit, 3)
+        self.assertEqual(self.dat.index('new0'), 42)
+        self.assertEqual(self.dat.index(self.riv1), 43)
+        self.assertEqual(self.dat.index(self.brg1), 46)
+
+        self.dat.removeUnit(self.riv1)
+        self.assertEqual(self.dat.index(self.riv1), -1)
+        self.assertEqual(self.dat.index(self.riv2), 43)
+        self.assertIs(self.dat.unit('initial_conditions'), self.dat.units[-1])
+
+        # Renamed units are found after rebuildIndices()
+        self.riv3.name = 'riv3a'
+        self.assertFalse(self.dat.unit('riv3'))
+        self.assertFalse(self.dat.unit('riv3a'))
+        self.dat.rebuildIndices()
+        self.assertIs(self.dat.unit('riv3a'), self.riv3)
+
+        # setUnit only replaces the unit with the same name and type
+        riv2 = iuf.FmpUnitFactory.createUnit('river', name='riv2')
+        self.dat.setUnit(riv2)
+        self.assertIs(self.dat.units[43], riv2)
+        self.assertIs(self.dat.units[2], refh)
+        with self.assertRaises(AttributeError):
+            self.dat.setUnit(iuf.FmpUnitFactory.createUnit('river', name='riv9'))
+
+        # Changes made directly to the units list are picked up
+        self.dat.units.insert(2, self.riv1)
+        self.assertEqual(self.dat.index(self.riv1), 2)
+        self.assertEqual(self.dat.index(riv2), 44)
+
+        # Including units replaced in place
+        riv2b = iuf.FmpUnitFactory.createUnit('river', name='riv2b')
+        self.dat.units[44] = riv2b
+        self.assertFalse(self.dat.unit('riv2', 'river'))
+        self.assertIs(self.dat.unit('riv2b'), riv2b)
+        self.dat.units[2], self.dat.units[3] = self.dat.units[3], self.dat.units[2]
+        rivers = self.dat.unitsByType('river')
+        self.assertListEqual(rivers, [u for u in self.dat.units if u.unit_type == 'river'])
+
+    def test_write(self):
+        """Streamed output is the same as writing getPrintableContents()."""
+        self.dat.addUnit(self.riv1)
+        self.dat.addUnit(self.brg1)
+        self.dat.addUnit(self.riv2)
+
+        folder = tempfile.mkdtemp()
+        try:
+            expected_path = os.path.join(folder, 'expected.dat')
+            filetools.writeFile(self.dat.getPrintableContents(), expected_path)
+            path = os.path.join(folder, 'out.dat')
+            self.dat.write(path)
+            with self.assertRaises(IOError):
+                self.dat.write(path)
+            self.dat.write(path, overwrite=True, atomic=True)
+            with open(expected_path, 'rb') as f1, open(path, 'rb') as f2:
+                self.assertEqual(f1.read(), f2.read())
+        finally:
+            for f in os.listdir(folder):
+                os.remove(os.path.join(folder, f))
+            os.rmdir(folder)
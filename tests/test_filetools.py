@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import os
+import tempfile
 import unittest
 
 from ship.utils.filetools import PathHolder
@@ -84,3 +85,117 @@ class PathHolderTests(unittest.TestCase):
         '''Check that the function returns the directory properly.
         '''
         pass
+
+
+class LineSourceTests(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = ['line %d' % i for i in range(10)]
+
+    def test_getItem(self):
+        source = filetools.LineSource(iter(self.lines))
+        self.assertEqual(source[3], 'line 3')
+        self.assertEqual(source.buffered, 4)
+        self.assertEqual(source[1:4], self.lines[1:4])
+        self.assertEqual(source[8:20], self.lines[8:])
+        with self.assertRaises(IndexError):
+            source[10]
+        self.assertTrue(source.hasLine(9))
+        self.assertFalse(source.hasLine(10))
+        self.assertEqual(len(source), 10)
+
+    def test_release(self):
+        source = filetools.LineSource(iter(self.lines))
+        source.release(5)
+        self.assertEqual(source.buffered, 0)
+        self.assertEqual(source[5], 'line 5')
+        with self.assertRaises(IndexError):
+            source[4]
+        self.assertFalse(source.hasLine(4))
+        self.assertEqual(source[6:], self.lines[6:])
+        self.assertEqual(len(source), 10)
+
+
+class MappedFileTests(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.dat')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'first\r\nsecond\n\nlast')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_getItem(self):
+        with filetools.MappedFile(self.path) as mapped:
+            self.assertEqual(mapped[0], 'first\n')
+            self.assertEqual(mapped[3], 'last')
+            self.assertEqual(mapped[1:10], ['second\n', '\n', 'last'])
+            with self.assertRaises(IndexError):
+                mapped[4]
+            self.assertTrue(mapped.hasLine(3))
+            self.assertFalse(mapped.hasLine(4))
+            self.assertEqual(len(mapped), 4)
+
+    def test_offsets(self):
+        with filetools.MappedFile(self.path) as mapped:
+            self.assertEqual(mapped.offset(1), 7)
+            self.assertEqual(mapped.offset(4), 19)
+            self.assertEqual(mapped.lineAt(0), 0)
+            self.assertEqual(mapped.lineAt(6), 0)
+            self.assertEqual(mapped.lineAt(7), 1)
+            self.assertEqual(mapped.lineAt(18), 3)
+            with self.assertRaises(IndexError):
+                mapped.lineAt(19)
+            with self.assertRaises(IndexError):
+                mapped.offset(5)
+
+    def test_lineEndings(self):
+        """Lines are split the same as getFile() for any line ending."""
+        for contents in (b'first\rsecond\r\rlast\r', b'a\r\nb\rc\n\r\nd'):
+            with open(self.path, 'wb') as f:
+                f.write(contents)
+            with filetools.MappedFile(self.path) as mapped:
+                self.assertEqual(mapped[0:100], filetools.getFile(self.path))
+                self.assertEqual(mapped.offset(len(mapped)), len(contents))
+
+
+class WriteLinesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'out.dat')
+        self.lines = ['line %d' % i for i in range(filetools.WRITE_CHUNK + 10)]
+
+    def tearDown(self):
+        for f in os.listdir(self.folder):
+            os.remove(os.path.join(self.folder, f))
+        os.rmdir(self.folder)
+
+    def readBytes(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_writeLines(self):
+        """Output is the same as writeFile()."""
+        filetools.writeFile(self.lines, self.path)
+        expected = self.readBytes(self.path)
+
+        filetools.writeLines(iter(self.lines), self.path, buffer_size=100)
+        self.assertEqual(self.readBytes(self.path), expected)
+        filetools.writeLines(self.lines, self.path, atomic=True)
+        self.assertEqual(self.readBytes(self.path), expected)
+        self.assertEqual(os.listdir(self.folder), ['out.dat'])
+
+    def test_atomicFailure(self):
+        """A failed atomic write leaves the existing file alone."""
+        filetools.writeFile(['old'], self.path)
+
+        def lines():
+            yield 'new'
+            raise ValueError('failed')
+
+        with self.assertRaises(ValueError):
+            filetools.writeLines(lines(), self.path, atomic=True)
+        self.assertEqual(self.readBytes(self.path), 'old\n'.encode())
+        self.assertEqual(os.listdir(self.folder), ['out.dat'])
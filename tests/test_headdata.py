@@ -0,0 +1,59 @@
+from __future__ import unicode_literals
+
+import copy
+import unittest
+
+from ship.fmp.headdata import HeadDataItem
+from ship.datastructures import DATA_TYPES as dt
+
+
+class HeadDataItemTests(unittest.TestCase):
+
+    def test_sharedSpec(self):
+        item1 = HeadDataItem(1.0, '{:>10}', 0, 0, dtype=dt.FLOAT, dps=3)
+        item2 = HeadDataItem(2.0, '{:>10}', 1, 2, dtype=dt.FLOAT, dps=3)
+        item3 = HeadDataItem(2.0, '{:>10}', 1, 2, dtype=dt.FLOAT, dps=2)
+        self.assertIs(item1.spec, item2.spec)
+        self.assertIsNot(item1.spec, item3.spec)
+        self.assertFalse(hasattr(item1, '__dict__'))
+
+        self.assertEqual(item1.dtype, dt.FLOAT)
+        self.assertEqual(item1.format_str, '{:>10}')
+        self.assertDictEqual(item1.kwargs, {'dtype': dt.FLOAT, 'dps': 3})
+        self.assertEqual(item2.format(), '     2.000')
+        self.assertEqual(item3.format(), '      2.00')
+
+    def test_specDefaultTypes(self):
+        item1 = HeadDataItem('', '{:>10}', 0, 0, dtype=dt.INT, default=0)
+        item2 = HeadDataItem('', '{:>10}', 0, 0, dtype=dt.INT, default=0.0)
+        self.assertIsNot(item1.spec, item2.spec)
+        self.assertEqual(item1.format(), '         0')
+        self.assertEqual(item2.format(), '       0.0')
+
+    def test_constant(self):
+        with self.assertRaises(AttributeError):
+            HeadDataItem('A', '{:>10}', 0, 0, dtype=dt.CONSTANT)
+        with self.assertRaises(ValueError):
+            HeadDataItem('A', '{:>10}', 0, 0, dtype=dt.CONSTANT, choices=['A', 'B'])
+
+        item = HeadDataItem('A', '{:<5}', 0, 0, dtype=dt.CONSTANT, choices=('A', 'B'))
+        item.value = 'B'
+        with self.assertRaises(ValueError):
+            item.value = 'C'
+        self.assertEqual(item.format(), 'B    ')
+
+    def test_copy(self):
+        item = HeadDataItem(1.0, '{:>10}', 0, 0, dtype=dt.FLOAT, dps=3)
+        item2 = copy.deepcopy(item)
+        item2.value = 4.0
+        self.assertEqual(item.value, 1.0)
+        self.assertEqual(item2.format(), '     4.000')
+
+    def test_hasChanged(self):
+        item = HeadDataItem(1.0, '{:>10}', 0, 0, dtype=dt.FLOAT, dps=3)
+        self.assertTrue(item.has_changed)
+        item.has_changed = False
+        item.value = 1.0
+        self.assertFalse(item.has_changed)
+        item.value = 2.0
+        self.assertTrue(item.has_changed)
@@ -100,6 +100,12 @@ class InitialConditionsUnitTests(unittest.TestCase):
         ic.deleteRowByName('ic2', 'river')
         self.assertEqual(ic.node_count, 2)
 
+        # The label lookup is updated in place, not rebuilt
+        ic._rebuildLabelIndex = None
+        self.assertEqual(ic._label_index, {'ic1': 0, 'ic3': 1})
+        self.assertEqual(ic.rowByName('ic3')[rdt.LABEL], 'ic3')
+        del ic._rebuildLabelIndex
+
         # Try and delete one that doesn't exist
         with self.assertRaises(KeyError):
             ic.deleteRowByName('ic2', 'river')
@@ -126,3 +132,75 @@ class InitialConditionsUnitTests(unittest.TestCase):
         row_data = ic.rowByName('ic2')
         elev = row_data[rdt.ELEVATION]
         self.assertEqual(elev, 999.9)
+
+    def test_addRows(self):
+        """Test adding a list of rows to the ic unit."""
+        ic = initialconditionsunit.InitialConditionsUnit()
+        ic.readUnitData(self.test_data, 0, node_count=3, name_types=self.name_types)
+
+        rows = [
+            {rdt.LABEL: 'ic4', rdt.STAGE: 10.0},
+            {rdt.LABEL: 'ic2', rdt.STAGE: 11.0},
+            {rdt.LABEL: 'ic5'},
+            {rdt.LABEL: 'ic4', rdt.STAGE: 12.0},
+        ]
+        node_count = ic.addRows(rows, ['river', 'junction', 'river', 'refh'])
+        self.assertEqual(node_count, 5)
+        self.assertListEqual(ic.row_data['main'].dataObjectAsList(rdt.LABEL),
+                             ['ic1', 'ic2', 'ic3', 'ic4', 'ic5'])
+        self.assertEqual(ic.rowByName('ic4')[rdt.STAGE], 10.0)
+        self.assertEqual(ic.rowByName('ic2')[rdt.STAGE], 31.022)
+        self.assertListEqual(ic._name_types['ic4'], ['river', 'refh'])
+        self.assertListEqual(ic._name_types['ic2'], ['river', 'junction'])
+
+        with self.assertRaises(AttributeError):
+            ic.addRows([{rdt.LABEL: 'ic6'}, {rdt.STAGE: 1.0}], 'river')
+        self.assertEqual(ic.node_count, 5)
+
+    def test_deleteRowsByName(self):
+        """Delete a list of rows from the ic's."""
+        ic = initialconditionsunit.InitialConditionsUnit()
+        ic.readUnitData(self.test_data, 0, node_count=3, name_types=self.name_types)
+        ic.addRow({rdt.LABEL: 'ic3'}, 'junction')
+
+        with self.assertRaises(KeyError):
+            ic.deleteRowsByName(['ic1', 'ic9'], 'river')
+        self.assertEqual(ic.node_count, 3)
+
+        # ic3 is still used by the junction so it isn't deleted
+        ic.deleteRowsByName(['ic1', 'ic3'], 'river')
+        self.assertEqual(ic.node_count, 2)
+        self.assertListEqual(ic.row_data['main'].dataObjectAsList(rdt.LABEL),
+                             ['ic2', 'ic3'])
+        self.assertEqual(ic.rowByName('ic3')[rdt.STAGE], 30.448)
+
+        # The lookup still works after the rows have moved
+        ic.updateRowByName({rdt.STAGE: 1.0}, 'ic3')
+        self.assertEqual(ic.row_data['main'].dataValue(rdt.STAGE, 1), 1.0)
+        ic.addRow({rdt.LABEL: 'ic1'}, 'river')
+        self.assertEqual(ic.rowByName('ic1')[rdt.LABEL], 'ic1')
+        self.assertEqual(ic.node_count, 3)
+
+    def test_deleteRowsByNameFails(self):
+        """A failed delete leaves the rows and the name types as they were."""
+        ic = initialconditionsunit.InitialConditionsUnit()
+        ic.readUnitData(self.test_data, 0, node_count=3, name_types=self.name_types)
+        ic.addRow({rdt.LABEL: 'ic3'}, 'junction')
+        name_types = dict((k, list(v)) for k, v in ic._name_types.items())
+
+        delete_row = ic.deleteRow
+        calls = []
+
+        def failingDeleteRow(index, **kwargs):
+            calls.append(index)
+            if len(calls) > 1:
+                raise IndexError
+            delete_row(index, **kwargs)
+        ic.deleteRow = failingDeleteRow
+
+        with self.assertRaises(IndexError):
+            ic.deleteRowsByName(['ic1', 'ic2', 'ic3'], 'river')
+        self.assertEqual(ic._name_types, name_types)
+        self.assertEqual(ic.node_count, 3)
+        self.assertListEqual(ic.row_data['main'].dataObjectAsList(rdt.LABEL),
+                             ['ic1', 'ic2', 'ic3'])
@@ -1,10 +1,11 @@
 from __future__ import unicode_literals
 
+import pickle
 import unittest
 
 from ship.fmp.datunits import riverunit
 from ship.fmp.datunits import ROW_DATA_TYPES as rdt
-from ship.datastructures.rowdatacollection import RowDataCollection
+from ship.datastructures.rowdatacollection import RowDataCollection, runLoadJobs
 from ship.datastructures import dataobject as do
 from ship.fmp.fmpunitfactory import FmpUnitFactory
 
@@ -132,6 +133,106 @@ class RiverUnitTests(unittest.TestCase):
         self.assertEqual(river.unit_category, 'river')
         self.assertEqual(river.unit_type, 'river')
 
+    def test_readRowDataChainageDecreases(self):
+        """Check that loading a section with decreasing chainage fails."""
+        bad_data = list(self.unit_data_test)
+        bad_data[8] = '     5.000' + bad_data[8][10:]
+        river = riverunit.RiverUnit()
+        with self.assertRaises(ValueError):
+            river.readUnitData(bad_data, 0)
+
+    def test_readRowDataLazy(self):
+        """Check the rows aren't read until they're used when lazy=True."""
+        river = riverunit.RiverUnit()
+        river.readUnitData(self.unit_data_test, 0, lazy=True)
+        rows = river.row_data['main']
+        self.assertFalse(rows.is_loaded)
+        self.assertEqual(rows.numberOfRows(), len(self.chainage))
+
+        # Untouched rows are written back exactly as they were read
+        data = river.getData()
+        self.assertListEqual(data[5:], self.unit_data_test[5:5 + len(self.chainage)])
+        self.assertFalse(rows.is_loaded)
+
+        self.assertListEqual(rows.dataObjectAsList(rdt.CHAINAGE), self.chainage)
+        self.assertTrue(rows.is_loaded)
+        self.assertListEqual(rows.dataObjectAsList(rdt.SPECIAL), self.special)
+
+        # Bad rows are only found when they're read
+        bad_data = list(self.unit_data_test)
+        bad_data[8] = '     5.000' + bad_data[8][10:]
+        river = riverunit.RiverUnit()
+        river.readUnitData(bad_data, 0, lazy=True)
+        with self.assertRaises(ValueError):
+            river.row_data['main'].rowAsList(0)
+        self.assertFalse(river.row_data['main'].is_loaded)
+
+    def test_hasChanged(self):
+        """Check the change status of a loaded unit."""
+        river = riverunit.RiverUnit()
+        river.readUnitData(self.unit_data_test, 0, lazy=True)
+        self.assertTrue(river.has_changed)
+        river.setChangeStatus(False)
+        self.assertFalse(river.has_changed)
+
+        # Reading the rows isn't a change
+        rows = river.row_data['main']
+        rows.dataObjectAsList(rdt.CHAINAGE)
+        self.assertFalse(river.has_changed)
+
+        rows.updateRow({rdt.ELEVATION: 99.0}, 0)
+        self.assertTrue(river.has_changed)
+        river.setChangeStatus(False)
+
+        river.head_data['distance'].value = 99.0
+        self.assertTrue(river.has_changed)
+        river.setChangeStatus(False)
+
+        river.name = 'newname'
+        self.assertTrue(river.has_changed)
+        river.setChangeStatus(False)
+
+        river.setChangeStatus(True)
+        self.assertTrue(river.has_changed)
+
+    def test_loadJob(self):
+        """Check lazy rows can be loaded from a pickled loadJob()."""
+        river = riverunit.RiverUnit()
+        river.readUnitData(self.unit_data_test, 0, lazy=True)
+        rows = river.row_data['main']
+        job = pickle.loads(pickle.dumps(rows.loadJob()))
+        rows.setLoaded(runLoadJobs([job])[0])
+        self.assertTrue(rows.is_loaded)
+        self.assertIsNone(rows.loadJob())
+        self.assertListEqual(rows.dataObjectAsList(rdt.CHAINAGE), self.chainage)
+        self.assertListEqual(rows.dataObjectAsList(rdt.BANKMARKER), self.bankmarker)
+        self.assertListEqual(river.getData()[5:], self.unit_data_test[5:5 + len(self.chainage)])
+
+        # The column_callback still checks the values
+        bad_data = list(self.unit_data_test)
+        bad_data[8] = '     5.000' + bad_data[8][10:]
+        river = riverunit.RiverUnit()
+        river.readUnitData(bad_data, 0, lazy=True)
+        rows = river.row_data['main']
+        with self.assertRaises(ValueError):
+            rows.setLoaded(runLoadJobs([rows.loadJob()])[0])
+
+    def test_renderJob(self):
+        """Check a pickled renderJob() gives the same data as the unit."""
+        for lazy in (True, False):
+            river = riverunit.RiverUnit()
+            river.readUnitData(self.unit_data_test, 0, lazy=lazy)
+            river.head_data['distance'].value = 99.0
+            job = river.renderJob()
+            rows = job.row_data['main']
+            self.assertEqual(getattr(rows, 'is_loaded', True), not lazy)
+            self.assertIsNone(rows._updateCallback)
+            self.assertIsNone(rows.dataObject(rdt.CHAINAGE).update_callback)
+
+            job = pickle.loads(pickle.dumps(job))
+            self.assertListEqual(job.getData(), river.getData())
+            self.assertIsNotNone(river.row_data['main'].dataObject(rdt.CHAINAGE).update_callback)
+
     def test_getData(self):
         '''Test to check the suitability of the getData() method.
         '''
@@ -169,6 +270,39 @@ class RiverUnitTests(unittest.TestCase):
         data = river.getData()
         self.assertEquals(out_data, data, 'getData() formatting failed')
 
+    def test_getDataRoundTrip(self):
+        """Check that writing, reading and writing again gives the same lines."""
+        ifactory = FmpUnitFactory()
+        i, river = ifactory.createUnitFromFile(self.input_contents, 0, 'RIVER', 1, 1)
+        data = river.getData()
+
+        i, river2 = ifactory.createUnitFromFile([d + '\n' for d in data], 0, 'RIVER', 1, 1)
+        self.assertListEqual(data, river2.getData())
+
+    def test_deferValidation(self):
+        """Check bulk chainage edits are validated once at the end."""
+        ifactory = FmpUnitFactory()
+        i, river = ifactory.createUnitFromFile(self.input_contents, 0, 'RIVER', 1, 1)
+        rows = river.row_data['main']
+
+        # Fails value by value because the next chainage hasn't moved yet
+        with self.assertRaises(ValueError):
+            river.updateRow({rdt.CHAINAGE: self.chainage[0] + 10}, 0)
+
+        with rows.deferValidation():
+            for i, c in enumerate(self.chainage):
+                river.updateRow({rdt.CHAINAGE: c + 10}, i)
+        self.assertEqual(rows.dataValue(rdt.CHAINAGE, 0), self.chainage[0] + 10)
+
+        # All of the bad indexes are reported and nothing is changed
+        with self.assertRaises(ValueError) as cm:
+            with rows.deferValidation():
+                river.updateRow({rdt.CHAINAGE: 1.0}, 3)
+                river.updateRow({rdt.CHAINAGE: 2.0}, 10)
+        self.assertIn('[3, 10]', str(cm.exception))
+        self.assertEqual(rows.dataValue(rdt.CHAINAGE, 3), self.chainage[3] + 10)
+        self.assertEqual(rows.dataValue(rdt.CHAINAGE, 10), self.chainage[10] + 10)
+
     def test_addDataRow(self):
         """Test adding a new row to 'main' data."""
         # Create a factory and load the river unit
@@ -103,6 +103,33 @@ class RowDataCollectionTests(unittest.TestCase):
         self.assertEquals(index2, 1)
         self.assertEquals(index3, 2)
 
+    def test_dataObjectIndex(self):
+        """Keyed lookups should stay correct as data objects are added/removed."""
+        col = rdc.RowDataCollection.bulkInitCollection([
+            do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=3),
+            do.FloatData(rdt.ROUGHNESS, format_str='{:>10}', default=0.0, no_of_dps=3),
+        ])
+        col.addToCollection(do.FloatData(rdt.ELEVATION, format_str='{:>10}', no_of_dps=3), 1)
+        self.assertEqual(col.indexOfDataObject(rdt.CHAINAGE), 0)
+        self.assertEqual(col.indexOfDataObject(rdt.ELEVATION), 1)
+        self.assertEqual(col.indexOfDataObject(rdt.ROUGHNESS), 2)
+
+        self.assertTrue(col.deleteDataObject(rdt.ELEVATION))
+        self.assertFalse(col.deleteDataObject(rdt.ELEVATION))
+        self.assertEqual(col.indexOfDataObject(rdt.ROUGHNESS), 1)
+        self.assertIsNone(col.indexOfDataObject(rdt.ELEVATION))
+        with self.assertRaises(KeyError):
+            col.dataObject(rdt.ELEVATION)
+        with self.assertRaises(KeyError):
+            col._addValue(rdt.ELEVATION, 1.0)
+
+        col._addValue(rdt.ROUGHNESS, 0.05)
+        self.assertEqual(col.dataValue(rdt.ROUGHNESS, 0), 0.05)
+
+        # Objects added directly to the list should still be found
+        col._collection.append(do.FloatData(rdt.EASTING, format_str='{:>10}', no_of_dps=2))
+        self.assertEqual(col.dataObject(rdt.EASTING).data_type, rdt.EASTING)
+
     def test_iterateRows(self):
         """Test generator for complete row as a list"""
         testrows = [
@@ -151,6 +178,19 @@ class RowDataCollectionTests(unittest.TestCase):
         obj_list = self.testcol.dataObjectAsList(rdt.CHAINAGE)
         self.assertListEqual(obj_list, test_list)
 
+        # Views don't copy but do reflect changes to the collection
+        view = self.testcol.dataObjectAsList(rdt.CHAINAGE, copy=False)
+        self.assertIsInstance(view, do.ColumnView)
+        self.assertEqual(view, test_list)
+        self.assertEqual(view[-1], 3.65)
+        self.assertListEqual(view[:1], [0.0])
+        self.assertEqual(view.index(3.65), 1)
+        self.testcol.addRow({rdt.CHAINAGE: 5.0, rdt.ELEVATION: 34.0, rdt.ROUGHNESS: 0.04})
+        self.assertEqual(len(view), 3)
+        self.assertIn(5.0, view)
+        with self.assertRaises(TypeError):
+            view[0] = 1.0
+
     def test_toList(self):
         test_list = [
             [0.00, 3.65],
@@ -159,6 +199,7 @@ class RowDataCollectionTests(unittest.TestCase):
         ]
         row_list = self.testcol.toList()
         self.assertListEqual(row_list, test_list)
+        self.assertEqual(self.testcol.toList(copy=False), test_list)
 
     def test_toDict(self):
         test_dict = {
@@ -168,6 +209,7 @@ class RowDataCollectionTests(unittest.TestCase):
         }
         row_dict = self.testcol.toDict()
         self.assertDictEqual(row_dict, test_dict)
+        self.assertDictEqual(self.testcol.toDict(copy=False), test_dict)
 
     def test_addValue(self):
         # Initiliase a real collection
@@ -196,6 +238,12 @@ class RowDataCollectionTests(unittest.TestCase):
         row = self.testcol.getPrintableRow(0)
         self.assertEqual(row, test_row)
 
+    def test_renderRows(self):
+        rows = [self.testcol.getPrintableRow(i) for i in range(2)]
+        self.assertListEqual(self.testcol.renderRows(), rows)
+        self.assertListEqual(self.testcol.renderRows(1, 2), rows[1:])
+        self.assertListEqual(self.testcol.renderRows(2), [])
+
     def test_updateRow(self):
         new_row = {rdt.CHAINAGE: 0.1, rdt.ELEVATION: 40, rdt.ROUGHNESS: 0.06}
         self.testcol.updateRow(new_row, 0)
@@ -239,8 +287,160 @@ class RowDataCollectionTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             col.addRow(fake_row)
 
+    def test_addRows(self):
+        col = rdc.RowDataCollection()
+        col.addToCollection(do.FloatData(rdt.CHAINAGE, format_str='{:>10}', default=None, no_of_dps=3))
+        col.addToCollection(do.FloatData(rdt.ELEVATION, format_str='{:>10}', default=None, no_of_dps=3))
+        col.addToCollection(do.FloatData(rdt.ROUGHNESS, format_str='{:>10}', default=0.0, no_of_dps=3))
+
+        rows = [
+            {rdt.CHAINAGE: 3.0, rdt.ELEVATION: 41, rdt.ROUGHNESS: 0.06},
+            {rdt.CHAINAGE: 6.0, rdt.ELEVATION: 42},
+        ]
+        col.addRows(rows)
+        self.assertEqual(col.numberOfRows(), 2)
+        self.assertDictEqual(col.rowAsDict(0), rows[0])
+        self.assertDictEqual(col.rowAsDict(1), {rdt.CHAINAGE: 6.0, rdt.ELEVATION: 42, rdt.ROUGHNESS: 0.0})
+
+        # No default for ELEVATION so the whole call should fail
+        with self.assertRaises(ValueError):
+            col.addRows([{rdt.CHAINAGE: 7.0}])
+        with self.assertRaises(KeyError):
+            col.addRows([{59: 4.3}])
+        self.assertEqual(col.numberOfRows(), 2)
+
+    def test_extendColumns(self):
+        self.testcol.extendColumns({
+            rdt.CHAINAGE: ['5.0', '6.5'], rdt.ELEVATION: ['34.0', '35.0'],
+            rdt.ROUGHNESS: ['0.04', '0.05'],
+        })
+        self.assertEqual(self.testcol.numberOfRows(), 4)
+        self.assertListEqual(self.testcol.rowAsList(3), [6.5, 35.0, 0.05])
+
+        # Unequal lengths
+        with self.assertRaises(ValueError):
+            self.testcol.extendColumns({rdt.CHAINAGE: [7.0], rdt.ELEVATION: [1.0, 2.0]})
+
+        # A bad value part way through should leave every column untouched
+        with self.assertRaises(ValueError):
+            self.testcol.extendColumns({
+                rdt.CHAINAGE: [7.0, 8.0], rdt.ELEVATION: [1.0, 'bad'],
+                rdt.ROUGHNESS: [0.1, 0.1],
+            })
+        self.assertEqual(self.testcol.numberOfRows(), 4)
+        self.assertListEqual(self.testcol.dataObjectAsList(rdt.CHAINAGE), [0.0, 3.65, 5.0, 6.5])
+
+    def test_extendColumnsCallback(self):
+        def checkIncreases(data_obj, start):
+            vals = data_obj.data_collection
+            bad = [i for i in range(max(start, 1), len(vals)) if vals[i] < vals[i - 1]]
+            if bad:
+                raise ValueError('Values decrease at %s' % bad)
+
+        col = rdc.RowDataCollection()
+        col.addToCollection(do.FloatData(rdt.CHAINAGE, format_str='{:>10}', default=None,
+                                         no_of_dps=3, column_callback=checkIncreases))
+        col.addToCollection(do.FloatData(rdt.ELEVATION, format_str='{:>10}', default=None, no_of_dps=3))
+        col.extendColumns({rdt.CHAINAGE: [0.0, 1.0, 2.0], rdt.ELEVATION: [5.0, 4.0, 3.0]})
+        self.assertEqual(col.numberOfRows(), 3)
+
+        with self.assertRaises(ValueError):
+            col.extendColumns({rdt.CHAINAGE: [3.0, 1.5], rdt.ELEVATION: [5.0, 4.0]})
+        self.assertEqual(col.numberOfRows(), 3)
+        self.assertListEqual(col.dataObjectAsList(rdt.ELEVATION), [5.0, 4.0, 3.0])
+
+    def test_transaction(self):
+        chainage = self.testcol.dataObjectAsList(rdt.CHAINAGE)
+        elevation = self.testcol.dataObjectAsList(rdt.ELEVATION)
+
+        with self.assertRaises(ValueError):
+            with self.testcol.transaction():
+                self.testcol.updateRow({rdt.ELEVATION: 40.0}, 0)
+                self.testcol.deleteRow(1)
+                self.testcol.addRow({rdt.CHAINAGE: 8.0, rdt.ELEVATION: 41.0, rdt.ROUGHNESS: 0.04})
+                raise ValueError
+        self.assertListEqual(self.testcol.dataObjectAsList(rdt.CHAINAGE), chainage)
+        self.assertListEqual(self.testcol.dataObjectAsList(rdt.ELEVATION), elevation)
+        self.assertIsNone(self.testcol._journal)
+
+        # Failing inner transaction only undoes its own changes
+        with self.testcol.transaction():
+            self.testcol.updateRow({rdt.ELEVATION: 40.0}, 0)
+            try:
+                with self.testcol.transaction():
+                    self.testcol.updateRow({rdt.ELEVATION: 50.0}, 1)
+                    self.testcol.updateRow({rdt.ELEVATION: 'bad'}, 1)
+            except ValueError:
+                pass
+        self.assertListEqual(self.testcol.dataObjectAsList(rdt.ELEVATION), [40.0, 33.45])
+
+    def test_addRowFailureRollback(self):
+        col = rdc.RowDataCollection()
+        col.addToCollection(do.FloatData(rdt.CHAINAGE, format_str='{:>10}', default=None, no_of_dps=3))
+        col.addToCollection(do.FloatData(rdt.ELEVATION, format_str='{:>10}', default=None, no_of_dps=3))
+        col.addRow({rdt.CHAINAGE: 1.0, rdt.ELEVATION: 2.0})
+
+        with self.assertRaises(ValueError):
+            col.addRow({rdt.CHAINAGE: 3.0, rdt.ELEVATION: 'bad'}, 0)
+        self.assertEqual(col.numberOfRows(), 1)
+        self.assertListEqual(col.dataObjectAsList(rdt.CHAINAGE), [1.0])
+
+    def test_addRowWithDummy(self):
+        col = rdc.RowDataCollection()
+        col.addToCollection(do.FloatData(rdt.CHAINAGE, format_str='{:>10}', default=None, no_of_dps=3))
+        col.addToCollection(do.FloatData(rdt.ELEVATION, format_str='{:>10}', default=None, no_of_dps=3))
+        col.setDummyRow({rdt.CHAINAGE: 0.0, rdt.ELEVATION: 0.0})
+        self.assertEqual(col.numberOfRows(), 0)
+
+        col.addRow({rdt.CHAINAGE: 5.0, rdt.ELEVATION: 6.0}, 0)
+        self.assertFalse(col.has_dummy)
+        self.assertEqual(col.numberOfRows(), 1)
+        self.assertListEqual(col.rowAsList(0), [5.0, 6.0])
+
+        # A failed transaction should put the dummy row back
+        col = rdc.RowDataCollection()
+        col.addToCollection(do.FloatData(rdt.CHAINAGE, format_str='{:>10}', default=None, no_of_dps=3))
+        col.setDummyRow({rdt.CHAINAGE: 0.0})
+        with self.assertRaises(RuntimeError):
+            with col.transaction():
+                col.addRow({rdt.CHAINAGE: 5.0})
+                raise RuntimeError
+        self.assertTrue(col.has_dummy)
+        self.assertListEqual(col.dataObjectAsList(rdt.CHAINAGE), [0.0])
+
     def test_numberOfRows(self):
         self.assertEqual(self.testcol.numberOfRows(), 2)
+        self.assertEqual(rdc.RowDataCollection().numberOfRows(), 0)
+
+        # Only checked in debug mode
+        self.obj2.data_collection.append(34.0)
+        self.assertEqual(self.testcol.numberOfRows(), 2)
+        self.testcol.debug_sync_check = True
+        with self.assertRaises(RuntimeError):
+            self.testcol.numberOfRows()
+
+    def test_transactionSyncCheck(self):
+        with self.assertRaises(RuntimeError):
+            with self.testcol.transaction():
+                self.testcol._addValue(rdt.CHAINAGE, 5.0)
+        self.assertEqual(len(self.obj1), 2)
+        self.assertTrue(self.testcol.checkRowsInSync())
+
+    def test_indicesWhere(self):
+        col = rdc.RowDataCollection()
+        col.addToCollection(do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=3))
+        col.addToCollection(do.ConstantData(rdt.BANKMARKER, ('', 'LEFT', 'RIGHT', 'BED'), '{:<10}', default=''))
+        col.addToCollection(do.StringData(rdt.SPECIAL, format_str='{:<10}', default='~'))
+        col.addRows([
+            {rdt.CHAINAGE: 0.0, rdt.BANKMARKER: 'LEFT', rdt.SPECIAL: 'x'},
+            {rdt.CHAINAGE: 1.0},
+            {rdt.CHAINAGE: 2.0, rdt.BANKMARKER: 'BED', rdt.SPECIAL: 'x'},
+            {rdt.CHAINAGE: 3.0, rdt.BANKMARKER: 'BED'},
+        ])
+        self.assertListEqual(col.indicesWhere(rdt.BANKMARKER, 'BED'), [2, 3])
+        self.assertListEqual(col.indicesWhere(rdt.BANKMARKER, 'RIGHT'), [])
+        self.assertListEqual(col.indicesWhere(rdt.SPECIAL, 'x'), [0, 2])
+        self.assertListEqual(col.indicesWhere(rdt.CHAINAGE, 1.0), [1])
 
     def test_deleteRow(self):
 
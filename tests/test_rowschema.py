@@ -0,0 +1,61 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from ship.datastructures import rowdatacollection as rdc
+from ship.datastructures import rowschema as rs
+from ship.datastructures import dataobject as do
+from ship.fmp.datunits import ROW_DATA_TYPES as rdt
+
+
+class RowSchemaTests(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = rdc.RowDataCollection.bulkInitCollection([
+            do.FloatData(rdt.CHAINAGE, format_str='{:>10}', no_of_dps=3),
+            do.ConstantData(rdt.BANKMARKER, ('', 'LEFT', 'RIGHT'), format_str='{:<5}', default=''),
+            do.FloatData(rdt.EASTING, format_str='{:>10}', default=0.0, no_of_dps=2),
+        ])
+        self.rows = [
+            '     0.000LEFT  291000.00\n',
+            '     1.500          \n',
+            '     3.000RIGHT 291001.50\n',
+        ]
+
+    def test_fromCollection(self):
+        schema = rs.RowSchema.fromCollection(self.collection)
+        self.assertEqual(schema.columns, (
+            (rdt.CHAINAGE, 0, 10), (rdt.BANKMARKER, 10, 15), (rdt.EASTING, 15, 25),
+        ))
+
+        # Written rows are read back from the same columns
+        schema = rs.RowSchema.fromCollection(self.collection, {rdt.EASTING: None})
+        schema.read(self.collection, self.rows)
+        self.assertEqual(
+            self.collection.renderRows(),
+            ['     0.000LEFT  291000.00', '     1.500           0.00', '     3.000RIGHT 291001.50']
+        )
+
+    def test_read(self):
+        schema = rs.RowSchema([(rdt.CHAINAGE, 0, 10), (rdt.EASTING, 15, 25)], {rdt.EASTING: None})
+        self.assertEqual(schema.split(self.rows)[rdt.CHAINAGE], ('     0.000', '     1.500', '     3.000'))
+        schema.read(self.collection, self.rows)
+        self.assertEqual(self.collection.dataObjectAsList(rdt.CHAINAGE), [0.0, 1.5, 3.0])
+        self.assertEqual(self.collection.dataObjectAsList(rdt.BANKMARKER), ['', '', ''])
+        self.assertEqual(self.collection.dataObjectAsList(rdt.EASTING), [291000.0, 0.0, 291001.5])
+
+        # Nothing is added if a value is invalid
+        with self.assertRaises(ValueError):
+            schema.read(self.collection, ['     4.500     291002.00', '      oops'])
+        self.assertEqual(self.collection.numberOfRows(), 3)
+
+    def test_collectionSchema(self):
+        schema = rs.collectionSchema('test.rowschema', self.collection)
+        self.assertIs(rs.collectionSchema('test.rowschema', self.collection), schema)
+
+        other = rdc.RowDataCollection.bulkInitCollection([
+            do.FloatData(rdt.CHAINAGE, format_str='{:>12}', no_of_dps=3),
+        ])
+        other_schema = rs.collectionSchema('test.rowschema', other)
+        self.assertEqual(other_schema.columns, ((rdt.CHAINAGE, 0, 12),))
+        self.assertIs(rs.collectionSchema('test.rowschema', self.collection), schema)
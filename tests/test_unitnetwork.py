@@ -0,0 +1,86 @@
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from ship.fmp.datcollection import DatCollection
+from ship.fmp.unitnetwork import UnitNetwork
+from ship.fmp import fmpunitfactory as iuf
+
+
+class UnitNetworkTests(unittest.TestCase):
+
+    def setUp(self):
+        prefix = '/'
+        if os.name != 'posix':
+            prefix = 'c:' + os.sep
+        self.dat = DatCollection.initialisedDat(os.path.join(prefix, 'fake', 'datfile.dat'))
+
+        self.riv1 = iuf.FmpUnitFactory.createUnit('river', name='riv1')
+        self.riv2 = iuf.FmpUnitFactory.createUnit('river', name='riv2')
+        self.riv2.head_data['spill1'].value = 'spill1_us'
+        self.spill1 = iuf.FmpUnitFactory.createUnit('spill', name='spill1_us',
+                                                    name_ds='spill1_ds')
+        self.riv3 = iuf.FmpUnitFactory.createUnit('river', name='riv3')
+        self.junc1 = iuf.FmpUnitFactory.createUnit('junction', name='riv3')
+        self.junc1.head_data['names'].append('spill1_ds')
+        self.riv4 = iuf.FmpUnitFactory.createUnit('river', name='riv4')
+        self.riv4.head_data['lateral1'].value = 'missing'
+
+        for u in [self.riv1, self.riv2, self.spill1, self.riv3, self.junc1, self.riv4]:
+            self.dat.addUnit(u)
+
+    def test_neighbours(self):
+        network = self.dat.network()
+        self.assertIsInstance(network, UnitNetwork)
+        self.assertListEqual(network.neighbours(self.riv2, [UnitNetwork.NAMED]),
+                             [self.spill1])
+        self.assertListEqual(network.neighbours(self.spill1, UnitNetwork.LABEL_EDGES),
+                             [self.riv2, self.junc1])
+        self.assertListEqual(network.neighbours(self.junc1, [UnitNetwork.JUNCTION]),
+                             [self.spill1, self.riv3])
+        self.assertListEqual(network.neighbours(self.riv3),
+                             [self.spill1, self.junc1])
+        self.assertListEqual(network.references('spill1_us'), [self.riv2, self.spill1])
+        self.assertListEqual(network.labelUnits('spill1_ds'), [self.spill1])
+
+    def test_reachable(self):
+        network = self.dat.network()
+        self.assertListEqual(network.reachable(self.riv2),
+                             [self.riv2, self.spill1, self.riv3, self.junc1])
+        self.assertListEqual(network.reachable(self.riv1), [self.riv1])
+
+        groups = network.components()
+        self.assertIn([self.riv1], groups)
+        self.assertIn([self.riv2, self.spill1, self.riv3, self.junc1], groups)
+        self.assertIn([self.riv4], groups)
+        self.assertEqual(sum(len(g) for g in groups), len(self.dat.units))
+
+    def test_danglingLabels(self):
+        network = self.dat.network()
+        self.assertDictEqual(network.danglingLabels(), {'missing': [self.riv4]})
+
+        self.dat.removeUnit(self.spill1)
+        dangling = network.danglingLabels()
+        self.assertListEqual(dangling['spill1_us'], [self.riv2])
+        self.assertListEqual(dangling['spill1_ds'], [self.junc1])
+
+    def test_updates(self):
+        """The network is kept up to date by the collection."""
+        network = self.dat.network()
+        spill2 = iuf.FmpUnitFactory.createUnit('spill', name='missing')
+        self.dat.addUnit(spill2, 4)
+        self.assertListEqual(network.neighbours(self.riv4, [UnitNetwork.NAMED]), [spill2])
+        self.assertListEqual(network.neighbours(
+            self.riv2, [UnitNetwork.UPSTREAM, UnitNetwork.DOWNSTREAM]),
+            [self.riv1, spill2]
+        )
+
+        riv4 = iuf.FmpUnitFactory.createUnit('river', name='riv4')
+        self.dat.setUnit(riv4)
+        self.assertNotIn(self.riv4, network)
+        self.assertListEqual(network.neighbours(spill2, [UnitNetwork.NAMED]), [])
+
+        self.riv1.head_data['spill1'].value = 'missing'
+        network.updateUnit(self.riv1)
+        self.assertListEqual(network.neighbours(spill2, [UnitNetwork.NAMED]), [self.riv1])